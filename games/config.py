@@ -3,13 +3,170 @@ PAGINATION_SIZE = 25
 SEARCH_FIELDS = [
     ("app_id", "App ID"),
     ("name", "Nombre"),
-    ("release_date", "Fecha de lanzamiento"),
+    ("rel_date", "Fecha de lanzamiento"),
     ("estimated_owners", "Dueños estimados"),
-    ("peak_ccu", "Peak CCU"),
-    ("required_age", "Edad requerida"),
+    ("req_age", "Edad requerida"),
     ("price", "Precio"),
+    ("dlc_count", "Cantidad de DLCs"),
+    ("name_fuzzy", "Nombre (búsqueda aproximada)"),
+    ("description", "Descripción (texto completo)"),
+    ("advanced", "Búsqueda combinada (campo:valor ...)"),
 ]
 
+FUZZY_SEARCH_CONFIG = {
+    "index_name": "idx_games_name_gin_trgm",
+    "min_similarity": 0.3,
+    "limit": 50,
+}
+
+# La columna about_game.search_vector se genera con la misma configuración de texto
+FULLTEXT_SEARCH_CONFIG = {
+    "index_name": "idx_about_game_search_vector_gin",
+    "language": "english",
+    "limit": 50,
+    "snippet_options": "MaxWords=35, MinWords=15, MaxFragments=2",
+}
+
+AUTOCOMPLETE_CONFIG = {
+    "index_name": "idx_games_name_lower_pattern",
+    "limit": 10,
+    "max_limit": 50,
+    "cache_size": 2000,
+    "cache_ttl": 300,
+}
+
+# Rangos de precio: (clave, etiqueta, mínimo exclusivo, máximo inclusivo)
+# El primero agrupa los juegos gratuitos y el último no tiene máximo
+FACET_CONFIG = {
+    "value_limit": 30,
+    "cache_ttl": 600,
+    "price_buckets": [
+        ("free", "Gratis", None, 0),
+        ("0-5", "Hasta $5", 0, 5),
+        ("5-10", "$5 a $10", 5, 10),
+        ("10-20", "$10 a $20", 10, 20),
+        ("20-40", "$20 a $40", 20, 40),
+        ("40+", "Más de $40", 40, None),
+    ],
+}
+
+# Por encima del umbral se usa la estimación del planificador en lugar de COUNT(*)
+COUNT_STRATEGY_CONFIG = {
+    "exact_threshold": 10000,
+    "cache_ttl": 60,
+}
+
+# El backend LRU es local a cada proceso; la generación de cada juego vive en
+# la caché de Django generation_cache, que con varios procesos debe ser
+# compartida (CACHE_BACKEND=Redis o Memcached) para que una escritura
+# confirmada invalide la caché de todos
+GAME_CACHE_CONFIG = {
+    "enabled": True,
+    "backend": "games.services.game_cache_service.LRUCacheBackend",
+    "options": {"max_entries": 5000, "ttl": 300},
+    "generation_cache": "default",
+}
+
+# Desgloses por dimensión: la clave de caché incluye la versión de datos,
+# el TTL acota el tiempo de vida de cada combinación de filtros
+BREAKDOWN_CONFIG = {
+    "cache_ttl": 600,
+    "default_top_n": 20,
+    "max_top_n": 200,
+    "default_min_support": 1,
+}
+
+# Snapshot columnar del catálogo para análisis con NumPy (dependencia opcional);
+# se recarga cuando cambia la versión de datos de sus tablas
+SNAPSHOT_CONFIG = {
+    "max_memory_mb": 256,
+    "dtype": "float64",
+    "histogram_bins": 20,
+    "quantiles": [0.1, 0.25, 0.5, 0.75, 0.9, 0.99],
+}
+
+# Benchmark de índices: con scratch se mide sobre copias temporales de las
+# tablas; los índices candidatos se revierten siempre al terminar
+BENCHMARK_CONFIG = {
+    "scratch": True,
+    "warmup": 2,
+    "repetitions": 10,
+    "statement_timeout_ms": 30000,
+}
+
+# Experimentos de índices (comando index_experiments); rutas relativas a BASE_DIR
+INDEX_EXPERIMENT_CONFIG = {
+    "scenarios_file": "reports/index_scenarios.json",
+    "output_dir": "reports/generated",
+    "repetitions": 10,
+}
+
+# Línea base de planes (comando check_query_plans): umbrales de regresión y
+# valores de ejemplo con los que se arman las consultas registradas
+PLAN_REGRESSION_CONFIG = {
+    "repetitions": 5,
+    "runtime_factor": 1.5,
+    "min_runtime_delta_ms": 5,
+    "buffers_factor": 2.0,
+    "row_error_factor": 10,
+    "history_limit": 50,
+    "sample_name": "counter",
+    "sample_filters": {
+        "genre_filter": "Action",
+        "platform_filter": "windows",
+        "price_filter": "10-20",
+    },
+    "sample_app_id": None,
+}
+
+# Asesor de índices: capture_queries activa QueryWorkloadMiddleware (registra
+# las sentencias de la app cuando no está pg_stat_statements)
+INDEX_ADVISOR_CONFIG = {
+    "capture_queries": False,
+    "workload_limit": 200,
+    "recommendation_limit": 10,
+    "size_weight_mb": 100,
+}
+
+# Detección de índices sin uso o redundantes a partir del historial de uso
+INDEX_USAGE_CONFIG = {
+    "min_observation_days": 7,
+    "min_size_bytes": 1024 * 1024,
+    "min_scans_per_mb": 10,
+    "history_limit": 100,
+}
+
+BATCH_LOOKUP_CONFIG = {
+    "max_ids": 1000,
+}
+
+EXPORT_CONFIG = {
+    "chunk_size": 2000,
+    "gzip_level": 6,
+    "formats": {
+        "csv": ("text/csv", "csv"),
+        "jsonl": ("application/x-ndjson", "jsonl"),
+    },
+}
+
+# Alta y edición por lotes (TransactionService.create/update_complete_games)
+BATCH_WRITE_CONFIG = {
+    "max_items": 10000,
+    "batch_size": 1000,
+}
+
+# Carga masiva con COPY: un archivo <tabla>.csv o <tabla>.jsonl por tabla
+IMPORT_CONFIG = {
+    "workers": 4,
+    "extensions": (".csv", ".jsonl"),
+    "staging_prefix": "staging_",
+}
+
+# Sincronización incremental: juegos comparados y escritos por transacción
+SYNC_CONFIG = {
+    "batch_size": 1000,
+}
+
 BACKUP_CONFIG = {
     "default_filename": "steamdb_backup.sql",
     "temp_restore_filename": "restore_temp.sql",
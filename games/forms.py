@@ -97,6 +97,7 @@ class GameSearchForm(forms.Form):
     SEARCH_FIELDS = [
         ("app_id", "ID de la Aplicación"),
         ("name", "Nombre"),
+        ("name_fuzzy", "Nombre (búsqueda aproximada)"),
     ]
 
     search_field = forms.ChoiceField(
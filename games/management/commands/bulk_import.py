@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from games.config import IMPORT_CONFIG
+from games.services.admin import BulkImportService
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa el dataset completo (CSV o JSON Lines, un archivo por tabla) "
+        "con COPY a través de tablas de staging"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "source", help="Directorio con los archivos <tabla>.csv o <tabla>.jsonl"
+        )
+        parser.add_argument(
+            "--tables", nargs="+", help="Tablas a importar (por defecto, todas)"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=IMPORT_CONFIG["workers"],
+            help="Procesos paralelos para las tablas hijas",
+        )
+        parser.add_argument(
+            "--truncate",
+            action="store_true",
+            help="Vacía las tablas destino antes de importar",
+        )
+        parser.add_argument(
+            "--keep-indexes",
+            action="store_true",
+            help="No elimina ni reconstruye los índices secundarios",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'Tabla':<20}{'Filas':>12}{'Segundos':>10}{'Filas/s':>12}")
+
+        def progress(result):
+            self.stdout.write(
+                f"{result['table']:<20}{result['rows']:>12}"
+                f"{result['seconds']:>10}{result['rows_per_second']:>12}"
+            )
+
+        try:
+            results = BulkImportService.run_import(
+                options["source"],
+                tables=options["tables"],
+                workers=options["workers"],
+                truncate=options["truncate"],
+                rebuild_indexes=not options["keep_indexes"],
+                progress=progress,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        total_rows = sum(result["rows"] for result in results)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Importación completada: {total_rows} filas en {len(results)} tablas"
+            )
+        )
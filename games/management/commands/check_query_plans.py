@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from games.services.admin import PlanRegistryService
+
+
+class Command(BaseCommand):
+    help = (
+        "Captura los planes y tiempos de las consultas registradas, los compara "
+        "con la línea base guardada y termina con error si hay regresiones"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--only",
+            nargs="+",
+            metavar="CONSULTA",
+            help="Captura solo las consultas indicadas",
+        )
+        parser.add_argument(
+            "--set-baseline",
+            action="store_true",
+            help="Guarda la captura como nueva línea base en lugar de comparar",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            results = PlanRegistryService.capture(
+                options["only"], set_baseline=options["set_baseline"]
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        regressed = 0
+        for result in results:
+            header = f"{result['name']}: {result['median_ms']} ms, {', '.join(result['scans'])}"
+            if result["is_baseline"]:
+                self.stdout.write(self.style.SUCCESS(f"{header} (línea base)"))
+            elif result["regressions"]:
+                regressed += 1
+                self.stdout.write(self.style.ERROR(header))
+                for regression in result["regressions"]:
+                    self.stdout.write(self.style.ERROR(f"  - {regression}"))
+            else:
+                self.stdout.write(f"{header} (sin cambios)")
+
+        if regressed:
+            raise CommandError(f"{regressed} consultas con regresiones de plan")
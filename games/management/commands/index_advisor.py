@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from games.services.admin import IndexAdvisorService
+
+
+class Command(BaseCommand):
+    help = (
+        "Propone índices a partir de las consultas ejecutadas (pg_stat_statements "
+        "o el registro de la aplicación) y opcionalmente aplica los mejores"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source",
+            choices=["pg_stat_statements", "app"],
+            help="Fuente de consultas (por defecto pg_stat_statements si está instalado)",
+        )
+        parser.add_argument(
+            "--limit", type=int, help="Cantidad máxima de recomendaciones"
+        )
+        parser.add_argument(
+            "--apply",
+            type=int,
+            default=0,
+            metavar="N",
+            help="Crea los N índices con mejor puntaje",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Vacía el registro de consultas de la aplicación y termina",
+        )
+
+    def handle(self, *args, **options):
+        if options["reset"]:
+            deleted = IndexAdvisorService.reset_workload()
+            self.stdout.write(f"{deleted} sentencias eliminadas del registro")
+            return
+
+        try:
+            result = IndexAdvisorService.recommend(options["source"], options["limit"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(
+            f"{result['statements']} sentencias analizadas ({result['source']})"
+        )
+        for position, item in enumerate(result["recommendations"], start=1):
+            usages = ", ".join(
+                f"{usage} x{count}" for usage, count in item["usages"].items()
+            )
+            self.stdout.write(
+                f"{position}. {item['table']}.{item['column']} {item['index_type']}: "
+                f"puntaje {item['score']}, ahorro {item['benefit_ms']} ms, "
+                f"{item['estimated_size_bytes']} bytes, escrituras {item['write_ratio']} "
+                f"({usages})"
+            )
+
+        for item in result["recommendations"][: options["apply"]]:
+            outcome = IndexAdvisorService.apply(
+                item["table"], item["column"], item["index_type"]
+            )
+            style = self.style.SUCCESS if outcome["success"] else self.style.ERROR
+            self.stdout.write(style(outcome["message"]))
@@ -0,0 +1,92 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from games.config import INDEX_EXPERIMENT_CONFIG
+from games.services.analytics import IndexExperimentService
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide escenarios de consulta sin índice y con cada estrategia de índice "
+        "(sobre copias temporales de las tablas) y escribe informes Markdown y JSON"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "scenarios",
+            nargs="?",
+            default=INDEX_EXPERIMENT_CONFIG["scenarios_file"],
+            help="Archivo JSON con la lista de escenarios",
+        )
+        parser.add_argument(
+            "--output-dir",
+            default=INDEX_EXPERIMENT_CONFIG["output_dir"],
+            help="Directorio donde se escriben los informes",
+        )
+        parser.add_argument(
+            "--only",
+            nargs="+",
+            metavar="NOMBRE",
+            help="Ejecuta solo los escenarios indicados",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Sobrescribe informes existentes en el directorio de salida",
+        )
+        parser.add_argument(
+            "--repetitions",
+            type=int,
+            default=INDEX_EXPERIMENT_CONFIG["repetitions"],
+            help="Ejecuciones medidas por variante",
+        )
+
+    def handle(self, *args, **options):
+        path = os.path.join(settings.BASE_DIR, options["scenarios"])
+        output_dir = os.path.join(settings.BASE_DIR, options["output_dir"])
+        try:
+            scenarios = IndexExperimentService.load_scenarios(path)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"No se pudieron leer los escenarios: {e}")
+
+        if options["only"]:
+            unknown = set(options["only"]) - {
+                scenario["name"] for scenario in scenarios
+            }
+            if unknown:
+                raise CommandError(
+                    f"Escenarios desconocidos: {', '.join(sorted(unknown))}"
+                )
+            scenarios = [
+                scenario
+                for scenario in scenarios
+                if scenario["name"] in options["only"]
+            ]
+
+        for scenario in scenarios:
+            self.stdout.write(f"Escenario {scenario['name']}...")
+            report = IndexExperimentService.run_scenario(
+                scenario, options["repetitions"]
+            )
+            for variant in report["variants"]:
+                if "error" in variant:
+                    self.stdout.write(
+                        self.style.WARNING(f"  {variant['label']}: {variant['error']}")
+                    )
+                else:
+                    self.stdout.write(
+                        f"  {variant['label']}: mediana "
+                        f"{variant['timings']['median_ms']} ms, "
+                        f"{', '.join(variant['plan']['node_types'])}"
+                    )
+            try:
+                paths = IndexExperimentService.write_report(
+                    report, output_dir, force=options["force"]
+                )
+            except ValueError as e:
+                raise CommandError(str(e))
+            self.stdout.write(
+                self.style.SUCCESS(f"  {paths['markdown']} y {paths['json']}")
+            )
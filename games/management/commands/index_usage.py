@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.template.defaultfilters import filesizeformat
+
+from games.services.admin import IndexService
+
+
+class Command(BaseCommand):
+    help = (
+        "Registra el uso de los índices y muestra el plan de eliminación de "
+        "índices sin uso, duplicados o redundantes (programarlo periódicamente)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--snapshot",
+            action="store_true",
+            help="Guarda una captura de pg_stat_user_indexes antes de analizar",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Elimina todos los índices del plan en una transacción",
+        )
+
+    def handle(self, *args, **options):
+        if options["snapshot"]:
+            captured = IndexService.snapshot_index_usage()
+            self.stdout.write(f"Uso registrado para {captured} índices")
+
+        plan = IndexService.get_drop_plan()
+        if plan["insufficient_history"]:
+            self.stdout.write(
+                "Sin historial suficiente: " + ", ".join(plan["insufficient_history"])
+            )
+
+        for item in plan["candidates"]:
+            self.stdout.write(
+                f"{item['statement']};  -- {item['reason']}, "
+                f"{filesizeformat(item['size_bytes'])}"
+            )
+        self.stdout.write(
+            f"{len(plan['candidates'])} índices, espacio recuperable: "
+            f"{filesizeformat(plan['reclaimed_bytes'])}"
+        )
+
+        if options["drop"] and plan["candidates"]:
+            result = IndexService.drop_indexes(
+                [item["name"] for item in plan["candidates"]]
+            )
+            if not result["success"]:
+                raise CommandError(result["message"])
+            self.stdout.write(self.style.SUCCESS(result["message"]))
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from games.services.analytics import CounterService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula los contadores agregados por dimensión y por género, "
+        "informa las diferencias con los valores guardados y los reemplaza"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Solo informa las diferencias, sin modificar los contadores",
+        )
+
+    def handle(self, *args, **options):
+        result = CounterService.reconcile(fix=not options["dry_run"])
+
+        if not result["dimension_drift"] and not result["genre_stats_drift"]:
+            self.stdout.write(self.style.SUCCESS("Sin diferencias en los contadores"))
+            return
+
+        for drift in result["dimension_drift"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{drift['dimension']}: {drift['groups']} grupos con diferencias "
+                    f"(desvío total {drift['total_drift']})"
+                )
+            )
+        for drift in result["genre_stats_drift"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"genre_stats {drift['genre']}: guardado {drift['stored']}, "
+                    f"esperado {drift['expected']}"
+                )
+            )
+
+        if result["fixed"]:
+            self.stdout.write(self.style.SUCCESS("Contadores reconstruidos"))
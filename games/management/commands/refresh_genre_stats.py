@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from games.services.analytics import GenreAnalyticsService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula la vista materializada de estadísticas de géneros "
+        "(pensado para ejecutarse periódicamente, por ejemplo con cron)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--blocking",
+            action="store_true",
+            help="Usa REFRESH sin CONCURRENTLY (bloquea lecturas, pero es más rápido)",
+        )
+
+    def handle(self, *args, **options):
+        result = GenreAnalyticsService.refresh_genre_statistics(
+            concurrently=not options["blocking"]
+        )
+        if not result["success"]:
+            raise CommandError(result["message"])
+        self.stdout.write(self.style.SUCCESS(result["message"]))
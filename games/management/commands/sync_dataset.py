@@ -0,0 +1,49 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from games.config import SYNC_CONFIG
+from games.services import SyncService
+
+
+class Command(BaseCommand):
+    help = (
+        "Sincroniza un volcado nuevo del dataset escribiendo solo los juegos "
+        "cuyo contenido cambió"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "source", help="Directorio con los archivos <tabla>.csv o <tabla>.jsonl"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=SYNC_CONFIG["batch_size"],
+            help="Juegos comparados y escritos por transacción",
+        )
+
+    def handle(self, *args, **options):
+        def progress(stats):
+            self.stdout.write(
+                f"Procesados {stats['scanned']} juegos "
+                f"({stats['unchanged']} sin cambios)"
+            )
+
+        try:
+            stats = SyncService.sync(
+                options["source"], batch_size=options["batch_size"], progress=progress
+            )
+        except (ValueError, ValidationError) as e:
+            raise CommandError(str(e))
+
+        for error in stats["errors"]:
+            self.stderr.write(f"Juego {error['app_id']} omitido: {error['message']}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Sincronización completada: {stats['inserted']} juegos nuevos, "
+                f"{stats['updated']} actualizados, {stats['unchanged']} sin cambios; "
+                f"filas hijas +{stats['children_added']} / "
+                f"-{stats['children_removed']}; {len(stats['errors'])} omitidos"
+            )
+        )
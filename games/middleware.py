@@ -0,0 +1,61 @@
+import re
+import time
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+from games.config import INDEX_ADVISOR_CONFIG
+
+
+class QueryWorkloadMiddleware:
+    """Registra las sentencias de cada request para el asesor de índices"""
+
+    # Tablas internas de Django, catálogos y la propia tabla de registro
+    IGNORED = re.compile(
+        r"\b(django_\w+|auth_\w+|query_workload|pg_\w+|information_schema)\b",
+        re.IGNORECASE,
+    )
+
+    def __init__(self, get_response):
+        if not INDEX_ADVISOR_CONFIG["capture_queries"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        entries = {}
+        with connection.execute_wrapper(self._collector(entries)):
+            response = self.get_response(request)
+
+        if entries:
+            from games.services.admin.index_advisor_service import IndexAdvisorService
+
+            try:
+                IndexAdvisorService.record(entries)
+            except Exception:
+                # El registro nunca debe romper la respuesta
+                pass
+        return response
+
+    def _collector(self, entries):
+        def wrapper(execute, sql, params, many, context):
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                if not self.IGNORED.search(sql) and re.match(
+                    r"\s*(select|update|delete)\b", sql, re.IGNORECASE
+                ):
+                    self._add(entries, sql, (time.perf_counter() - start) * 1000)
+
+        return wrapper
+
+    @staticmethod
+    def _add(entries, sql: str, elapsed_ms: float) -> None:
+        from games.services.admin.index_advisor_service import IndexAdvisorService
+
+        statement = IndexAdvisorService.normalize(sql)
+        fingerprint = IndexAdvisorService.fingerprint(statement)
+        entry = entries.setdefault(
+            fingerprint, {"statement": statement, "calls": 0, "total_ms": 0.0}
+        )
+        entry["calls"] += 1
+        entry["total_ms"] += elapsed_ms
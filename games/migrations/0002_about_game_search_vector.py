@@ -0,0 +1,32 @@
+from django.db import migrations
+
+
+# La configuración de texto debe coincidir con FULLTEXT_SEARCH_CONFIG["language"]
+SEARCH_VECTOR_SQL = """
+    ALTER TABLE steam.about_game
+    ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(short_description, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(about_the_game, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(detailed_description, '')), 'C')
+    ) STORED;
+
+    CREATE INDEX IF NOT EXISTS idx_about_game_search_vector_gin
+    ON steam.about_game USING GIN (search_vector);
+"""
+
+DROP_SEARCH_VECTOR_SQL = """
+    DROP INDEX IF EXISTS steam.idx_about_game_search_vector_gin;
+    ALTER TABLE steam.about_game DROP COLUMN IF EXISTS search_vector;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(SEARCH_VECTOR_SQL, reverse_sql=DROP_SEARCH_VECTOR_SQL),
+    ]
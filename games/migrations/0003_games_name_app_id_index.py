@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0002_about_game_search_vector"),
+    ]
+
+    operations = [
+        # Índice compuesto para la paginación por cursor del listado de juegos
+        migrations.RunSQL(
+            """
+            CREATE INDEX IF NOT EXISTS idx_games_name_app_id_btree
+            ON steam.games USING BTREE (name, app_id);
+            """,
+            reverse_sql="DROP INDEX IF EXISTS steam.idx_games_name_app_id_btree;",
+        ),
+    ]
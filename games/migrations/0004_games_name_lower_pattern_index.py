@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0003_games_name_app_id_index"),
+    ]
+
+    operations = [
+        # Búsquedas por prefijo sobre lower(name) (autocompletado y "prefijo*")
+        migrations.RunSQL(
+            """
+            CREATE INDEX IF NOT EXISTS idx_games_name_lower_pattern
+            ON steam.games USING BTREE (lower(name) text_pattern_ops);
+            """,
+            reverse_sql="DROP INDEX IF EXISTS steam.idx_games_name_lower_pattern;",
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0004_games_name_lower_pattern_index"),
+    ]
+
+    operations = [
+        # Hash de contenido por juego para la sincronización incremental
+        migrations.CreateModel(
+            name="GameSyncState",
+            fields=[
+                ("app_id", models.TextField(primary_key=True, serialize=False)),
+                ("content_hash", models.CharField(max_length=64)),
+                ("synced_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": 'steam"."game_sync_state',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0005_game_sync_state"),
+    ]
+
+    operations = [
+        # Versión para bloqueo optimista; el valor por defecto queda en la base
+        # para que las cargas con COPY no necesiten la columna
+        migrations.AddField(
+            model_name="games",
+            name="version",
+            field=models.PositiveIntegerField(db_default=1, default=1, editable=False),
+        ),
+    ]
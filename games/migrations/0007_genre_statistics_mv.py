@@ -0,0 +1,26 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0006_games_version"),
+    ]
+
+    operations = [
+        # Estadísticas de géneros precalculadas; refreshed_at guarda el momento
+        # del último REFRESH. El índice único permite REFRESH ... CONCURRENTLY
+        migrations.RunSQL(
+            """
+            CREATE MATERIALIZED VIEW IF NOT EXISTS steam.genre_statistics_mv AS
+            SELECT genre, COUNT(DISTINCT app_id) AS game_count, now() AS refreshed_at
+            FROM steam.genres
+            WHERE genre IS NOT NULL
+            GROUP BY genre;
+
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_genre_statistics_mv_genre
+            ON steam.genre_statistics_mv (genre);
+            """,
+            reverse_sql="DROP MATERIALIZED VIEW IF EXISTS steam.genre_statistics_mv;",
+        ),
+    ]
@@ -0,0 +1,273 @@
+from django.db import migrations
+
+# Tablas de dimensión con contador: (dimensión, tabla, columna)
+DIMENSIONS = [
+    ("genre", "genres", "genre"),
+    ("category", "categories", "category"),
+    ("developer", "developers", "developer"),
+    ("publisher", "publishers", "publisher"),
+    ("language", "languages", "language"),
+]
+
+TABLES_SQL = """
+CREATE TABLE IF NOT EXISTS steam.dimension_counters (
+    dimension text NOT NULL,
+    value text NOT NULL,
+    game_count bigint NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimension, value)
+);
+
+CREATE TABLE IF NOT EXISTS steam.genre_stats_counters (
+    genre text PRIMARY KEY,
+    price_count bigint NOT NULL DEFAULT 0,
+    price_sum numeric NOT NULL DEFAULT 0,
+    score_count bigint NOT NULL DEFAULT 0,
+    score_sum bigint NOT NULL DEFAULT 0
+);
+"""
+
+# Triggers por sentencia con tablas de transición: cada INSERT/UPDATE/DELETE
+# aplica un delta agregado por valor, también para cargas masivas
+FUNCTIONS_SQL = """
+CREATE OR REPLACE FUNCTION steam.maintain_dimension_counters()
+RETURNS trigger LANGUAGE plpgsql AS $fn$
+DECLARE
+    dim text := TG_ARGV[0];
+    col text := TG_ARGV[1];
+    rel text;
+    sign int;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM steam.dimension_counters WHERE dimension = dim;
+        RETURN NULL;
+    END IF;
+
+    FOR rel, sign IN
+        SELECT v.rel, v.sign FROM (VALUES ('old_rows', -1), ('new_rows', 1)) v(rel, sign)
+        WHERE (v.rel = 'old_rows' AND TG_OP IN ('DELETE', 'UPDATE'))
+           OR (v.rel = 'new_rows' AND TG_OP IN ('INSERT', 'UPDATE'))
+    LOOP
+        EXECUTE format(
+            $q$
+            INSERT INTO steam.dimension_counters AS c (dimension, value, game_count)
+            SELECT $1, %2$I, $2 * COUNT(*) FROM %1$I
+            WHERE %2$I IS NOT NULL
+            GROUP BY %2$I
+            ON CONFLICT (dimension, value)
+            DO UPDATE SET game_count = c.game_count + EXCLUDED.game_count
+            $q$,
+            rel, col
+        ) USING dim, sign;
+    END LOOP;
+    RETURN NULL;
+END;
+$fn$;
+
+CREATE OR REPLACE FUNCTION steam.maintain_genre_stats_from_genres()
+RETURNS trigger LANGUAGE plpgsql AS $fn$
+DECLARE
+    rel text;
+    sign int;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM steam.genre_stats_counters;
+        RETURN NULL;
+    END IF;
+
+    FOR rel, sign IN
+        SELECT v.rel, v.sign FROM (VALUES ('old_rows', -1), ('new_rows', 1)) v(rel, sign)
+        WHERE (v.rel = 'old_rows' AND TG_OP IN ('DELETE', 'UPDATE'))
+           OR (v.rel = 'new_rows' AND TG_OP IN ('INSERT', 'UPDATE'))
+    LOOP
+        EXECUTE format(
+            $q$
+            INSERT INTO steam.genre_stats_counters AS c
+                (genre, price_count, price_sum, score_count, score_sum)
+            SELECT r.genre,
+                   $1 * COUNT(g.price),
+                   $1 * COALESCE(SUM(g.price), 0),
+                   $1 * COALESCE(SUM(s.score_count), 0),
+                   $1 * COALESCE(SUM(s.score_sum), 0)
+            FROM %I r
+            LEFT JOIN steam.games g ON g.app_id = r.app_id
+            LEFT JOIN LATERAL (
+                SELECT COUNT(sr.user_score) AS score_count,
+                       SUM(sr.user_score) AS score_sum
+                FROM steam.scores_and_ranks sr
+                WHERE sr.app_id = r.app_id
+            ) s ON true
+            WHERE r.genre IS NOT NULL
+            GROUP BY r.genre
+            ON CONFLICT (genre) DO UPDATE SET
+                price_count = c.price_count + EXCLUDED.price_count,
+                price_sum = c.price_sum + EXCLUDED.price_sum,
+                score_count = c.score_count + EXCLUDED.score_count,
+                score_sum = c.score_sum + EXCLUDED.score_sum
+            $q$,
+            rel
+        ) USING sign;
+    END LOOP;
+    RETURN NULL;
+END;
+$fn$;
+
+CREATE OR REPLACE FUNCTION steam.maintain_genre_stats_from_games()
+RETURNS trigger LANGUAGE plpgsql AS $fn$
+BEGIN
+    INSERT INTO steam.genre_stats_counters AS c (genre, price_count, price_sum)
+    SELECT r.genre,
+           SUM((n.price IS NOT NULL)::int - (o.price IS NOT NULL)::int),
+           SUM(COALESCE(n.price, 0) - COALESCE(o.price, 0))
+    FROM old_rows o
+    JOIN new_rows n ON n.app_id = o.app_id
+    JOIN steam.genres r ON r.app_id = n.app_id
+    WHERE o.price IS DISTINCT FROM n.price AND r.genre IS NOT NULL
+    GROUP BY r.genre
+    ON CONFLICT (genre) DO UPDATE SET
+        price_count = c.price_count + EXCLUDED.price_count,
+        price_sum = c.price_sum + EXCLUDED.price_sum;
+    RETURN NULL;
+END;
+$fn$;
+
+CREATE OR REPLACE FUNCTION steam.maintain_genre_stats_from_scores()
+RETURNS trigger LANGUAGE plpgsql AS $fn$
+DECLARE
+    rel text;
+    sign int;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        UPDATE steam.genre_stats_counters SET score_count = 0, score_sum = 0;
+        RETURN NULL;
+    END IF;
+
+    FOR rel, sign IN
+        SELECT v.rel, v.sign FROM (VALUES ('old_rows', -1), ('new_rows', 1)) v(rel, sign)
+        WHERE (v.rel = 'old_rows' AND TG_OP IN ('DELETE', 'UPDATE'))
+           OR (v.rel = 'new_rows' AND TG_OP IN ('INSERT', 'UPDATE'))
+    LOOP
+        EXECUTE format(
+            $q$
+            INSERT INTO steam.genre_stats_counters AS c
+                (genre, score_count, score_sum)
+            SELECT r.genre,
+                   $1 * COUNT(x.user_score),
+                   $1 * COALESCE(SUM(x.user_score), 0)
+            FROM %I x
+            JOIN steam.genres r ON r.app_id = x.app_id
+            WHERE r.genre IS NOT NULL
+            GROUP BY r.genre
+            ON CONFLICT (genre) DO UPDATE SET
+                score_count = c.score_count + EXCLUDED.score_count,
+                score_sum = c.score_sum + EXCLUDED.score_sum
+            $q$,
+            rel
+        ) USING sign;
+    END LOOP;
+    RETURN NULL;
+END;
+$fn$;
+"""
+
+
+def statement_triggers(name, table, function, args="", events=None):
+    # Las tablas de transición exigen un trigger por evento
+    events = events or ("INSERT", "UPDATE", "DELETE")
+    transitions = {
+        "INSERT": "REFERENCING NEW TABLE AS new_rows",
+        "UPDATE": "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows",
+        "DELETE": "REFERENCING OLD TABLE AS old_rows",
+    }
+    statements = [
+        f"CREATE TRIGGER {name}_{event.lower()} AFTER {event} ON steam.{table} "
+        f"{transitions[event]} FOR EACH STATEMENT "
+        f"EXECUTE FUNCTION steam.{function}({args});"
+        for event in events
+    ]
+    statements.append(
+        f"CREATE TRIGGER {name}_truncate AFTER TRUNCATE ON steam.{table} "
+        f"FOR EACH STATEMENT EXECUTE FUNCTION steam.{function}({args});"
+    )
+    return "\n".join(statements)
+
+
+def drop_triggers(name, table):
+    return "\n".join(
+        f"DROP TRIGGER IF EXISTS {name}_{event} ON steam.{table};"
+        for event in ("insert", "update", "delete", "truncate")
+    )
+
+
+TRIGGERS = [
+    (f"trg_{table}_counters", table, "maintain_dimension_counters", f"'{dim}', '{col}'")
+    for dim, table, col in DIMENSIONS
+] + [
+    ("trg_genres_stats", "genres", "maintain_genre_stats_from_genres", ""),
+    (
+        "trg_scores_genre_stats",
+        "scores_and_ranks",
+        "maintain_genre_stats_from_scores",
+        "",
+    ),
+]
+
+TRIGGERS_SQL = "\n".join(
+    statement_triggers(name, table, function, args)
+    for name, table, function, args in TRIGGERS
+) + (
+    "\nCREATE TRIGGER trg_games_genre_stats_update AFTER UPDATE ON steam.games "
+    "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT "
+    "EXECUTE FUNCTION steam.maintain_genre_stats_from_games();"
+)
+
+# Carga inicial a partir de los datos existentes
+POPULATE_SQL = (
+    "\n".join(f"""
+    INSERT INTO steam.dimension_counters (dimension, value, game_count)
+    SELECT '{dim}', {col}, COUNT(*) FROM steam.{table}
+    WHERE {col} IS NOT NULL GROUP BY {col};
+    """ for dim, table, col in DIMENSIONS)
+    + """
+    INSERT INTO steam.genre_stats_counters
+        (genre, price_count, price_sum, score_count, score_sum)
+    SELECT r.genre, COUNT(g.price), COALESCE(SUM(g.price), 0),
+           COALESCE(SUM(s.score_count), 0), COALESCE(SUM(s.score_sum), 0)
+    FROM steam.genres r
+    LEFT JOIN steam.games g ON g.app_id = r.app_id
+    LEFT JOIN (
+        SELECT app_id, COUNT(user_score) AS score_count, SUM(user_score) AS score_sum
+        FROM steam.scores_and_ranks GROUP BY app_id
+    ) s ON s.app_id = r.app_id
+    WHERE r.genre IS NOT NULL
+    GROUP BY r.genre;
+"""
+)
+
+REVERSE_SQL = (
+    "\n".join(drop_triggers(name, table) for name, table, _f, _a in TRIGGERS) + """
+    DROP TRIGGER IF EXISTS trg_games_genre_stats_update ON steam.games;
+    DROP FUNCTION IF EXISTS steam.maintain_dimension_counters();
+    DROP FUNCTION IF EXISTS steam.maintain_genre_stats_from_genres();
+    DROP FUNCTION IF EXISTS steam.maintain_genre_stats_from_games();
+    DROP FUNCTION IF EXISTS steam.maintain_genre_stats_from_scores();
+    DROP TABLE IF EXISTS steam.genre_stats_counters;
+    DROP TABLE IF EXISTS steam.dimension_counters;
+    """
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0007_genre_statistics_mv"),
+    ]
+
+    operations = [
+        # Contadores por dimensión y sumas de precio/puntaje por género,
+        # mantenidos por triggers; se verifican con reconcile_counters. La
+        # migración 0013 los redefine para contar juegos distintos
+        migrations.RunSQL(
+            TABLES_SQL + FUNCTIONS_SQL + TRIGGERS_SQL + POPULATE_SQL,
+            reverse_sql=REVERSE_SQL,
+        ),
+    ]
@@ -0,0 +1,43 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0008_aggregate_counters"),
+    ]
+
+    operations = [
+        # Historial de planes de las consultas registradas (check_query_plans)
+        migrations.CreateModel(
+            name="QueryPlanSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("query_name", models.CharField(max_length=100)),
+                ("captured_at", models.DateTimeField(auto_now_add=True)),
+                ("is_baseline", models.BooleanField(default=False)),
+                ("sql", models.TextField()),
+                ("plan", models.JSONField()),
+                ("summary", models.JSONField()),
+                ("median_ms", models.FloatField()),
+                ("regressions", models.JSONField(default=list)),
+            ],
+            options={
+                "db_table": 'steam"."query_plan_snapshots',
+                "indexes": [
+                    models.Index(
+                        fields=["query_name", "-captured_at"],
+                        name="idx_query_plan_name_captured",
+                    )
+                ],
+            },
+        ),
+    ]
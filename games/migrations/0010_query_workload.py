@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0009_query_plan_snapshots"),
+    ]
+
+    operations = [
+        # Carga de trabajo registrada por QueryWorkloadMiddleware
+        migrations.CreateModel(
+            name="QueryWorkload",
+            fields=[
+                (
+                    "fingerprint",
+                    models.CharField(max_length=40, primary_key=True, serialize=False),
+                ),
+                ("statement", models.TextField()),
+                ("calls", models.BigIntegerField(default=0)),
+                ("total_ms", models.FloatField(default=0)),
+                ("last_seen", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": 'steam"."query_workload',
+            },
+        ),
+    ]
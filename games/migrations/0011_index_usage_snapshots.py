@@ -0,0 +1,45 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0010_query_workload"),
+    ]
+
+    operations = [
+        # Historial de uso de índices (IndexService.snapshot_index_usage)
+        migrations.CreateModel(
+            name="IndexUsageSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("captured_at", models.DateTimeField()),
+                ("index_oid", models.BigIntegerField()),
+                ("index_name", models.CharField(max_length=63)),
+                ("table_name", models.CharField(max_length=63)),
+                ("size_bytes", models.BigIntegerField()),
+                ("idx_scan", models.BigIntegerField()),
+                ("idx_tup_read", models.BigIntegerField()),
+                ("idx_tup_fetch", models.BigIntegerField()),
+                ("idx_blks_read", models.BigIntegerField()),
+                ("idx_blks_hit", models.BigIntegerField()),
+            ],
+            options={
+                "db_table": 'steam"."index_usage_snapshots',
+                "indexes": [
+                    models.Index(
+                        fields=["index_oid", "captured_at"],
+                        name="idx_index_usage_oid_captured",
+                    )
+                ],
+            },
+        ),
+    ]
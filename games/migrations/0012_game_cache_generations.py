@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0011_index_usage_snapshots"),
+    ]
+
+    operations = [
+        # Generación compartida de la caché por juego (GameCacheService)
+        migrations.CreateModel(
+            name="GameCacheGeneration",
+            fields=[
+                (
+                    "app_id",
+                    models.TextField(primary_key=True, serialize=False),
+                ),
+                ("generation", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "db_table": 'steam"."game_cache_generations',
+            },
+        ),
+    ]
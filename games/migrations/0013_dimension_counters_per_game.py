@@ -0,0 +1,241 @@
+from importlib import import_module
+
+from django.db import migrations
+
+counters = import_module("games.migrations.0008_aggregate_counters")
+
+# Índices (valor, app_id) para comprobar si un par ya existía en la tabla
+INDEXES_SQL = "\n".join(f"""
+    CREATE INDEX IF NOT EXISTS idx_{table}_{col}_app_id
+    ON steam.{table} ({col}, app_id);
+    """ for _dim, table, col in counters.DIMENSIONS)
+
+DROP_INDEXES_SQL = "\n".join(
+    f"DROP INDEX IF EXISTS steam.idx_{table}_{col}_app_id;"
+    for _dim, table, col in counters.DIMENSIONS
+)
+
+# Los contadores cuentan juegos distintos, igual que genre_statistics_mv: una
+# fila repetida para el mismo juego no suma dos veces. Cada sentencia sigue
+# aplicando un delta, solo cuando un par (valor, app_id) aparece por primera
+# vez o pierde su última fila. Dos transacciones concurrentes que insertan el
+# mismo par nuevo lo cuentan ambas; reconcile_counters corrige esa deriva
+FUNCTIONS_SQL = """
+CREATE OR REPLACE FUNCTION steam.dimension_pair_deltas(op text, tbl text, col text)
+RETURNS text LANGUAGE plpgsql IMMUTABLE AS $fn$
+DECLARE
+    changes text;
+BEGIN
+    -- Filas quitadas y agregadas por la sentencia, desde las tablas de transición
+    changes := concat_ws(
+        ' UNION ALL ',
+        CASE WHEN op IN ('DELETE', 'UPDATE')
+            THEN format('SELECT %I, app_id, 1, 0 FROM old_rows', col) END,
+        CASE WHEN op IN ('INSERT', 'UPDATE')
+            THEN format('SELECT %I, app_id, 0, 1 FROM new_rows', col) END
+    );
+
+    -- Filas del par antes de la sentencia = después - agregadas + quitadas
+    RETURN format(
+        $q$
+        SELECT d.value, d.app_id,
+               (a.after_rows > 0)::int
+               - (a.after_rows - d.added + d.removed > 0)::int AS delta
+        FROM (
+            SELECT x.value, x.app_id,
+                   SUM(x.removed) AS removed, SUM(x.added) AS added
+            FROM (%1$s) x(value, app_id, removed, added)
+            WHERE x.value IS NOT NULL AND x.app_id IS NOT NULL
+            GROUP BY x.value, x.app_id
+        ) d
+        CROSS JOIN LATERAL (
+            SELECT COUNT(*) AS after_rows
+            FROM steam.%2$I t
+            WHERE t.%3$I = d.value AND t.app_id = d.app_id
+        ) a
+        $q$,
+        changes, tbl, col
+    );
+END;
+$fn$;
+
+CREATE OR REPLACE FUNCTION steam.maintain_dimension_counters()
+RETURNS trigger LANGUAGE plpgsql AS $fn$
+DECLARE
+    dim text := TG_ARGV[0];
+    col text := TG_ARGV[1];
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM steam.dimension_counters WHERE dimension = dim;
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format(
+        $q$
+        INSERT INTO steam.dimension_counters AS c (dimension, value, game_count)
+        SELECT $1, p.value, SUM(p.delta) FROM (%s) p
+        GROUP BY p.value
+        HAVING SUM(p.delta) <> 0
+        ON CONFLICT (dimension, value)
+        DO UPDATE SET game_count = c.game_count + EXCLUDED.game_count
+        $q$,
+        steam.dimension_pair_deltas(TG_OP, TG_TABLE_NAME, col)
+    ) USING dim;
+    RETURN NULL;
+END;
+$fn$;
+
+CREATE OR REPLACE FUNCTION steam.maintain_genre_stats_from_genres()
+RETURNS trigger LANGUAGE plpgsql AS $fn$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM steam.genre_stats_counters;
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format(
+        $q$
+        INSERT INTO steam.genre_stats_counters AS c
+            (genre, price_count, price_sum, score_count, score_sum)
+        SELECT p.value,
+               SUM(p.delta * (g.price IS NOT NULL)::int),
+               COALESCE(SUM(p.delta * g.price), 0),
+               COALESCE(SUM(p.delta * s.score_count), 0),
+               COALESCE(SUM(p.delta * s.score_sum), 0)
+        FROM (%s) p
+        LEFT JOIN steam.games g ON g.app_id = p.app_id
+        LEFT JOIN LATERAL (
+            SELECT COUNT(sr.user_score) AS score_count,
+                   SUM(sr.user_score) AS score_sum
+            FROM steam.scores_and_ranks sr
+            WHERE sr.app_id = p.app_id
+        ) s ON true
+        WHERE p.delta <> 0
+        GROUP BY p.value
+        ON CONFLICT (genre) DO UPDATE SET
+            price_count = c.price_count + EXCLUDED.price_count,
+            price_sum = c.price_sum + EXCLUDED.price_sum,
+            score_count = c.score_count + EXCLUDED.score_count,
+            score_sum = c.score_sum + EXCLUDED.score_sum
+        $q$,
+        steam.dimension_pair_deltas(TG_OP, TG_TABLE_NAME, 'genre')
+    );
+    RETURN NULL;
+END;
+$fn$;
+
+CREATE OR REPLACE FUNCTION steam.maintain_genre_stats_from_games()
+RETURNS trigger LANGUAGE plpgsql AS $fn$
+BEGIN
+    INSERT INTO steam.genre_stats_counters AS c (genre, price_count, price_sum)
+    SELECT r.genre,
+           SUM((n.price IS NOT NULL)::int - (o.price IS NOT NULL)::int),
+           SUM(COALESCE(n.price, 0) - COALESCE(o.price, 0))
+    FROM old_rows o
+    JOIN new_rows n ON n.app_id = o.app_id
+    CROSS JOIN LATERAL (
+        SELECT DISTINCT genre FROM steam.genres
+        WHERE app_id = n.app_id AND genre IS NOT NULL
+    ) r
+    WHERE o.price IS DISTINCT FROM n.price
+    GROUP BY r.genre
+    ON CONFLICT (genre) DO UPDATE SET
+        price_count = c.price_count + EXCLUDED.price_count,
+        price_sum = c.price_sum + EXCLUDED.price_sum;
+    RETURN NULL;
+END;
+$fn$;
+
+CREATE OR REPLACE FUNCTION steam.maintain_genre_stats_from_scores()
+RETURNS trigger LANGUAGE plpgsql AS $fn$
+DECLARE
+    rel text;
+    sign int;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        UPDATE steam.genre_stats_counters SET score_count = 0, score_sum = 0;
+        RETURN NULL;
+    END IF;
+
+    FOR rel, sign IN
+        SELECT v.rel, v.sign FROM (VALUES ('old_rows', -1), ('new_rows', 1)) v(rel, sign)
+        WHERE (v.rel = 'old_rows' AND TG_OP IN ('DELETE', 'UPDATE'))
+           OR (v.rel = 'new_rows' AND TG_OP IN ('INSERT', 'UPDATE'))
+    LOOP
+        EXECUTE format(
+            $q$
+            INSERT INTO steam.genre_stats_counters AS c
+                (genre, score_count, score_sum)
+            SELECT r.genre,
+                   $1 * COUNT(x.user_score),
+                   $1 * COALESCE(SUM(x.user_score), 0)
+            FROM %I x
+            CROSS JOIN LATERAL (
+                SELECT DISTINCT genre FROM steam.genres
+                WHERE app_id = x.app_id AND genre IS NOT NULL
+            ) r
+            GROUP BY r.genre
+            ON CONFLICT (genre) DO UPDATE SET
+                score_count = c.score_count + EXCLUDED.score_count,
+                score_sum = c.score_sum + EXCLUDED.score_sum
+            $q$,
+            rel
+        ) USING sign;
+    END LOOP;
+    RETURN NULL;
+END;
+$fn$;
+"""
+
+POPULATE_SQL = (
+    "DELETE FROM steam.dimension_counters;\n"
+    + "\n".join(f"""
+    INSERT INTO steam.dimension_counters (dimension, value, game_count)
+    SELECT '{dim}', {col}, COUNT(DISTINCT app_id) FROM steam.{table}
+    WHERE {col} IS NOT NULL AND app_id IS NOT NULL GROUP BY {col};
+    """ for dim, table, col in counters.DIMENSIONS)
+    + """
+    DELETE FROM steam.genre_stats_counters;
+    INSERT INTO steam.genre_stats_counters
+        (genre, price_count, price_sum, score_count, score_sum)
+    SELECT r.genre, COUNT(g.price), COALESCE(SUM(g.price), 0),
+           COALESCE(SUM(s.score_count), 0), COALESCE(SUM(s.score_sum), 0)
+    FROM (
+        SELECT DISTINCT genre, app_id FROM steam.genres
+        WHERE genre IS NOT NULL AND app_id IS NOT NULL
+    ) r
+    LEFT JOIN steam.games g ON g.app_id = r.app_id
+    LEFT JOIN (
+        SELECT app_id, COUNT(user_score) AS score_count, SUM(user_score) AS score_sum
+        FROM steam.scores_and_ranks GROUP BY app_id
+    ) s ON s.app_id = r.app_id
+    GROUP BY r.genre;
+"""
+)
+
+REVERSE_SQL = (
+    counters.FUNCTIONS_SQL
+    + """
+    DROP FUNCTION IF EXISTS steam.dimension_pair_deltas(text, text, text);
+    DELETE FROM steam.dimension_counters;
+    DELETE FROM steam.genre_stats_counters;
+    """
+    + counters.POPULATE_SQL
+    + DROP_INDEXES_SQL
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0012_game_cache_generations"),
+    ]
+
+    operations = [
+        # dimension_counters y genre_stats_counters pasan de contar filas a
+        # contar juegos distintos
+        migrations.RunSQL(
+            INDEXES_SQL + FUNCTIONS_SQL + POPULATE_SQL,
+            reverse_sql=REVERSE_SQL,
+        ),
+    ]
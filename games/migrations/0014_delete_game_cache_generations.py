@@ -0,0 +1,15 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0013_dimension_counters_per_game"),
+    ]
+
+    operations = [
+        # La generación de la caché por juego pasa a la caché compartida
+        migrations.DeleteModel(
+            name="GameCacheGeneration",
+        ),
+    ]
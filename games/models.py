@@ -44,6 +44,8 @@ class Games(models.Model):
     dlc_count = models.IntegerField(blank=True, null=True)
     achievements = models.IntegerField(blank=True, null=True)
     estimated_owners = models.TextField(blank=True, null=True)
+    # Se incrementa en cada edición; permite detectar actualizaciones perdidas
+    version = models.PositiveIntegerField(default=1, db_default=1, editable=False)
 
     class Meta:
         db_table = "games"
@@ -145,3 +147,72 @@ class Urls(models.Model):
 
     class Meta:
         db_table = "urls"
+
+
+class GameSyncState(models.Model):
+    # Hash del registro normalizado de cada juego en la última sincronización
+    app_id = models.TextField(primary_key=True)
+    content_hash = models.CharField(max_length=64)
+    synced_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "game_sync_state"
+
+
+class QueryPlanSnapshot(models.Model):
+    # Plan y tiempos de una consulta registrada; la línea base es la referencia
+    # contra la que se comparan las capturas siguientes
+    query_name = models.CharField(max_length=100)
+    captured_at = models.DateTimeField(auto_now_add=True)
+    is_baseline = models.BooleanField(default=False)
+    sql = models.TextField()
+    plan = models.JSONField()
+    summary = models.JSONField()
+    median_ms = models.FloatField()
+    regressions = models.JSONField(default=list)
+
+    class Meta:
+        db_table = "query_plan_snapshots"
+        indexes = [
+            models.Index(
+                fields=["query_name", "-captured_at"],
+                name="idx_query_plan_name_captured",
+            ),
+        ]
+
+
+class QueryWorkload(models.Model):
+    # Sentencias normalizadas ejecutadas por la aplicación (asesor de índices)
+    fingerprint = models.CharField(max_length=40, primary_key=True)
+    statement = models.TextField()
+    calls = models.BigIntegerField(default=0)
+    total_ms = models.FloatField(default=0)
+    last_seen = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "query_workload"
+
+
+class IndexUsageSnapshot(models.Model):
+    # Contadores de pg_stat_user_indexes / pg_statio_user_indexes en cada captura;
+    # index_oid distingue un índice recreado con el mismo nombre
+    captured_at = models.DateTimeField()
+    index_oid = models.BigIntegerField()
+    index_name = models.CharField(max_length=63)
+    table_name = models.CharField(max_length=63)
+    size_bytes = models.BigIntegerField()
+    idx_scan = models.BigIntegerField()
+    idx_tup_read = models.BigIntegerField()
+    idx_tup_fetch = models.BigIntegerField()
+    idx_blks_read = models.BigIntegerField()
+    idx_blks_hit = models.BigIntegerField()
+
+    class Meta:
+        db_table = "index_usage_snapshots"
+        indexes = [
+            models.Index(
+                fields=["index_oid", "captured_at"],
+                name="idx_index_usage_oid_captured",
+            ),
+        ]
+
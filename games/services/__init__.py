@@ -3,6 +3,21 @@ from .game_service import GameService
 from .about_game_service import AboutGameService
 from .genre_service import GenreService
 from .transaction_service import TransactionService
+from .export_service import ExportService
+from .game_detail_service import GameDetailService
+from .game_cache_service import GameCacheService
+from .sync_service import SyncService
+from .child_collection_service import ChildCollectionService
 
 
-__all__ = ["GameService", "AboutGameService", "GenreService", "TransactionService"]
+__all__ = [
+    "GameService",
+    "AboutGameService",
+    "GenreService",
+    "TransactionService",
+    "ExportService",
+    "GameDetailService",
+    "GameCacheService",
+    "SyncService",
+    "ChildCollectionService",
+]
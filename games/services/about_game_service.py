@@ -2,6 +2,7 @@ from django.db import transaction
 from django.core.exceptions import ValidationError
 from ..models import Games, AboutGame
 from .game_service import GameService
+from .game_cache_service import GameCacheService
 from typing import Dict, Optional
 
 
@@ -18,13 +19,17 @@ class AboutGameService:
             about_game, created = AboutGame.objects.update_or_create(
                 app=game, defaults=description_data
             )
+            GameCacheService.invalidate_on_commit(app_id)
             return about_game
 
     @staticmethod
     def get_description(app_id: str) -> Optional[AboutGame]:
-        #Obtiene la descripción de un juego
-        try:
-            game = Games.objects.get(app_id=app_id)
-            return AboutGame.objects.get(app=game)
-        except (Games.DoesNotExist, AboutGame.DoesNotExist):
-            return None
+        #Obtiene la descripción de un juego (lectura a través de la caché por juego)
+        def load():
+            try:
+                game = Games.objects.get(app_id=app_id)
+                return AboutGame.objects.get(app=game)
+            except (Games.DoesNotExist, AboutGame.DoesNotExist):
+                return None
+
+        return GameCacheService.get_or_load(app_id, "description", load)
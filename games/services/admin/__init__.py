@@ -2,5 +2,16 @@ from games.services.admin.backup_service import BackupService
 from games.services.admin.schema_service import SchemaService
 from games.services.admin.index_service import IndexService
 from games.services.admin.security_service import SecurityService
+from games.services.admin.import_service import BulkImportService
+from games.services.admin.plan_registry_service import PlanRegistryService
+from games.services.admin.index_advisor_service import IndexAdvisorService
 
-__all__ = ["BackupService", "SchemaService", "IndexService", "SecurityService"]
+__all__ = [
+    "BackupService",
+    "SchemaService",
+    "IndexService",
+    "SecurityService",
+    "BulkImportService",
+    "PlanRegistryService",
+    "IndexAdvisorService",
+]
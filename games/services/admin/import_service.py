@@ -0,0 +1,423 @@
+import csv
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional
+
+import django
+from django.db import connection, connections, transaction
+
+from games.config import IMPORT_CONFIG
+from games.services.analytics import CounterService, GenreAnalyticsService
+from .security_service import SecurityService
+
+
+class JsonLinesCsvStream:
+    """Adapta un archivo JSON Lines a un flujo CSV legible por COPY"""
+
+    def __init__(self, path: str, columns: List[str]):
+        self._file = open(path, encoding="utf-8")
+        self._columns = columns
+        self._buffer = BulkImportService._csv_line(columns)
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            line = self._file.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            self._buffer += BulkImportService._csv_line(
+                [BulkImportService._csv_value(record.get(c)) for c in self._columns]
+            )
+
+        if size < 0:
+            chunk, self._buffer = self._buffer, ""
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BulkImportService:
+    """Carga masiva del dataset con COPY a través de tablas de staging"""
+
+    PARENT_TABLE = "games"
+
+    @staticmethod
+    def find_source_files(
+        source_dir: str, tables: Optional[List[str]] = None
+    ) -> Dict[str, str]:
+        """Encuentra el archivo de origen de cada tabla en el directorio"""
+        tables = tables or SecurityService.ALLOWED_TABLES
+        if not SecurityService.validate_tables_list(tables):
+            raise ValueError("Una o más tablas no están permitidas")
+
+        files = {}
+        for table in tables:
+            for extension in IMPORT_CONFIG["extensions"]:
+                path = os.path.join(source_dir, f"{table}{extension}")
+                if os.path.isfile(path):
+                    files[table] = path
+                    break
+        return files
+
+    @staticmethod
+    def run_import(
+        source_dir: str,
+        tables: Optional[List[str]] = None,
+        workers: Optional[int] = None,
+        truncate: bool = False,
+        rebuild_indexes: bool = True,
+        progress: Optional[Callable[[Dict], None]] = None,
+    ) -> List[Dict]:
+        """Importa games y luego las tablas hijas en procesos paralelos"""
+        files = BulkImportService.find_source_files(source_dir, tables)
+        if not files:
+            raise ValueError(
+                f"No se encontraron archivos para importar en {source_dir}"
+            )
+
+        workers = workers or IMPORT_CONFIG["workers"]
+        targets = list(files)
+        results = []
+
+        def report(result):
+            results.append(result)
+            if progress:
+                progress(result)
+
+        if truncate:
+            BulkImportService.truncate_tables(targets)
+        else:
+            # Las tablas hijas no tienen clave natural: cargarlas de nuevo
+            # duplicaría cada fila (games sí se deduplica por app_id)
+            loaded = BulkImportService.non_empty_tables(
+                [t for t in targets if t != BulkImportService.PARENT_TABLE]
+            )
+            if loaded:
+                raise ValueError(
+                    f"Las tablas {', '.join(loaded)} ya tienen datos; use truncate "
+                    "para reemplazarlas o sync_dataset para actualizarlas"
+                )
+
+        indexes = (
+            BulkImportService.get_secondary_indexes(targets) if rebuild_indexes else []
+        )
+        BulkImportService.drop_indexes(indexes)
+
+        try:
+            # games primero: las tablas hijas la referencian por app_id
+            if BulkImportService.PARENT_TABLE in files:
+                report(
+                    BulkImportService.load_table(
+                        BulkImportService.PARENT_TABLE,
+                        files.pop(BulkImportService.PARENT_TABLE),
+                    )
+                )
+
+            # Cada proceso abre su propia conexión; no se heredan las del padre
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker
+            ) as executor:
+                futures = [
+                    executor.submit(_load_table_task, table, path)
+                    for table, path in files.items()
+                ]
+                for future in as_completed(futures):
+                    report(future.result())
+        finally:
+            BulkImportService.create_indexes(indexes, workers)
+            BulkImportService.set_counter_triggers(targets, enabled=True)
+
+        BulkImportService.analyze_tables(targets)
+
+        # Las estadísticas precalculadas dependen de los géneros recién cargados
+        if "genres" in targets:
+            GenreAnalyticsService.refresh_genre_statistics()
+
+        # Los triggers de contadores se desactivan durante la carga: los
+        # contadores se reconstruyen una sola vez al final
+        if set(targets) & set(CounterService.SOURCE_TABLES):
+            CounterService.reconcile(fix=True)
+        return results
+
+    @staticmethod
+    def load_table(table: str, path: str) -> Dict:
+        """Copia un archivo a una tabla de staging UNLOGGED y la vuelca al destino"""
+        if not SecurityService.validate_table_name(table):
+            raise ValueError(f"Tabla '{table}' no permitida")
+
+        columns = BulkImportService._validated_columns(table, path)
+        staging = f"{IMPORT_CONFIG['staging_prefix']}{table}_{os.getpid()}"
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        conflict = (
+            " ON CONFLICT (app_id) DO NOTHING"
+            if table == BulkImportService.PARENT_TABLE
+            else ""
+        )
+
+        started = time.monotonic()
+        with transaction.atomic(), connection.cursor() as cursor:
+            BulkImportService._copy_to_staging(cursor, table, staging, path, columns)
+            # run_import los vuelve a activar al terminar
+            BulkImportService._alter_counter_triggers(cursor, table, "DISABLE")
+            cursor.execute(
+                f'INSERT INTO "steam"."{table}" ({column_list}) '
+                f'SELECT {column_list} FROM "steam"."{staging}"{conflict}'
+            )
+            rows = cursor.rowcount
+            cursor.execute(f'DROP TABLE "steam"."{staging}"')
+
+            # Con ids explícitos la secuencia debe continuar desde el máximo
+            if "id" in columns:
+                cursor.execute(
+                    f"""
+                    SELECT setval(
+                        pg_get_serial_sequence('steam.{table}', 'id'),
+                        COALESCE((SELECT MAX(id) FROM "steam"."{table}"), 1)
+                    )
+                    """
+                )
+        elapsed = time.monotonic() - started
+
+        return {
+            "table": table,
+            "rows": rows,
+            "seconds": round(elapsed, 2),
+            "rows_per_second": round(rows / elapsed) if elapsed else rows,
+        }
+
+    @staticmethod
+    def stage_file(table: str, path: str, staging: str) -> List[str]:
+        """Copia un archivo a una tabla de staging UNLOGGED indexada por app_id
+
+        La tabla queda confirmada para leerla por partes; quien la crea debe
+        eliminarla con drop_staging. Devuelve las columnas cargadas.
+        """
+        if not SecurityService.validate_table_name(table):
+            raise ValueError(f"Tabla '{table}' no permitida")
+
+        columns = BulkImportService._validated_columns(table, path)
+        with transaction.atomic(), connection.cursor() as cursor:
+            BulkImportService._copy_to_staging(cursor, table, staging, path, columns)
+            if "app_id" in columns:
+                cursor.execute(f'CREATE INDEX ON "steam"."{staging}" ("app_id")')
+            cursor.execute(f'ANALYZE "steam"."{staging}"')
+        return columns
+
+    @staticmethod
+    def drop_staging(staging: str) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS "steam"."{staging}"')
+
+    @staticmethod
+    def non_empty_tables(tables: List[str]) -> List[str]:
+        """Tablas que ya tienen al menos una fila"""
+        loaded = []
+        with connection.cursor() as cursor:
+            for table in tables:
+                cursor.execute(f'SELECT EXISTS (SELECT 1 FROM "steam"."{table}")')
+                if cursor.fetchone()[0]:
+                    loaded.append(table)
+        return loaded
+
+    @staticmethod
+    def truncate_tables(tables: List[str]) -> None:
+        """Vacía las tablas destino antes de la carga"""
+        table_list = ", ".join(f'"steam"."{table}"' for table in tables)
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {table_list}")
+
+    @staticmethod
+    def set_counter_triggers(tables: List[str], enabled: bool) -> None:
+        """Activa o desactiva los triggers de contadores de las tablas"""
+        action = "ENABLE" if enabled else "DISABLE"
+        with connection.cursor() as cursor:
+            for table in tables:
+                BulkImportService._alter_counter_triggers(cursor, table, action)
+
+    @staticmethod
+    def _alter_counter_triggers(cursor, table: str, action: str) -> None:
+        cursor.execute(
+            """
+            SELECT t.tgname
+            FROM pg_trigger t
+            JOIN pg_proc p ON p.oid = t.tgfoid
+            WHERE t.tgrelid = %s::regclass AND NOT t.tgisinternal
+              AND p.proname = ANY(%s)
+            ORDER BY t.tgname
+            """,
+            [f"steam.{table}", CounterService.TRIGGER_FUNCTIONS],
+        )
+        for (name,) in cursor.fetchall():
+            cursor.execute(f'ALTER TABLE "steam"."{table}" {action} TRIGGER "{name}"')
+
+    @staticmethod
+    def get_secondary_indexes(tables: List[str]) -> List[Dict]:
+        """Índices que no respaldan restricciones (PK, UNIQUE) de las tablas"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT i.indexname, i.tablename, i.indexdef
+                FROM pg_indexes i
+                JOIN pg_namespace n ON n.nspname = i.schemaname
+                JOIN pg_class c ON c.relname = i.indexname AND c.relnamespace = n.oid
+                WHERE i.schemaname = %s AND i.tablename = ANY(%s)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM pg_constraint k WHERE k.conindid = c.oid
+                  )
+                ORDER BY i.tablename, i.indexname
+                """,
+                ["steam", tables],
+            )
+            return [
+                {"name": row[0], "table": row[1], "definition": row[2]}
+                for row in cursor.fetchall()
+            ]
+
+    @staticmethod
+    def drop_indexes(indexes: List[Dict]) -> None:
+        """Elimina índices secundarios antes de la carga"""
+        with connection.cursor() as cursor:
+            for index in indexes:
+                cursor.execute(f'DROP INDEX IF EXISTS "steam"."{index["name"]}"')
+
+    @staticmethod
+    def create_indexes(indexes: List[Dict], workers: int) -> None:
+        """Reconstruye los índices eliminados, varios a la vez"""
+        if not indexes:
+            return
+
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker
+        ) as executor:
+            for future in as_completed(
+                executor.submit(_create_index_task, index["definition"])
+                for index in indexes
+            ):
+                future.result()
+
+    @staticmethod
+    def analyze_tables(tables: List[str]) -> None:
+        """Actualiza estadísticas del planificador tras la carga"""
+        with connection.cursor() as cursor:
+            for table in tables:
+                cursor.execute(f'ANALYZE "steam"."{table}"')
+
+    @staticmethod
+    def iter_records(path: str) -> Iterator[Dict]:
+        """Recorre el archivo como diccionarios columna -> valor"""
+        with open(path, encoding="utf-8-sig", newline="") as source:
+            if path.endswith(".jsonl"):
+                for line in source:
+                    if line.strip():
+                        yield json.loads(line)
+            else:
+                reader = csv.reader(source)
+                columns = [column.strip() for column in next(reader, [])]
+                for row in reader:
+                    yield dict(zip(columns, row))
+
+    @staticmethod
+    def _validated_columns(table: str, path: str) -> List[str]:
+        """Columnas del archivo, que deben existir en la tabla destino"""
+        columns = BulkImportService._read_columns(path)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_schema = %s AND table_name = %s AND is_generated = 'NEVER'
+                """,
+                ["steam", table],
+            )
+            allowed = {row[0] for row in cursor.fetchall()}
+
+        unknown = [column for column in columns if column not in allowed]
+        if unknown:
+            raise ValueError(
+                f"Columnas desconocidas en {os.path.basename(path)}: "
+                f"{', '.join(unknown)}"
+            )
+        return columns
+
+    @staticmethod
+    def _copy_to_staging(
+        cursor, table: str, staging: str, path: str, columns: List[str]
+    ) -> None:
+        # Solo columnas y tipos, sin restricciones ni índices
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        cursor.execute(
+            f'CREATE UNLOGGED TABLE "steam"."{staging}" AS '
+            f'SELECT {column_list} FROM "steam"."{table}" WITH NO DATA'
+        )
+        with BulkImportService._open_source(path, columns) as source:
+            cursor.copy_expert(
+                f'COPY "steam"."{staging}" ({column_list}) '
+                "FROM STDIN WITH (FORMAT csv, HEADER true)",
+                source,
+            )
+
+    @staticmethod
+    def _read_columns(path: str) -> List[str]:
+        """Columnas del encabezado CSV o de la primera línea JSON"""
+        with open(path, encoding="utf-8-sig", newline="") as source:
+            if path.endswith(".jsonl"):
+                for line in source:
+                    if line.strip():
+                        return list(json.loads(line))
+                return []
+            return [column.strip() for column in next(csv.reader(source), [])]
+
+    @staticmethod
+    def _open_source(path: str, columns: List[str]):
+        """Abre el archivo como flujo CSV con encabezado"""
+        if path.endswith(".jsonl"):
+            return JsonLinesCsvStream(path, columns)
+        return open(path, encoding="utf-8-sig", newline="")
+
+    @staticmethod
+    def _csv_line(values: List) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerow(values)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _csv_value(value):
+        # Listas y objetos se guardan como JSON; None queda como NULL
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, ensure_ascii=False)
+        return value
+
+
+def _init_worker():
+    django.setup()
+
+
+def _load_table_task(table: str, path: str) -> Dict:
+    try:
+        return BulkImportService.load_table(table, path)
+    finally:
+        connections.close_all()
+
+
+def _create_index_task(definition: str) -> None:
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(definition)
+    finally:
+        connections.close_all()
@@ -0,0 +1,456 @@
+import hashlib
+import re
+from collections import defaultdict
+from django.db import connection
+from typing import Dict, List, Optional
+
+from games.config import INDEX_ADVISOR_CONFIG
+from games.models import QueryWorkload
+from .index_service import IndexService
+from .security_service import SecurityService
+
+
+class IndexAdvisorService:
+    """Propone índices a partir de las consultas que ejecuta la aplicación"""
+
+    # Operador -> clase de uso; determina el tipo de índice propuesto
+    OPERATORS = {
+        "=": "equality",
+        "in": "equality",
+        "<": "range",
+        "<=": "range",
+        ">": "range",
+        ">=": "range",
+        "between": "range",
+        "like": "pattern",
+        "ilike": "pattern",
+        "~": "pattern",
+        "~*": "pattern",
+    }
+
+    # Selectividad supuesta cuando no hay estadísticas (valores por defecto del planificador)
+    DEFAULT_SELECTIVITY = {"equality": 0.005, "range": 0.333, "pattern": 0.05}
+
+    # Fracción del tiempo que un índice puede ahorrar en joins y ordenamientos
+    USAGE_FACTORS = {"join": 0.5, "order": 0.3}
+
+    # Columna (opcionalmente calificada) usada directamente: si está dentro de
+    # una función, p. ej. UPPER("games"."name"::text) de icontains, un índice
+    # sobre la columna no sirve y no se propone
+    _COLUMN_REF = r'(?:"?(\w+)"?\.)?"?(\w+)\b"?'
+    _CAST = r"(?:::[\w ]+?)?"
+    _OPERATOR = (
+        r"\s*(<=|>=|<>|!=|=|<|>|~\*|~|\bnot\s+in\b|\bin\b|\bbetween\b|\bi?like\b)"
+    )
+    _CLAUSE = re.compile(
+        r"\b(select|from|join|where|on|order\s+by|group\s+by|having|limit|offset|returning)\b"
+    )
+    _TABLE = re.compile(
+        r'\b(?:from|join)\s+(?:"?steam"?\.)?"?(\w+)"?(?:\s+(?:as\s+)?"?(\w+)"?)?'
+    )
+    _NOT_ALIASES = {
+        "where",
+        "on",
+        "left",
+        "right",
+        "inner",
+        "outer",
+        "full",
+        "cross",
+        "join",
+        "group",
+        "order",
+        "limit",
+        "offset",
+        "lateral",
+        "using",
+        "natural",
+        "for",
+    }
+
+    @staticmethod
+    def normalize(sql: str) -> str:
+        """Reemplaza literales y parámetros por ? para agrupar sentencias iguales"""
+        statement = sql.strip().rstrip(";")
+        statement = re.sub(r"'(?:[^']|'')*'", "?", statement)
+        statement = re.sub(r"%s|\$\d+", "?", statement)
+        statement = re.sub(r"(?<![\w\"])-?\d+(?:\.\d+)?\b", "?", statement)
+        statement = re.sub(r"\(\s*\?(?:\s*,\s*\?)+\s*\)", "(?)", statement)
+        return re.sub(r"\s+", " ", statement)
+
+    @staticmethod
+    def fingerprint(statement: str) -> str:
+        return hashlib.sha1(statement.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def record(entries: Dict[str, Dict]) -> None:
+        """Acumula llamadas y tiempo por sentencia normalizada en una sola sentencia"""
+        if not entries:
+            return
+        values = []
+        params = []
+        for fingerprint, entry in entries.items():
+            values.append("(%s, %s, %s, %s, now())")
+            params += [
+                fingerprint,
+                entry["statement"],
+                entry["calls"],
+                entry["total_ms"],
+            ]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {QueryWorkload._meta.db_table} AS w
+                    (fingerprint, statement, calls, total_ms, last_seen)
+                VALUES {", ".join(values)}
+                ON CONFLICT (fingerprint) DO UPDATE SET
+                    calls = w.calls + EXCLUDED.calls,
+                    total_ms = w.total_ms + EXCLUDED.total_ms,
+                    last_seen = EXCLUDED.last_seen
+                """,
+                params,
+            )
+
+    @staticmethod
+    def reset_workload() -> int:
+        deleted, _details = QueryWorkload.objects.all().delete()
+        return deleted
+
+    @staticmethod
+    def has_pg_stat_statements() -> bool:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT EXISTS (SELECT 1 FROM pg_extension "
+                "WHERE extname = 'pg_stat_statements')"
+            )
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def get_workload(source: Optional[str] = None, limit: Optional[int] = None) -> Dict:
+        """Sentencias más costosas: pg_stat_statements si está instalado, si no
+        las registradas por el middleware de la aplicación"""
+        limit = limit or INDEX_ADVISOR_CONFIG["workload_limit"]
+        if source is None:
+            source = (
+                "pg_stat_statements"
+                if IndexAdvisorService.has_pg_stat_statements()
+                else "app"
+            )
+
+        if source == "pg_stat_statements":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT query, calls, total_exec_time
+                    FROM pg_stat_statements
+                    WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+                      AND query ~* '^\\s*(select|update|delete)'
+                    ORDER BY total_exec_time DESC
+                    LIMIT %s
+                    """,
+                    [limit],
+                )
+                rows = cursor.fetchall()
+            statements = [
+                {
+                    "statement": IndexAdvisorService.normalize(query),
+                    "calls": calls,
+                    "total_ms": total_ms,
+                }
+                for query, calls, total_ms in rows
+            ]
+        elif source == "app":
+            statements = list(
+                QueryWorkload.objects.order_by("-total_ms").values(
+                    "statement", "calls", "total_ms"
+                )[:limit]
+            )
+        else:
+            raise ValueError(f"Fuente de consultas '{source}' no soportada")
+
+        return {"source": source, "statements": statements}
+
+    @staticmethod
+    def extract_columns(statement: str) -> List[Dict]:
+        """Columnas usadas en filtros, joins y ordenamientos, resueltas a su tabla"""
+        lowered = statement.lower()
+        aliases = {}
+        for table, alias in IndexAdvisorService._TABLE.findall(lowered):
+            aliases[table] = table
+            if alias and alias not in IndexAdvisorService._NOT_ALIASES:
+                aliases[alias] = table
+        tables = sorted(set(aliases.values()))
+
+        clauses = [
+            (match.start(), re.sub(r"\s+", " ", match.group(1)))
+            for match in IndexAdvisorService._CLAUSE.finditer(lowered)
+        ]
+
+        usages = []
+        pattern = re.compile(
+            IndexAdvisorService._COLUMN_REF
+            + IndexAdvisorService._CAST
+            + IndexAdvisorService._OPERATOR
+        )
+        for match in pattern.finditer(lowered):
+            if IndexAdvisorService._in_function(lowered, match.start()):
+                continue
+            clause = IndexAdvisorService._clause_at(clauses, match.start())
+            operator = re.sub(r"\s+", " ", match.group(3))
+            if clause in ("where", "having"):
+                usage = "filter"
+            elif clause == "on" and operator == "=":
+                usage = "join"
+            else:
+                continue
+            kind = IndexAdvisorService.OPERATORS.get(operator)
+            if kind is None:
+                continue
+            table = IndexAdvisorService._resolve_table(match.group(1), aliases, tables)
+            if table:
+                usages.append(
+                    {
+                        "table": table,
+                        "column": match.group(2),
+                        "usage": usage,
+                        "kind": kind,
+                    }
+                )
+
+        # Lado derecho de las igualdades de join: "a.x = b.y" usa ambas columnas
+        right = re.compile(r"=\s*\(?" + IndexAdvisorService._COLUMN_REF + r"(?!\s*\()")
+        for match in right.finditer(lowered):
+            if IndexAdvisorService._clause_at(clauses, match.start()) != "on":
+                continue
+            if re.match(r"\s*(?:::[\w ]+?)?\s*\)", lowered[match.end() :]) and (
+                IndexAdvisorService._in_function(lowered, match.start())
+            ):
+                continue
+            table = IndexAdvisorService._resolve_table(match.group(1), aliases, tables)
+            if table and match.group(1):
+                usages.append(
+                    {
+                        "table": table,
+                        "column": match.group(2),
+                        "usage": "join",
+                        "kind": "equality",
+                    }
+                )
+
+        # ORDER BY: cada expresión de la lista, hasta LIMIT/OFFSET o el final
+        order = re.search(r"\border\s+by\s+(.*?)(?:\blimit\b|\boffset\b|\)|$)", lowered)
+        if order:
+            for item in order.group(1).split(","):
+                ref = re.match(r"\s*" + IndexAdvisorService._COLUMN_REF, item)
+                if not ref or item[ref.end() :].lstrip().startswith("("):
+                    continue
+                table = IndexAdvisorService._resolve_table(
+                    ref.group(1), aliases, tables
+                )
+                if table:
+                    usages.append(
+                        {
+                            "table": table,
+                            "column": ref.group(2),
+                            "usage": "order",
+                            "kind": "range",
+                        }
+                    )
+        return usages
+
+    @staticmethod
+    def recommend(source: Optional[str] = None, limit: Optional[int] = None) -> Dict:
+        """Índices candidatos ordenados por beneficio estimado frente a tamaño y escrituras"""
+        workload = IndexAdvisorService.get_workload(source)
+        table_stats = IndexAdvisorService._table_stats()
+        column_stats = IndexAdvisorService._column_stats()
+        indexed = IndexAdvisorService._indexed_columns()
+        columns_by_table = {}
+
+        candidates = defaultdict(
+            lambda: {
+                "benefit_ms": 0.0,
+                "calls": 0,
+                "statements": 0,
+                "usages": defaultdict(int),
+            }
+        )
+        for entry in workload["statements"]:
+            seen = set()
+            for usage in IndexAdvisorService.extract_columns(entry["statement"]):
+                table, column = usage["table"], usage["column"]
+                if not SecurityService.validate_table_name(table):
+                    continue
+                if table not in columns_by_table:
+                    columns_by_table[table] = set(IndexService.get_table_columns(table))
+                if column not in columns_by_table[table]:
+                    continue
+
+                index_type = "GIN_TRGM" if usage["kind"] == "pattern" else "BTREE"
+                if (table, column, index_type) in indexed:
+                    continue
+
+                key = (table, column, index_type)
+                candidate = candidates[key]
+                candidate["usages"][usage["usage"]] += 1
+                if key in seen:
+                    continue
+                seen.add(key)
+                candidate["statements"] += 1
+                candidate["calls"] += entry["calls"]
+                candidate["benefit_ms"] += entry[
+                    "total_ms"
+                ] * IndexAdvisorService._saving(
+                    usage, column_stats.get((table, column)), table_stats.get(table)
+                )
+
+        recommendations = []
+        for (table, column, index_type), candidate in candidates.items():
+            stats = table_stats.get(table, {})
+            width = column_stats.get((table, column), {}).get("avg_width") or 8
+            # Tupla de índice B-tree ~ ancho + 16 bytes; trigramas ocupan varias veces más
+            size = int(
+                stats.get("rows", 0)
+                * (width + 16)
+                * (3 if index_type == "GIN_TRGM" else 1)
+            )
+            write_ratio = stats.get("write_ratio", 0.0)
+            score = (
+                candidate["benefit_ms"]
+                * (1 - write_ratio)
+                / (1 + size / (1024 * 1024 * INDEX_ADVISOR_CONFIG["size_weight_mb"]))
+            )
+            recommendations.append(
+                {
+                    "table": table,
+                    "column": column,
+                    "index_type": index_type,
+                    "usages": dict(candidate["usages"]),
+                    "statements": candidate["statements"],
+                    "calls": candidate["calls"],
+                    "benefit_ms": round(candidate["benefit_ms"], 2),
+                    "estimated_size_bytes": size,
+                    "write_ratio": round(write_ratio, 3),
+                    "score": round(score, 2),
+                }
+            )
+
+        recommendations.sort(key=lambda item: item["score"], reverse=True)
+        return {
+            "source": workload["source"],
+            "statements": len(workload["statements"]),
+            "recommendations": recommendations[
+                : limit or INDEX_ADVISOR_CONFIG["recommendation_limit"]
+            ],
+        }
+
+    @staticmethod
+    def apply(table: str, column: str, index_type: str = "BTREE") -> Dict[str, any]:
+        """Crea el índice recomendado con IndexService"""
+        if column not in IndexService.get_table_columns(table):
+            raise ValueError(f"La columna '{column}' no existe en '{table}'")
+        return IndexService.create_index(table, column, index_type)
+
+    @staticmethod
+    def _saving(usage: Dict, column: Optional[Dict], table: Optional[Dict]) -> float:
+        # Fracción del tiempo de la sentencia que el índice podría ahorrar
+        if usage["usage"] in IndexAdvisorService.USAGE_FACTORS:
+            return IndexAdvisorService.USAGE_FACTORS[usage["usage"]]
+
+        selectivity = IndexAdvisorService.DEFAULT_SELECTIVITY[usage["kind"]]
+        if usage["kind"] == "equality" and column and column.get("n_distinct"):
+            distinct = column["n_distinct"]
+            if distinct < 0:
+                distinct = -distinct * (table or {}).get("rows", 0)
+            if distinct > 0:
+                selectivity = 1 / distinct
+        return max(0.0, 1 - selectivity)
+
+    @staticmethod
+    def _in_function(statement: str, position: int) -> bool:
+        # Precedida por "nombre(" : argumento de una función
+        return bool(re.search(r"\w\s*\(\s*$", statement[:position]))
+
+    @staticmethod
+    def _clause_at(clauses: List[tuple], position: int) -> Optional[str]:
+        current = None
+        for start, clause in clauses:
+            if start > position:
+                break
+            current = clause
+        return current
+
+    @staticmethod
+    def _resolve_table(
+        qualifier: Optional[str], aliases: Dict, tables: List[str]
+    ) -> Optional[str]:
+        if qualifier:
+            return aliases.get(qualifier)
+        # Sin calificar solo es inequívoco con una única tabla
+        return tables[0] if len(tables) == 1 else None
+
+    @staticmethod
+    def _table_stats() -> Dict[str, Dict]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT s.relname, GREATEST(c.reltuples, 0),
+                       s.n_tup_ins + s.n_tup_upd + s.n_tup_del,
+                       COALESCE(s.seq_scan, 0) + COALESCE(s.idx_scan, 0)
+                FROM pg_stat_user_tables s
+                JOIN pg_class c ON c.oid = s.relid
+                WHERE s.schemaname = %s
+                """,
+                ["steam"],
+            )
+            return {
+                table: {
+                    "rows": rows,
+                    "write_ratio": writes / (writes + reads) if writes + reads else 0.0,
+                }
+                for table, rows, writes, reads in cursor.fetchall()
+            }
+
+    @staticmethod
+    def _column_stats() -> Dict[tuple, Dict]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT tablename, attname, n_distinct, avg_width
+                FROM pg_stats
+                WHERE schemaname = %s
+                """,
+                ["steam"],
+            )
+            return {
+                (table, column): {"n_distinct": n_distinct, "avg_width": avg_width}
+                for table, column, n_distinct, avg_width in cursor.fetchall()
+            }
+
+    @staticmethod
+    def _indexed_columns() -> set:
+        # (tabla, primera columna, tipo) de los índices existentes
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT t.relname, a.attname, am.amname,
+                       COALESCE(opc.opcname, '')
+                FROM pg_index i
+                JOIN pg_class t ON t.oid = i.indrelid
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                JOIN pg_class ic ON ic.oid = i.indexrelid
+                JOIN pg_am am ON am.oid = ic.relam
+                JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = i.indkey[0]
+                LEFT JOIN pg_opclass opc ON opc.oid = i.indclass[0]
+                WHERE n.nspname = %s
+                """,
+                ["steam"],
+            )
+            indexed = set()
+            for table, column, method, opclass in cursor.fetchall():
+                if method == "gin" and opclass == "gin_trgm_ops":
+                    indexed.add((table, column, "GIN_TRGM"))
+                elif method == "btree":
+                    indexed.add((table, column, "BTREE"))
+            return indexed
@@ -1,11 +1,20 @@
 from django.db import connection, transaction
+from django.utils import timezone
 from typing import List, Dict, Optional
+
+from games.config import INDEX_USAGE_CONFIG
+from games.models import IndexUsageSnapshot
 from .security_service import SecurityService
 
 
 class IndexService:
     """Maneja operaciones de índices de la base de datos"""
 
+    # Tipos especiales: (método de acceso, clase de operadores, extensión requerida)
+    SPECIAL_INDEX_TYPES = {
+        "GIN_TRGM": ("GIN", "gin_trgm_ops", "pg_trgm"),
+    }
+
     @staticmethod
     def get_table_columns(table_name: str) -> List[str]:
         """Obtiene columnas de una tabla específica"""
@@ -75,11 +84,20 @@ class IndexService:
                             "message": f"El índice '{index_name}' ya existe",
                         }
 
+                    access_method, opclass, extension = (
+                        IndexService._resolve_index_type(index_type)
+                    )
+                    if extension:
+                        cursor.execute(f"CREATE EXTENSION IF NOT EXISTS {extension};")
+
                     # Crear índice
+                    column_sql = f'"{column_name}"'
+                    if opclass:
+                        column_sql = f"{column_sql} {opclass}"
                     sql = f"""
                         CREATE INDEX "{index_name}" 
                         ON "steam"."{table_name}" 
-                        USING {index_type} ("{column_name}")
+                        USING {access_method} ({column_sql})
                     """
                     cursor.execute(sql)
 
@@ -160,6 +178,314 @@ class IndexService:
         except Exception as e:
             return {"success": False, "message": f"Error al eliminar índices: {str(e)}"}
 
+    @staticmethod
+    def get_index_status(index_name: str) -> Dict[str, any]:
+        """Obtiene existencia, tamaño y uso de un índice específico"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT
+                    i.tablename,
+                    i.indexdef,
+                    pg_size_pretty(pg_relation_size(s.indexrelid)) as size,
+                    s.idx_scan,
+                    s.idx_tup_read
+                FROM pg_indexes i
+                JOIN pg_stat_user_indexes s
+                    ON s.schemaname = i.schemaname AND s.indexrelname = i.indexname
+                WHERE i.schemaname = %s AND i.indexname = %s
+                """,
+                ["steam", index_name],
+            )
+            row = cursor.fetchone()
+
+        if not row:
+            return {"exists": False, "name": index_name}
+
+        return {
+            "exists": True,
+            "name": index_name,
+            "table": row[0],
+            "definition": row[1],
+            "size": row[2],
+            "scans": row[3],
+            "tuples_read": row[4],
+        }
+
+    @staticmethod
+    def snapshot_index_usage() -> int:
+        """Guarda los contadores actuales de uso y E/S de cada índice del esquema"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {IndexUsageSnapshot._meta.db_table}
+                    (captured_at, index_oid, index_name, table_name, size_bytes,
+                     idx_scan, idx_tup_read, idx_tup_fetch, idx_blks_read, idx_blks_hit)
+                SELECT now(), s.indexrelid, s.indexrelname, s.relname,
+                       pg_relation_size(s.indexrelid), s.idx_scan, s.idx_tup_read,
+                       s.idx_tup_fetch, io.idx_blks_read, io.idx_blks_hit
+                FROM pg_stat_user_indexes s
+                JOIN pg_statio_user_indexes io ON io.indexrelid = s.indexrelid
+                WHERE s.schemaname = %s
+                """,
+                ["steam"],
+            )
+            return cursor.rowcount
+
+    @staticmethod
+    def get_usage_history(
+        index_name: Optional[str] = None, limit: Optional[int] = None
+    ):
+        """Capturas más recientes del historial de uso, opcionalmente de un índice"""
+        snapshots = IndexUsageSnapshot.objects.order_by("-captured_at", "index_name")
+        if index_name:
+            snapshots = snapshots.filter(index_name=index_name)
+        return snapshots[: limit or INDEX_USAGE_CONFIG["history_limit"]]
+
+    @staticmethod
+    def get_drop_plan() -> Dict:
+        """Índices sin uso, duplicados, redundantes por prefijo o de poco beneficio
+
+        Los recorridos se cuentan desde la primera captura del historial (más
+        los ocurridos desde la última); los índices que respaldan restricciones
+        (PK, UNIQUE, exclusión) nunca se proponen para eliminar.
+        """
+        config = INDEX_USAGE_CONFIG
+        indexes = IndexService._index_inventory()
+        usage = IndexService._usage_since_first_snapshot()
+        now = timezone.now()
+
+        for index in indexes:
+            history = usage.get(index["oid"])
+            if history:
+                first_seen, scans, last_scan = history
+                # Contador menor que en la última captura: estadísticas reiniciadas
+                live = index["scans"] - last_scan
+                index["window_scans"] = scans + (live if live >= 0 else index["scans"])
+                index["observed_days"] = (now - first_seen).days
+            else:
+                index["window_scans"] = index["scans"]
+                index["observed_days"] = 0
+
+        flagged = {}
+        observed = [
+            index
+            for index in indexes
+            if not index["is_constraint"]
+            and index["observed_days"] >= config["min_observation_days"]
+        ]
+        for index in observed:
+            size_mb = index["size_bytes"] / (1024 * 1024)
+            if index["window_scans"] == 0:
+                flagged[index["oid"]] = (
+                    "unused",
+                    f"Sin recorridos en {index['observed_days']} días",
+                )
+            elif (
+                index["size_bytes"] >= config["min_size_bytes"]
+                and index["window_scans"] / size_mb < config["min_scans_per_mb"]
+            ):
+                flagged[index["oid"]] = (
+                    "low_benefit",
+                    f"{index['window_scans']} recorridos en {index['observed_days']} "
+                    f"días para {size_mb:.1f} MB",
+                )
+
+        # Duplicados: misma tabla, método, columnas, clases de operadores y
+        # predicado. El motivo estructural reemplaza al de uso si se conserva el otro
+        groups = {}
+        for index in indexes:
+            groups.setdefault(IndexService._index_key(index), []).append(index)
+        for group in groups.values():
+            if len(group) < 2:
+                continue
+            keeper = min(
+                group,
+                key=lambda index: (
+                    not index["is_constraint"],
+                    not index["is_unique"],
+                    index["oid"] in flagged,
+                    -index["window_scans"],
+                    index["name"],
+                ),
+            )
+            for index in group:
+                if (
+                    index is not keeper
+                    and not index["is_constraint"]
+                    and (keeper["is_unique"] or not index["is_unique"])
+                    and keeper["oid"] not in flagged
+                ):
+                    flagged[index["oid"]] = (
+                        "duplicate",
+                        f"Duplicado de {keeper['name']}",
+                    )
+
+        # Redundantes: un B-tree cuyas columnas son el prefijo de otro que se conserva
+        for index in indexes:
+            if (
+                index["method"] != "btree"
+                or index["is_unique"]
+                or flagged.get(index["oid"], ("",))[0] == "duplicate"
+            ):
+                continue
+            width = len(index["columns"])
+            for other in indexes:
+                if (
+                    other is not index
+                    and other["oid"] not in flagged
+                    and other["method"] == "btree"
+                    and other["table"] == index["table"]
+                    and other["predicate"] == index["predicate"]
+                    and len(other["columns"]) > width
+                    and other["columns"][:width] == index["columns"]
+                    and other["opclasses"][:width] == index["opclasses"]
+                ):
+                    flagged[index["oid"]] = (
+                        "redundant",
+                        f"Columnas iniciales cubiertas por {other['name']}",
+                    )
+                    break
+
+        candidates = [
+            {
+                "name": index["name"],
+                "table": index["table"],
+                "definition": index["definition"],
+                "kind": flagged[index["oid"]][0],
+                "reason": flagged[index["oid"]][1],
+                "size_bytes": index["size_bytes"],
+                "scans": index["window_scans"],
+                "observed_days": index["observed_days"],
+                "statement": f'DROP INDEX "steam"."{index["name"]}"',
+            }
+            for index in indexes
+            if index["oid"] in flagged
+        ]
+        return {
+            "candidates": candidates,
+            "reclaimed_bytes": sum(item["size_bytes"] for item in candidates),
+            "insufficient_history": [
+                index["name"]
+                for index in indexes
+                if not index["is_constraint"]
+                and index["observed_days"] < config["min_observation_days"]
+            ],
+        }
+
+    @staticmethod
+    def drop_indexes(index_names: List[str]) -> Dict[str, any]:
+        """Elimina en una transacción los índices indicados del plan de eliminación"""
+        plan = {
+            item["name"]: item for item in IndexService.get_drop_plan()["candidates"]
+        }
+        rejected = [name for name in index_names if name not in plan]
+        if rejected:
+            return {
+                "success": False,
+                "message": f"Índices fuera del plan de eliminación: {', '.join(rejected)}",
+            }
+
+        try:
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    for name in index_names:
+                        cursor.execute(plan[name]["statement"])
+        except Exception as e:
+            return {"success": False, "message": f"Error al eliminar índices: {str(e)}"}
+
+        reclaimed = sum(plan[name]["size_bytes"] for name in index_names)
+        return {
+            "success": True,
+            "message": f"Se eliminaron {len(index_names)} índices "
+            f"({reclaimed // 1024} kB liberados)",
+            "reclaimed_bytes": reclaimed,
+        }
+
+    @staticmethod
+    def _index_inventory() -> List[Dict]:
+        """Índices del esquema con columnas, método, predicado y tamaño"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT c.oid, c.relname, t.relname, pg_get_indexdef(c.oid), am.amname,
+                       ARRAY(
+                           SELECT pg_get_indexdef(c.oid, k, true)
+                           FROM generate_series(1, i.indnkeyatts) AS k
+                           ORDER BY k
+                       ),
+                       i.indclass::oid[],
+                       pg_get_expr(i.indpred, i.indrelid),
+                       i.indisunique,
+                       EXISTS (SELECT 1 FROM pg_constraint con WHERE con.conindid = c.oid),
+                       pg_relation_size(c.oid),
+                       COALESCE(s.idx_scan, 0)
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                JOIN pg_class t ON t.oid = i.indrelid
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                JOIN pg_am am ON am.oid = c.relam
+                LEFT JOIN pg_stat_user_indexes s ON s.indexrelid = c.oid
+                WHERE n.nspname = %s
+                ORDER BY t.relname, c.relname
+                """,
+                ["steam"],
+            )
+            return [
+                {
+                    "oid": row[0],
+                    "name": row[1],
+                    "table": row[2],
+                    "definition": row[3],
+                    "method": row[4],
+                    "columns": list(row[5]),
+                    "opclasses": list(row[6]),
+                    "predicate": row[7],
+                    "is_unique": row[8],
+                    "is_constraint": row[9],
+                    "size_bytes": row[10],
+                    "scans": row[11],
+                }
+                for row in cursor.fetchall()
+            ]
+
+    @staticmethod
+    def _usage_since_first_snapshot() -> Dict[int, tuple]:
+        """oid -> (primera captura, recorridos acumulados, idx_scan de la última)"""
+        with connection.cursor() as cursor:
+            # Un descenso entre capturas indica reinicio: se suma el valor nuevo
+            cursor.execute(
+                f"""
+                SELECT index_oid, MIN(captured_at),
+                       COALESCE(SUM(CASE WHEN delta < 0 THEN idx_scan ELSE delta END), 0),
+                       (ARRAY_AGG(idx_scan ORDER BY captured_at DESC))[1]
+                FROM (
+                    SELECT index_oid, captured_at, idx_scan,
+                           idx_scan - LAG(idx_scan) OVER (
+                               PARTITION BY index_oid ORDER BY captured_at
+                           ) AS delta
+                    FROM {IndexUsageSnapshot._meta.db_table}
+                ) history
+                GROUP BY index_oid
+                """
+            )
+            return {row[0]: row[1:] for row in cursor.fetchall()}
+
+    @staticmethod
+    def _index_key(index: Dict) -> tuple:
+        return (
+            index["table"],
+            index["method"],
+            tuple(index["columns"]),
+            tuple(index["opclasses"]),
+            index["predicate"],
+        )
+
+    @staticmethod
+    def _resolve_index_type(index_type: str) -> tuple:
+        """Traduce el tipo de índice a método de acceso, opclass y extensión"""
+        return IndexService.SPECIAL_INDEX_TYPES.get(index_type, (index_type, "", ""))
+
     @staticmethod
     def _index_exists(index_name: str) -> bool:
         """Verifica si un índice existe"""
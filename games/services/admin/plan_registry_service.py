@@ -0,0 +1,221 @@
+from django.db import transaction
+from typing import Callable, Dict, List, Optional, Tuple
+
+from games.config import PLAN_REGRESSION_CONFIG
+from games.models import Games, QueryPlanSnapshot
+
+
+class PlanRegistryService:
+    """Registro de consultas críticas: captura de planes y detección de regresiones"""
+
+    @staticmethod
+    def hot_queries() -> Dict[str, Tuple[str, Callable[[], Tuple[str, List]]]]:
+        """Consulta registrada -> (descripción, función que arma SQL y parámetros)"""
+        return {
+            "search_name": (
+                "Búsqueda por nombre (subcadena)",
+                PlanRegistryService._search_name_sql,
+            ),
+            "search_advanced": (
+                "Búsqueda combinada por edad y precio",
+                PlanRegistryService._search_advanced_sql,
+            ),
+            "all_games_filters": (
+                "Listado de juegos con filtros de género, plataforma y precio",
+                PlanRegistryService._all_games_sql,
+            ),
+            "genre_statistics": (
+                "Estadísticas de géneros",
+                PlanRegistryService._genre_statistics_sql,
+            ),
+            "game_detail": (
+                "Documento completo de un juego",
+                PlanRegistryService._game_detail_sql,
+            ),
+        }
+
+    @staticmethod
+    def capture(
+        names: Optional[List[str]] = None, set_baseline: bool = False
+    ) -> List[Dict]:
+        """Captura plan y tiempos de cada consulta y los compara con su línea base
+
+        Sin línea base previa (o con set_baseline) la captura pasa a ser la
+        nueva línea base y no se informan regresiones.
+        """
+        from games.services.analytics import BenchmarkService
+
+        queries = PlanRegistryService.hot_queries()
+        names = names or list(queries)
+        unknown = [name for name in names if name not in queries]
+        if unknown:
+            raise ValueError(f"Consultas no registradas: {', '.join(unknown)}")
+
+        results = []
+        for name in names:
+            sql, params = queries[name][1]()
+            run = BenchmarkService.run(
+                sql,
+                params,
+                scratch=False,
+                repetitions=PLAN_REGRESSION_CONFIG["repetitions"],
+            )
+            summary = {**run["plan"], "timings": run["timings"]}
+
+            baseline = PlanRegistryService.get_baseline(name)
+            is_baseline = set_baseline or baseline is None
+            regressions = (
+                []
+                if is_baseline
+                else PlanRegistryService.compare(baseline.summary, summary)
+            )
+
+            with transaction.atomic():
+                if is_baseline:
+                    QueryPlanSnapshot.objects.filter(
+                        query_name=name, is_baseline=True
+                    ).update(is_baseline=False)
+                snapshot = QueryPlanSnapshot.objects.create(
+                    query_name=name,
+                    is_baseline=is_baseline,
+                    sql=sql,
+                    plan=run["raw_plan"],
+                    summary=summary,
+                    median_ms=run["timings"]["median_ms"],
+                    regressions=regressions,
+                )
+            results.append(
+                {
+                    "name": name,
+                    "snapshot_id": snapshot.id,
+                    "is_baseline": is_baseline,
+                    "median_ms": snapshot.median_ms,
+                    "scans": summary["scans"],
+                    "regressions": regressions,
+                }
+            )
+        return results
+
+    @staticmethod
+    def compare(baseline: Dict, current: Dict) -> List[str]:
+        """Diferencias relevantes entre el resumen base y el actual"""
+        config = PLAN_REGRESSION_CONFIG
+        regressions = []
+
+        # Una tabla que pasa a leerse por Seq Scan o un índice que deja de usarse
+        new_seq_scans = [
+            scan
+            for scan in current["scans"]
+            if scan.startswith("Seq Scan") and scan not in baseline["scans"]
+        ]
+        if new_seq_scans:
+            regressions.append(
+                f"Nuevo recorrido secuencial: {', '.join(new_seq_scans)}"
+            )
+        lost_indexes = set(baseline["indexes_used"]) - set(current["indexes_used"])
+        if lost_indexes:
+            regressions.append(
+                f"Índices que ya no se usan: {', '.join(sorted(lost_indexes))}"
+            )
+
+        base_error = baseline["max_row_estimate_error"]
+        error = current["max_row_estimate_error"]
+        if error >= config["row_error_factor"] and error > base_error * 2:
+            regressions.append(
+                f"Estimación de filas desviada x{error} (base x{base_error})"
+            )
+
+        base_blocks = PlanRegistryService._blocks(baseline)
+        blocks = PlanRegistryService._blocks(current)
+        if base_blocks and blocks > base_blocks * config["buffers_factor"]:
+            regressions.append(f"Bloques leídos: {blocks} (base {base_blocks})")
+
+        base_ms = baseline["timings"]["median_ms"]
+        median_ms = current["timings"]["median_ms"]
+        if (
+            median_ms > base_ms * config["runtime_factor"]
+            and median_ms - base_ms >= config["min_runtime_delta_ms"]
+        ):
+            regressions.append(f"Mediana {median_ms} ms (base {base_ms} ms)")
+
+        return regressions
+
+    @staticmethod
+    def get_baseline(name: str) -> Optional[QueryPlanSnapshot]:
+        return (
+            QueryPlanSnapshot.objects.filter(query_name=name, is_baseline=True)
+            .order_by("-captured_at")
+            .first()
+        )
+
+    @staticmethod
+    def get_history(name: Optional[str] = None, limit: Optional[int] = None):
+        """Capturas más recientes (sin el plan completo), opcionalmente de una consulta"""
+        snapshots = QueryPlanSnapshot.objects.defer("plan").order_by("-captured_at")
+        if name:
+            snapshots = snapshots.filter(query_name=name)
+        return snapshots[: limit or PLAN_REGRESSION_CONFIG["history_limit"]]
+
+    @staticmethod
+    def _blocks(summary: Dict) -> int:
+        return sum(
+            summary.get(key, 0) or 0
+            for key in (
+                "shared_hit_blocks",
+                "shared_read_blocks",
+                "local_hit_blocks",
+                "local_read_blocks",
+            )
+        )
+
+    # Consultas registradas: se arman con el mismo código que usan las vistas
+
+    @staticmethod
+    def _search_name_sql() -> Tuple[str, List]:
+        from games.services.search import SearchQueryCompiler
+
+        queryset = SearchQueryCompiler.search(
+            {"name": PLAN_REGRESSION_CONFIG["sample_name"]}
+        )
+        return PlanRegistryService._queryset_sql(queryset[:25])
+
+    @staticmethod
+    def _search_advanced_sql() -> Tuple[str, List]:
+        from games.services.search import SearchQueryCompiler
+
+        queryset = SearchQueryCompiler.search(
+            SearchQueryCompiler.parse_combined("req_age:18..30 price:10..300")
+        )
+        return PlanRegistryService._queryset_sql(queryset[:25])
+
+    @staticmethod
+    def _all_games_sql() -> Tuple[str, List]:
+        from games.services.search import FacetService
+
+        queryset = FacetService.filter_queryset(
+            Games.objects.only("app_id", "name"),
+            PLAN_REGRESSION_CONFIG["sample_filters"],
+        ).order_by("name", "app_id")
+        return PlanRegistryService._queryset_sql(queryset[:51])
+
+    @staticmethod
+    def _genre_statistics_sql() -> Tuple[str, List]:
+        from games.services.analytics import GenreAnalyticsService
+
+        return GenreAnalyticsService.GENRE_STATISTICS_SQL, []
+
+    @staticmethod
+    def _game_detail_sql() -> Tuple[str, List]:
+        from games.services.game_detail_service import GameDetailService
+
+        # Un juego fijo para que las capturas sean comparables entre sí
+        app_id = PLAN_REGRESSION_CONFIG["sample_app_id"] or (
+            Games.objects.order_by("app_id").values_list("app_id", flat=True).first()
+        )
+        sections = GameDetailService.resolve_sections()
+        return GameDetailService._build_sql(sections), [app_id]
+
+    @staticmethod
+    def _queryset_sql(queryset) -> Tuple[str, List]:
+        sql, params = queryset.query.sql_with_params()
+        return sql, list(params)
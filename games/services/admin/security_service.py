@@ -27,7 +27,7 @@ class SecurityService:
         "scores_and_ranks",
     ]
 
-    ALLOWED_INDEX_TYPES = ["BTREE", "HASH", "GIN", "GIST"]
+    ALLOWED_INDEX_TYPES = ["BTREE", "HASH", "GIN", "GIST", "BRIN", "GIN_TRGM"]
 
     @staticmethod
     def validate_table_name(table_name: str) -> bool:
@@ -1,4 +1,23 @@
 from games.services.analytics.genre_service import GenreAnalyticsService
+from games.services.analytics.benchmark_service import BenchmarkService
 from games.services.analytics.performance_service import PerformanceService
+from games.services.analytics.index_experiment_service import IndexExperimentService
+from games.services.analytics.counter_service import CounterService
+from games.services.analytics.data_version_service import DataVersionService
+from games.services.analytics.breakdown_service import BreakdownService
+from games.services.analytics.snapshot_service import (
+    CatalogSnapshot,
+    SnapshotAnalyticsService,
+)
 
-__all__ = ["GenreAnalyticsService", "PerformanceService"]
+__all__ = [
+    "GenreAnalyticsService",
+    "BenchmarkService",
+    "PerformanceService",
+    "IndexExperimentService",
+    "CounterService",
+    "DataVersionService",
+    "BreakdownService",
+    "CatalogSnapshot",
+    "SnapshotAnalyticsService",
+]
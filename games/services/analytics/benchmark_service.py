@@ -0,0 +1,225 @@
+import json
+import math
+import statistics
+import time
+from django.db import connection, transaction
+from typing import Dict, List, Optional, Sequence
+
+from games.config import BENCHMARK_CONFIG
+from games.services.admin.security_service import SecurityService
+
+
+class BenchmarkService:
+    """Mide consultas con índices candidatos sin modificar la base de producción"""
+
+    # Un candidato es un dict: {"table", "columns", "method", "where", "name"}.
+    # Las columnas pueden ser expresiones; vienen del código, no de usuarios.
+
+    @staticmethod
+    def compare(
+        sql: str,
+        params: Optional[Sequence] = None,
+        variants: Optional[Dict[str, List[Dict]]] = None,
+        tables: Optional[List[str]] = None,
+        scratch: Optional[bool] = None,
+        warmup: Optional[int] = None,
+        repetitions: Optional[int] = None,
+    ) -> Dict[str, Dict]:
+        """Ejecuta la misma consulta con cada variante de índices candidatos"""
+        variants = variants or {"actual": []}
+        return {
+            name: BenchmarkService.run(
+                sql, params, candidates, tables, scratch, warmup, repetitions
+            )
+            for name, candidates in variants.items()
+        }
+
+    @staticmethod
+    def run(
+        sql: str,
+        params: Optional[Sequence] = None,
+        candidates: Optional[List[Dict]] = None,
+        tables: Optional[List[str]] = None,
+        scratch: Optional[bool] = None,
+        warmup: Optional[int] = None,
+        repetitions: Optional[int] = None,
+        text_plan: bool = False,
+    ) -> Dict:
+        """Crea los candidatos, mide la consulta y revierte todo al terminar
+
+        Con scratch, cada tabla se copia a una tabla temporal sin índices con
+        el mismo nombre: pg_temp precede a steam en el search_path, así que la
+        consulta (con nombres sin calificar) lee la copia y los índices se crean
+        sobre ella. Sin scratch, los candidatos se crean sobre la tabla real
+        dentro de la transacción, lo que bloquea escrituras hasta el rollback.
+        """
+        candidates = candidates or []
+        scratch = BENCHMARK_CONFIG["scratch"] if scratch is None else scratch
+        warmup = BENCHMARK_CONFIG["warmup"] if warmup is None else warmup
+        repetitions = repetitions or BENCHMARK_CONFIG["repetitions"]
+        tables = tables or sorted({candidate["table"] for candidate in candidates})
+        if not SecurityService.validate_tables_list(tables):
+            raise ValueError("Tabla no permitida en el benchmark")
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "SET LOCAL statement_timeout = %s",
+                [BENCHMARK_CONFIG["statement_timeout_ms"]],
+            )
+            if scratch:
+                BenchmarkService._create_scratch_tables(cursor, tables)
+
+            indexes = [
+                BenchmarkService._create_candidate(cursor, candidate, position)
+                for position, candidate in enumerate(candidates)
+            ]
+            if scratch:
+                # Las tablas temporales no tienen estadísticas hasta analizarlas
+                for table in tables:
+                    cursor.execute(f'ANALYZE "{table}"')
+
+            for _ in range(warmup):
+                cursor.execute(sql, params)
+                cursor.fetchall()
+
+            timings = []
+            for _ in range(repetitions):
+                start = time.perf_counter()
+                cursor.execute(sql, params)
+                cursor.fetchall()
+                timings.append((time.perf_counter() - start) * 1000)
+
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}", params)
+            plan = BenchmarkService._load_plan(cursor.fetchone()[0])
+
+            text = None
+            if text_plan:
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params)
+                text = "\n".join(row[0] for row in cursor.fetchall())
+
+            # Todo lo creado (copias e índices) desaparece con el rollback
+            transaction.set_rollback(True)
+
+        return {
+            "scratch": scratch,
+            "indexes": indexes,
+            "timings": BenchmarkService.summarize_timings(timings),
+            "plan": BenchmarkService.summarize_plan(plan),
+            "raw_plan": plan,
+            "text_plan": text,
+        }
+
+    @staticmethod
+    def summarize_timings(timings: List[float]) -> Dict:
+        """Mínimo, mediana y p95 (rango más cercano) en milisegundos"""
+        ordered = sorted(timings)
+        p95 = ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)]
+        return {
+            "runs": len(ordered),
+            "min_ms": round(ordered[0], 3),
+            "median_ms": round(statistics.median(ordered), 3),
+            "p95_ms": round(p95, 3),
+            "max_ms": round(ordered[-1], 3),
+        }
+
+    @staticmethod
+    def summarize_plan(plan: Dict) -> Dict:
+        """Datos principales de un plan de EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)"""
+        root = plan["Plan"]
+        nodes = list(BenchmarkService.iter_plan_nodes(root))
+        return {
+            "root_node": root["Node Type"],
+            "node_types": sorted({node["Node Type"] for node in nodes}),
+            "indexes_used": sorted(
+                {node["Index Name"] for node in nodes if "Index Name" in node}
+            ),
+            # Tablas leídas y cómo: "Seq Scan games", "Index Scan games (idx_...)"
+            "scans": sorted(
+                {
+                    f"{node['Node Type']} {node['Relation Name']}"
+                    + (f" ({node['Index Name']})" if "Index Name" in node else "")
+                    for node in nodes
+                    if "Relation Name" in node
+                }
+            ),
+            "max_row_estimate_error": max(
+                BenchmarkService._row_estimate_error(node) for node in nodes
+            ),
+            "total_cost": root.get("Total Cost"),
+            "estimated_rows": root.get("Plan Rows"),
+            "actual_rows": root.get("Actual Rows"),
+            "shared_hit_blocks": root.get("Shared Hit Blocks", 0),
+            "shared_read_blocks": root.get("Shared Read Blocks", 0),
+            "local_hit_blocks": root.get("Local Hit Blocks", 0),
+            "local_read_blocks": root.get("Local Read Blocks", 0),
+            "planning_time_ms": plan.get("Planning Time"),
+            "execution_time_ms": plan.get("Execution Time"),
+        }
+
+    @staticmethod
+    def _row_estimate_error(node: Dict) -> float:
+        # Factor entre filas estimadas y reales por ciclo (1 = estimación exacta)
+        if "Actual Rows" not in node or node.get("Actual Loops") == 0:
+            return 1.0
+        estimated = max(node.get("Plan Rows", 0), 1)
+        actual = max(node["Actual Rows"], 1)
+        return round(max(estimated / actual, actual / estimated), 2)
+
+    @staticmethod
+    def iter_plan_nodes(node: Dict):
+        yield node
+        for child in node.get("Plans", []):
+            yield from BenchmarkService.iter_plan_nodes(child)
+
+    @staticmethod
+    def candidate_sql(candidate: Dict, index_name: str) -> str:
+        """CREATE INDEX de un candidato (sin esquema: resuelve por search_path)"""
+        method = candidate.get("method", "BTREE").upper()
+        if not SecurityService.validate_index_type(method):
+            raise ValueError(f"Tipo de índice '{method}' no permitido")
+
+        columns = candidate["columns"]
+        if isinstance(columns, str):
+            columns = [columns]
+        sql = (
+            f'CREATE INDEX "{index_name}" ON "{candidate["table"]}" '
+            f"USING {method} ({', '.join(columns)})"
+        )
+        if candidate.get("where"):
+            sql += f" WHERE {candidate['where']}"
+        return sql
+
+    @staticmethod
+    def _create_scratch_tables(cursor, tables: List[str]) -> None:
+        for table in tables:
+            cursor.execute(
+                f'CREATE TEMP TABLE "{table}" '
+                f'(LIKE "steam"."{table}" INCLUDING DEFAULTS) ON COMMIT DROP'
+            )
+            cursor.execute(f'INSERT INTO "{table}" SELECT * FROM "steam"."{table}"')
+
+    @staticmethod
+    def _create_candidate(cursor, candidate: Dict, position: int) -> Dict:
+        if not SecurityService.validate_table_name(candidate["table"]):
+            raise ValueError(f"Tabla '{candidate['table']}' no permitida")
+
+        index_name = candidate.get("name") or f"bench_{candidate['table']}_{position}"
+        sql = BenchmarkService.candidate_sql(candidate, index_name)
+        cursor.execute(sql)
+        cursor.execute(
+            "SELECT pg_relation_size(c.oid) FROM pg_class c "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [index_name],
+        )
+        return {
+            "name": index_name,
+            "definition": sql,
+            "size_bytes": cursor.fetchone()[0],
+        }
+
+    @staticmethod
+    def _load_plan(value) -> Dict:
+        # psycopg2 decodifica json, pero según el tipo puede llegar como texto
+        if isinstance(value, str):
+            value = json.loads(value)
+        return value[0]
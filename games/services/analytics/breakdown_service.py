@@ -0,0 +1,159 @@
+from django.core.cache import cache
+from django.db import connection
+from typing import Dict, List, Optional
+
+from games.config import BREAKDOWN_CONFIG
+from .data_version_service import DataVersionService
+
+
+class BreakdownService:
+    """Desgloses por dimensión: cantidad, precio, puntaje y tiempo de juego"""
+
+    # Dimensión -> (etiqueta, SQL que produce pares (app_id, value))
+    DIMENSIONS = {
+        "genre": ("Género", "SELECT app_id, genre AS value FROM genres"),
+        "category": ("Categoría", "SELECT app_id, category AS value FROM categories"),
+        "developer": (
+            "Desarrollador",
+            "SELECT app_id, developer AS value FROM developers",
+        ),
+        "publisher": ("Editor", "SELECT app_id, publisher AS value FROM publishers"),
+        "language": ("Idioma", "SELECT app_id, language AS value FROM languages"),
+        "audio_language": (
+            "Idioma de audio",
+            "SELECT app_id, audio_language AS value FROM audio_languages",
+        ),
+        # Las plataformas son columnas booleanas: se despliegan en filas
+        "platform": (
+            "Plataforma",
+            """
+            SELECT p.app_id, v.value
+            FROM platforms p
+            CROSS JOIN LATERAL (
+                VALUES ('Windows', p.windows), ('Mac', p.mac), ('Linux', p.linux)
+            ) AS v(value, enabled)
+            WHERE v.enabled
+            """,
+        ),
+    }
+
+    # Métrica -> etiqueta
+    METRICS = {
+        "games": "Cantidad de juegos",
+        "avg_price": "Precio promedio",
+        "avg_score": "Puntaje de usuarios promedio",
+        "median_playtime": "Mediana de tiempo de juego (min)",
+    }
+
+    # Tablas leídas por los desgloses: su versión invalida la caché
+    SOURCE_TABLES = [
+        "games",
+        "genres",
+        "categories",
+        "developers",
+        "publishers",
+        "languages",
+        "audio_languages",
+        "platforms",
+        "scores_and_ranks",
+        "playtime",
+    ]
+
+    @staticmethod
+    def get_breakdown(
+        dimension: str,
+        order_by: str = "games",
+        top_n: Optional[int] = None,
+        min_support: Optional[int] = None,
+    ) -> Dict:
+        """Desglose de los top N valores con al menos min_support juegos"""
+        if dimension not in BreakdownService.DIMENSIONS:
+            raise ValueError(f"Dimensión '{dimension}' no soportada")
+        if order_by not in BreakdownService.METRICS:
+            raise ValueError(f"Métrica '{order_by}' no soportada")
+
+        top_n = min(
+            top_n or BREAKDOWN_CONFIG["default_top_n"], BREAKDOWN_CONFIG["max_top_n"]
+        )
+        min_support = max(min_support or BREAKDOWN_CONFIG["default_min_support"], 1)
+
+        # La versión de datos en la clave descarta resultados de datos anteriores
+        version = DataVersionService.get_version(BreakdownService.SOURCE_TABLES)
+        cache_key = (
+            f"games:breakdown:{dimension}:{order_by}:{top_n}:{min_support}:{version}"
+        )
+        rows = cache.get(cache_key)
+        cached = rows is not None
+        if not cached:
+            rows = BreakdownService._compute(dimension, order_by, top_n, min_support)
+            cache.set(cache_key, rows, BREAKDOWN_CONFIG["cache_ttl"])
+
+        return {
+            "dimension": dimension,
+            "label": BreakdownService.DIMENSIONS[dimension][0],
+            "order_by": order_by,
+            "top_n": top_n,
+            "min_support": min_support,
+            "rows": rows,
+            "data_version": version,
+            "cached": cached,
+        }
+
+    @staticmethod
+    def _compute(
+        dimension: str, order_by: str, top_n: int, min_support: int
+    ) -> List[Dict]:
+        """Un único GROUP BY sobre los pares (juego, valor) de la dimensión"""
+        _label, pairs_sql = BreakdownService.DIMENSIONS[dimension]
+
+        # Puntaje y tiempo de juego se reducen primero a un valor por juego
+        sql = f"""
+            WITH dim AS (
+                SELECT DISTINCT app_id, value FROM ({pairs_sql}) pairs
+                WHERE value IS NOT NULL
+            ),
+            scores AS (
+                SELECT app_id, AVG(user_score) AS user_score
+                FROM scores_and_ranks
+                WHERE app_id IN (SELECT app_id FROM dim)
+                GROUP BY app_id
+            ),
+            play AS (
+                SELECT app_id, AVG(avg_playtime_forever) AS playtime
+                FROM playtime
+                WHERE app_id IN (SELECT app_id FROM dim)
+                GROUP BY app_id
+            )
+            SELECT d.value,
+                   COUNT(*) AS games,
+                   AVG(g.price) AS avg_price,
+                   AVG(s.user_score) AS avg_score,
+                   percentile_cont(0.5) WITHIN GROUP (ORDER BY p.playtime)
+                       AS median_playtime
+            FROM dim d
+            JOIN games g ON g.app_id = d.app_id
+            LEFT JOIN scores s ON s.app_id = d.app_id
+            LEFT JOIN play p ON p.app_id = d.app_id
+            GROUP BY d.value
+            HAVING COUNT(*) >= %s
+            ORDER BY {order_by} DESC NULLS LAST, d.value
+            LIMIT %s
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [min_support, top_n])
+            results = cursor.fetchall()
+
+        return [
+            {
+                "value": row[0],
+                "games": row[1],
+                "avg_price": BreakdownService._round(row[2]),
+                "avg_score": BreakdownService._round(row[3]),
+                "median_playtime": BreakdownService._round(row[4]),
+            }
+            for row in results
+        ]
+
+    @staticmethod
+    def _round(value) -> Optional[float]:
+        return round(float(value), 2) if value is not None else None
@@ -0,0 +1,205 @@
+from django.db import connection, transaction
+from typing import Dict, List, Optional
+
+
+class CounterService:
+    # Lee y reconcilia los contadores agregados que mantienen los triggers
+    # (migraciones 0008 y 0013); las lecturas recorren O(#grupos) filas en
+    # lugar de escanear las tablas de dimensión. Todos los contadores cuentan
+    # juegos distintos, como genre_statistics_mv
+
+    # Dimensión -> (tabla, columna)
+    DIMENSIONS = {
+        "genre": ("genres", "genre"),
+        "category": ("categories", "category"),
+        "developer": ("developers", "developer"),
+        "publisher": ("publishers", "publisher"),
+        "language": ("languages", "language"),
+    }
+
+    # Tablas cuyos cambios afectan a los contadores
+    SOURCE_TABLES = [
+        "genres",
+        "categories",
+        "developers",
+        "publishers",
+        "languages",
+        "games",
+        "scores_and_ranks",
+    ]
+
+    # Funciones de los triggers que mantienen los contadores
+    TRIGGER_FUNCTIONS = [
+        "maintain_dimension_counters",
+        "maintain_genre_stats_from_genres",
+        "maintain_genre_stats_from_games",
+        "maintain_genre_stats_from_scores",
+    ]
+
+    @staticmethod
+    def get_dimension_counts(dimension: str, limit: Optional[int] = None) -> List[Dict]:
+        # Cantidad de juegos por valor de la dimensión, de mayor a menor
+        if dimension not in CounterService.DIMENSIONS:
+            raise ValueError(f"Dimensión '{dimension}' no soportada")
+
+        sql = """
+            SELECT value, game_count
+            FROM dimension_counters
+            WHERE dimension = %s AND game_count > 0
+            ORDER BY game_count DESC, value
+        """
+        params = [dimension]
+        if limit:
+            sql += " LIMIT %s"
+            params.append(limit)
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [{"value": row[0], "count": row[1]} for row in cursor.fetchall()]
+
+    @staticmethod
+    def get_genre_price_score_stats() -> List[Dict]:
+        # Cantidad, precio promedio y puntaje promedio por género
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT d.value, d.game_count,
+                       s.price_sum / NULLIF(s.price_count, 0),
+                       s.score_sum::numeric / NULLIF(s.score_count, 0)
+                FROM dimension_counters d
+                LEFT JOIN genre_stats_counters s ON s.genre = d.value
+                WHERE d.dimension = 'genre' AND d.game_count > 0
+                ORDER BY d.game_count DESC, d.value
+                """
+            )
+            return [
+                {
+                    "genre": row[0],
+                    "count": row[1],
+                    "avg_price": (
+                        round(float(row[2]), 2) if row[2] is not None else None
+                    ),
+                    "avg_score": (
+                        round(float(row[3]), 2) if row[3] is not None else None
+                    ),
+                }
+                for row in cursor.fetchall()
+            ]
+
+    @staticmethod
+    def reconcile(fix: bool = True) -> Dict:
+        # Recalcula los contadores desde las tablas fuente, informa las
+        # diferencias y, con fix, reemplaza los valores guardados
+        with transaction.atomic(), connection.cursor() as cursor:
+            # Bloquea escrituras (no lecturas) mientras se compara y reconstruye
+            cursor.execute(
+                "LOCK TABLE "
+                + ", ".join(CounterService.SOURCE_TABLES)
+                + " IN SHARE MODE"
+            )
+
+            cursor.execute(
+                "CREATE TEMP TABLE expected_dimension_counters ON COMMIT DROP AS "
+                + " UNION ALL ".join(
+                    f"SELECT '{dimension}'::text AS dimension, {column} AS value, "
+                    f"COUNT(DISTINCT app_id) AS game_count FROM {table} "
+                    f"WHERE {column} IS NOT NULL AND app_id IS NOT NULL "
+                    f"GROUP BY {column}"
+                    for dimension, (table, column) in CounterService.DIMENSIONS.items()
+                )
+            )
+            cursor.execute(
+                """
+                CREATE TEMP TABLE expected_genre_stats ON COMMIT DROP AS
+                SELECT r.genre, COUNT(g.price) AS price_count,
+                       COALESCE(SUM(g.price), 0) AS price_sum,
+                       COALESCE(SUM(s.score_count), 0) AS score_count,
+                       COALESCE(SUM(s.score_sum), 0) AS score_sum
+                FROM (
+                    SELECT DISTINCT genre, app_id FROM genres
+                    WHERE genre IS NOT NULL AND app_id IS NOT NULL
+                ) r
+                LEFT JOIN games g ON g.app_id = r.app_id
+                LEFT JOIN (
+                    SELECT app_id, COUNT(user_score) AS score_count,
+                           SUM(user_score) AS score_sum
+                    FROM scores_and_ranks GROUP BY app_id
+                ) s ON s.app_id = r.app_id
+                GROUP BY r.genre
+                """
+            )
+
+            # Diferencias por dimensión: grupos distintos y desvío absoluto total
+            cursor.execute(
+                """
+                SELECT COALESCE(e.dimension, c.dimension) AS dimension,
+                       COUNT(*) AS groups,
+                       SUM(ABS(COALESCE(c.game_count, 0) - COALESCE(e.game_count, 0)))
+                FROM expected_dimension_counters e
+                FULL JOIN (
+                    SELECT * FROM dimension_counters WHERE game_count <> 0
+                ) c ON c.dimension = e.dimension AND c.value = e.value
+                WHERE c.game_count IS DISTINCT FROM e.game_count
+                GROUP BY 1
+                ORDER BY 1
+                """
+            )
+            dimension_drift = [
+                {"dimension": row[0], "groups": row[1], "total_drift": row[2]}
+                for row in cursor.fetchall()
+            ]
+
+            cursor.execute(
+                """
+                SELECT COALESCE(e.genre, c.genre), c.price_count, e.price_count,
+                       c.price_sum, e.price_sum, c.score_count, e.score_count,
+                       c.score_sum, e.score_sum
+                FROM expected_genre_stats e
+                FULL JOIN genre_stats_counters c ON c.genre = e.genre
+                WHERE (c.price_count, c.price_sum, c.score_count, c.score_sum)
+                      IS DISTINCT FROM
+                      (e.price_count, e.price_sum, e.score_count, e.score_sum)
+                  AND NOT (e.genre IS NULL AND c.price_count = 0
+                           AND c.score_count = 0)
+                ORDER BY 1
+                """
+            )
+            genre_stats_drift = [
+                {
+                    "genre": row[0],
+                    "stored": {
+                        "price_count": row[1],
+                        "price_sum": row[3],
+                        "score_count": row[5],
+                        "score_sum": row[7],
+                    },
+                    "expected": {
+                        "price_count": row[2],
+                        "price_sum": row[4],
+                        "score_count": row[6],
+                        "score_sum": row[8],
+                    },
+                }
+                for row in cursor.fetchall()
+            ]
+
+            if fix:
+                cursor.execute("DELETE FROM dimension_counters")
+                cursor.execute(
+                    "INSERT INTO dimension_counters (dimension, value, game_count) "
+                    "SELECT dimension, value, game_count "
+                    "FROM expected_dimension_counters"
+                )
+                cursor.execute("DELETE FROM genre_stats_counters")
+                cursor.execute(
+                    "INSERT INTO genre_stats_counters "
+                    "(genre, price_count, price_sum, score_count, score_sum) "
+                    "SELECT genre, price_count, price_sum, score_count, score_sum "
+                    "FROM expected_genre_stats"
+                )
+
+        return {
+            "dimension_drift": dimension_drift,
+            "genre_stats_drift": genre_stats_drift,
+            "fixed": fix,
+        }
@@ -0,0 +1,22 @@
+from django.db import connection
+from typing import List
+
+
+class DataVersionService:
+    """Versión de datos barata de consultar para invalidar cachés analíticas"""
+
+    @staticmethod
+    def get_version(tables: List[str]) -> str:
+        """Cambia con cada INSERT/UPDATE/DELETE confirmado sobre las tablas"""
+        # pg_stat_user_tables acumula las filas modificadas por tabla sin
+        # recorrer los datos
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT COALESCE(SUM(n_tup_ins + n_tup_upd + n_tup_del), 0)
+                FROM pg_stat_user_tables
+                WHERE schemaname = %s AND relname = ANY(%s)
+                """,
+                ["steam", list(tables)],
+            )
+            return str(cursor.fetchone()[0])
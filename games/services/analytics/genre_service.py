@@ -8,6 +8,16 @@ from games.models import Genres
 class GenreAnalyticsService:
     """Maneja análisis y estadísticas de géneros de juegos"""
 
+    MATERIALIZED_VIEW = "genre_statistics_mv"
+
+    GENRE_STATISTICS_SQL = """
+            SELECT g.genre, COUNT(DISTINCT g.app_id) as count
+            FROM genres g
+            WHERE g.genre IS NOT NULL
+            GROUP BY g.genre
+            ORDER BY count DESC
+            """
+
     @staticmethod
     def get_genre_statistics() -> Dict[str, List]:
         #Obtiene estadísticas de géneros usando ORM
@@ -27,14 +37,7 @@ class GenreAnalyticsService:
     def get_genre_statistics_optimized() -> Dict[str, List]:
         #Obtiene estadísticas optimizadas usando SQL directo
         with connection.cursor() as cursor:
-            sql = """
-            SELECT g.genre, COUNT(DISTINCT g.app_id) as count
-            FROM genres g
-            WHERE g.genre IS NOT NULL
-            GROUP BY g.genre
-            ORDER BY count DESC
-            """
-            cursor.execute(sql)
+            cursor.execute(GenreAnalyticsService.GENRE_STATISTICS_SQL)
             results = cursor.fetchall()
 
         return {
@@ -42,6 +45,42 @@ class GenreAnalyticsService:
             "data": [row[1] for row in results],
         }
 
+    @staticmethod
+    def get_genre_statistics_materialized() -> Dict:
+        #Lee las estadísticas precalculadas en la vista materializada
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT genre, game_count, refreshed_at
+                FROM {GenreAnalyticsService.MATERIALIZED_VIEW}
+                ORDER BY game_count DESC, genre
+                """
+            )
+            results = cursor.fetchall()
+
+        return {
+            "labels": [row[0] for row in results],
+            "data": [row[1] for row in results],
+            "refreshed_at": results[0][2] if results else None,
+        }
+
+    @staticmethod
+    def refresh_genre_statistics(concurrently: bool = True) -> Dict[str, any]:
+        #Recalcula la vista materializada; CONCURRENTLY no bloquea las lecturas
+        mode = "CONCURRENTLY " if concurrently else ""
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"REFRESH MATERIALIZED VIEW {mode}"
+                    f"{GenreAnalyticsService.MATERIALIZED_VIEW}"
+                )
+            return {
+                "success": True,
+                "message": "Estadísticas de géneros actualizadas",
+            }
+        except Exception as e:
+            return {"success": False, "message": str(e)}
+
     @staticmethod
     def get_genre_summary(genre_data: Dict[str, List]) -> Dict[str, int]:
         #Obtiene resumen de estadísticas de géneros
@@ -0,0 +1,288 @@
+import json
+import os
+import re
+from django.db import connection
+from django.utils import timezone
+from typing import Dict, List, Optional
+
+from .benchmark_service import BenchmarkService
+
+
+class IndexExperimentService:
+    """Genera informes como los de reports/ a partir de escenarios declarativos"""
+
+    # Claves obligatorias de cada escenario y de cada estrategia
+    SCENARIO_KEYS = ("name", "title", "sql", "tables", "strategies")
+    STRATEGY_KEYS = ("label", "method", "columns")
+
+    @staticmethod
+    def load_scenarios(path: str) -> List[Dict]:
+        """Lee y valida la lista de escenarios de un archivo JSON"""
+        with open(path, encoding="utf-8") as source:
+            scenarios = json.load(source)
+
+        for scenario in scenarios:
+            missing = [
+                key
+                for key in IndexExperimentService.SCENARIO_KEYS
+                if key not in scenario
+            ]
+            if missing:
+                raise ValueError(
+                    f"Escenario '{scenario.get('name', '?')}' sin: {', '.join(missing)}"
+                )
+            for strategy in scenario["strategies"]:
+                missing = [
+                    key
+                    for key in IndexExperimentService.STRATEGY_KEYS
+                    if key not in strategy
+                ]
+                if missing:
+                    raise ValueError(
+                        f"Estrategia de '{scenario['name']}' sin: {', '.join(missing)}"
+                    )
+        return scenarios
+
+    @staticmethod
+    def run_scenario(scenario: Dict, repetitions: Optional[int] = None) -> Dict:
+        """Mide la consulta sin índices y con cada estrategia, por separado"""
+        table = scenario.get("table") or scenario["tables"][0]
+        variants = [("Sin índice", None)] + [
+            (strategy["label"], strategy) for strategy in scenario["strategies"]
+        ]
+
+        results = []
+        for label, strategy in variants:
+            candidate = None
+            if strategy:
+                candidate = {
+                    "table": strategy.get("table", table),
+                    "columns": strategy["columns"],
+                    "method": strategy["method"],
+                    "where": strategy.get("where"),
+                    "name": IndexExperimentService._index_name(strategy, table),
+                }
+            result = {"label": label, "strategy": strategy}
+            if candidate:
+                # Falla antes de medir si el método no está permitido
+                result["definition"] = BenchmarkService.candidate_sql(
+                    candidate, candidate["name"]
+                )
+            try:
+                run = BenchmarkService.run(
+                    scenario["sql"],
+                    scenario.get("params"),
+                    [candidate] if candidate else [],
+                    tables=scenario["tables"],
+                    scratch=True,
+                    repetitions=repetitions,
+                    text_plan=True,
+                )
+            except Exception as e:
+                # Un método que no soporta la consulta o las columnas no corta el resto
+                result["error"] = str(e).strip()
+            else:
+                index = run["indexes"][0] if run["indexes"] else None
+                result.update(
+                    {
+                        "index_name": index["name"] if index else None,
+                        "index_size_bytes": index["size_bytes"] if index else None,
+                        "timings": run["timings"],
+                        "plan": run["plan"],
+                        "raw_plan": run["raw_plan"],
+                        "text_plan": run["text_plan"],
+                    }
+                )
+            results.append(result)
+
+        return {
+            "name": scenario["name"],
+            "title": scenario["title"],
+            "sql": scenario["sql"],
+            "params": scenario.get("params"),
+            "generated_at": timezone.now().isoformat(),
+            "table_sizes": IndexExperimentService._table_sizes(scenario["tables"]),
+            "variants": results,
+        }
+
+    @staticmethod
+    def write_report(
+        report: Dict, output_dir: str, force: bool = False
+    ) -> Dict[str, str]:
+        """Escribe report_<nombre>.md y report_<nombre>.json en output_dir
+
+        Sin force no pisa informes existentes (los de reports/ se escribieron a
+        mano con mediciones originales).
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        base = os.path.join(output_dir, f"report_{report['name']}")
+        paths = {"markdown": f"{base}.md", "json": f"{base}.json"}
+
+        existing = [path for path in paths.values() if os.path.exists(path)]
+        if existing and not force:
+            raise ValueError(
+                f"Ya existe {', '.join(existing)}; use force para sobrescribir"
+            )
+
+        with open(paths["markdown"], "w", encoding="utf-8") as target:
+            target.write(IndexExperimentService.render_markdown(report))
+        with open(paths["json"], "w", encoding="utf-8") as target:
+            json.dump(report, target, ensure_ascii=False, indent=2, default=str)
+        return paths
+
+    @staticmethod
+    def render_markdown(report: Dict) -> str:
+        """Mismo formato que los informes escritos a mano en reports/"""
+        pretty = IndexExperimentService._pretty
+        variants = report["variants"]
+        baseline = variants[0]
+        strategies = variants[1:]
+
+        # Como en los informes originales, la línea base lleva el nombre del
+        # primer índice evaluado ("B-tree sin índice")
+        heading = f"{strategies[0]['label']} sin índice" if strategies else "Sin índice"
+        lines = [f"# Informe de Índices para {report['title']}", ""]
+        lines += [f"## 1. {heading}", ""]
+        lines += IndexExperimentService._plan_block(baseline)
+
+        position = 2
+        for number, variant in enumerate(strategies):
+            label = variant["label"]
+            creation = ["```", f"{variant.get('definition', '')};", "```", ""]
+            if number == 0:
+                lines += [f"## {position}. Creación índice {label}", ""] + creation
+            else:
+                lines += [f"## {position}. Índice {label}", ""]
+                lines += [f"### Creación índice {label}", ""] + creation
+            position += 1
+
+            if "error" in variant:
+                lines += [
+                    f"_Índice {label} no soportado o falló: {variant['error']}_",
+                    "",
+                ]
+                continue
+
+            lines += [f"### Consulta con índice {label}", ""]
+            lines += IndexExperimentService._plan_block(variant)
+
+            lines += [f"## {position}. Dimensionamiento {label}", ""]
+            if number == 0:
+                for table, size in report["table_sizes"].items():
+                    lines.append(f"- Tamaño tabla `{table}`: {pretty(size)}")
+            if variant.get("index_size_bytes") is not None:
+                lines.append(
+                    f"- Tamaño índice {label} `{variant['index_name']}`: "
+                    f"{pretty(variant['index_size_bytes'])}"
+                )
+            lines.append("")
+            position += 1
+
+        lines += IndexExperimentService._conclusions(report, position)
+        return "\n".join(lines).rstrip("\n") + "\n"
+
+    @staticmethod
+    def _plan_block(variant: Dict) -> List[str]:
+        if "error" in variant:
+            return [f"_Falló la medición: {variant['error']}_", ""]
+        return [
+            "```",
+            variant["text_plan"],
+            "```",
+            "",
+            IndexExperimentService._timings_line(variant["timings"]),
+            "",
+        ]
+
+    @staticmethod
+    def _conclusions(report: Dict, position: int) -> List[str]:
+        pretty = IndexExperimentService._pretty
+        variants = report["variants"]
+        baseline = variants[0]
+        measured = [variant for variant in variants[1:] if "error" not in variant]
+
+        lines = [f"## {position}. Conclusiones y recomendaciones", ""]
+        lines += [f"### {position}.1. Rendimiento", ""]
+        for variant in [baseline] + measured:
+            if "error" in variant:
+                continue
+            plan = variant["plan"]
+            subject = "Sin índice" if variant is baseline else f"Con {variant['label']}"
+            lines.append(
+                f"- {subject}, el Planning Time fue de {plan['planning_time_ms']} ms "
+                f"y el Execution Time de {plan['execution_time_ms']} ms "
+                f"(mediana de {variant['timings']['runs']} ejecuciones: "
+                f"{variant['timings']['median_ms']} ms; "
+                f"nodos: {', '.join(plan['node_types'])})."
+            )
+        lines.append("")
+
+        lines += [f"### {position}.2. Almacenamiento", ""]
+        for table, size in report["table_sizes"].items():
+            lines.append(f"- La tabla `{table}` ocupa {pretty(size)}.")
+        for variant in measured:
+            if variant.get("index_size_bytes") is not None:
+                lines.append(
+                    f"  - El índice {variant['label']} ocupa "
+                    f"{pretty(variant['index_size_bytes'])}."
+                )
+        lines.append("")
+
+        lines += [f"### {position}.3. Recomendaciones", ""]
+        if "error" in baseline or not measured:
+            lines.append("- No hay mediciones suficientes para comparar.")
+            return lines
+
+        best = min(measured, key=lambda variant: variant["timings"]["median_ms"])
+        base_ms = baseline["timings"]["median_ms"]
+        best_ms = best["timings"]["median_ms"]
+        if best_ms < base_ms and best["plan"]["indexes_used"]:
+            lines.append(
+                f"- Recomendado: índice {best['label']} "
+                f"({best_ms} ms frente a {base_ms} ms sin índice)."
+            )
+        else:
+            lines.append(
+                "- Ningún índice mejora la consulta: el planificador no lo usa "
+                "o no reduce el tiempo frente a la lectura secuencial."
+            )
+        return lines
+
+    @staticmethod
+    def _timings_line(timings: Dict) -> str:
+        return (
+            f"- Tiempos ({timings['runs']} ejecuciones): mín {timings['min_ms']} ms, "
+            f"mediana {timings['median_ms']} ms, p95 {timings['p95_ms']} ms"
+        )
+
+    @staticmethod
+    def _table_sizes(tables: List[str]) -> Dict[str, int]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT c.relname, pg_relation_size(c.oid)
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relname = ANY(%s)
+                """,
+                ["steam", list(tables)],
+            )
+            return dict(cursor.fetchall())
+
+    @staticmethod
+    def _index_name(strategy: Dict, table: str) -> str:
+        # Nombre estable y válido a partir de las columnas o expresiones
+        columns = "_".join(
+            re.sub(r"[^a-z0-9]+", "_", column.lower()).strip("_")
+            for column in strategy["columns"]
+        )
+        suffix = "_partial" if strategy.get("where") else ""
+        return f"idx_{table}_{columns}_{strategy['method'].lower()}{suffix}"[:63]
+
+    @staticmethod
+    def _pretty(size: int) -> str:
+        # Mismo criterio que pg_size_pretty
+        for unit in ("bytes", "kB", "MB", "GB", "TB"):
+            if abs(size) < 10 * 1024 or unit == "TB":
+                return f"{size} {unit}"
+            size = round(size / 1024)
@@ -0,0 +1,306 @@
+import io
+import threading
+import time
+from django.db import connection
+from typing import Dict, List, Optional, Sequence
+
+from games.config import SNAPSHOT_CONFIG
+from .data_version_service import DataVersionService
+
+try:
+    import numpy as np
+except ImportError:  # Dependencia opcional: sin NumPy el resto de la app funciona
+    np = None
+
+
+class CatalogSnapshot:
+    """Columnas numéricas del catálogo en memoria, una fila por juego"""
+
+    def __init__(self, data, columns: List[str], version: str):
+        # Orden Fortran: cada columna queda contigua en memoria
+        self.data = data
+        self.columns = columns
+        self.version = version
+        self.loaded_at = time.time()
+        self._index = {name: i for i, name in enumerate(columns)}
+
+    @property
+    def rows(self) -> int:
+        return self.data.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    def column(self, name: str):
+        if name not in self._index:
+            raise ValueError(f"Columna '{name}' no disponible en el snapshot")
+        return self.data[:, self._index[name]]
+
+
+class SnapshotAnalyticsService:
+    """Histogramas, cuantiles, correlaciones y agrupaciones vectorizadas con NumPy"""
+
+    # Columna del snapshot -> expresión SQL (los hijos se reducen a un valor por juego)
+    COLUMNS = {
+        "release_year": "EXTRACT(YEAR FROM g.rel_date)",
+        "price": "g.price",
+        "req_age": "g.req_age",
+        "dlc_count": "g.dlc_count",
+        "achievements": "g.achievements",
+        "avg_playtime_forever": "p.avg_playtime_forever",
+        "med_playtime_forever": "p.med_playtime_forever",
+        "user_score": "s.user_score",
+        "positive": "s.positive",
+        "negative": "s.negative",
+        "recommendations": "s.recommendations",
+        "metacritic_score": "m.metacritic_score",
+    }
+
+    SOURCE_TABLES = ["games", "playtime", "scores_and_ranks", "metacritic"]
+
+    AGGREGATIONS = ("count", "sum", "mean", "median")
+
+    _snapshot: Optional[CatalogSnapshot] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def is_available() -> bool:
+        return np is not None
+
+    @staticmethod
+    def get_snapshot() -> CatalogSnapshot:
+        """Snapshot vigente; se recarga cuando cambia la versión de datos"""
+        if np is None:
+            raise ValueError("El análisis por snapshot requiere NumPy instalado")
+
+        version = DataVersionService.get_version(SnapshotAnalyticsService.SOURCE_TABLES)
+        snapshot = SnapshotAnalyticsService._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with SnapshotAnalyticsService._lock:
+            snapshot = SnapshotAnalyticsService._snapshot
+            if snapshot is None or snapshot.version != version:
+                # Se libera el anterior antes de cargar para no duplicar memoria
+                SnapshotAnalyticsService._snapshot = None
+                snapshot = SnapshotAnalyticsService._load(version)
+                SnapshotAnalyticsService._snapshot = snapshot
+        return snapshot
+
+    @staticmethod
+    def clear() -> None:
+        with SnapshotAnalyticsService._lock:
+            SnapshotAnalyticsService._snapshot = None
+
+    @staticmethod
+    def _load(version: str) -> CatalogSnapshot:
+        """Carga todas las columnas con un único COPY"""
+        columns = list(SnapshotAnalyticsService.COLUMNS)
+        dtype = np.dtype(SNAPSHOT_CONFIG["dtype"])
+        budget = SNAPSHOT_CONFIG["max_memory_mb"] * 1024 * 1024
+
+        with connection.cursor() as cursor:
+            # La estimación del planificador alcanza para validar el presupuesto
+            cursor.execute(
+                "SELECT GREATEST(reltuples, 0)::bigint FROM pg_class "
+                "WHERE oid = 'games'::regclass"
+            )
+            estimated = cursor.fetchone()[0] * len(columns) * dtype.itemsize
+            if estimated > budget:
+                raise ValueError(
+                    f"El snapshot ocuparía ~{estimated // (1024 * 1024)} MB, "
+                    f"supera el límite de {SNAPSHOT_CONFIG['max_memory_mb']} MB"
+                )
+
+            select = ", ".join(
+                f"{expression} AS {name}"
+                for name, expression in SnapshotAnalyticsService.COLUMNS.items()
+            )
+            buffer = io.StringIO()
+            cursor.copy_expert(
+                f"""
+                COPY (
+                    SELECT {select}
+                    FROM games g
+                    LEFT JOIN (
+                        SELECT app_id,
+                               AVG(avg_playtime_forever) AS avg_playtime_forever,
+                               AVG(med_playtime_forever) AS med_playtime_forever
+                        FROM playtime GROUP BY app_id
+                    ) p ON p.app_id = g.app_id
+                    LEFT JOIN (
+                        SELECT app_id, AVG(user_score) AS user_score,
+                               SUM(positive) AS positive, SUM(negative) AS negative,
+                               SUM(recommendations) AS recommendations
+                        FROM scores_and_ranks GROUP BY app_id
+                    ) s ON s.app_id = g.app_id
+                    LEFT JOIN (
+                        SELECT app_id, AVG(metacritic_score) AS metacritic_score
+                        FROM metacritic GROUP BY app_id
+                    ) m ON m.app_id = g.app_id
+                ) TO STDOUT WITH (FORMAT csv, NULL 'nan')
+                """,
+                buffer,
+            )
+
+        buffer.seek(0)
+        if buffer.getvalue():
+            data = np.loadtxt(buffer, delimiter=",", dtype=dtype, ndmin=2)
+        else:
+            data = np.empty((0, len(columns)), dtype=dtype)
+        buffer.close()
+
+        if data.nbytes > budget:
+            raise ValueError(
+                f"El snapshot ocupa {data.nbytes // (1024 * 1024)} MB, "
+                f"supera el límite de {SNAPSHOT_CONFIG['max_memory_mb']} MB"
+            )
+        return CatalogSnapshot(np.asfortranarray(data), columns, version)
+
+    @staticmethod
+    def histogram(
+        column: str, bins: Optional[int] = None, value_range: Optional[tuple] = None
+    ) -> Dict:
+        """Histograma de una columna; los valores nulos se informan aparte"""
+        values = SnapshotAnalyticsService.get_snapshot().column(column)
+        finite = values[np.isfinite(values)]
+        counts, edges = np.histogram(
+            finite, bins=bins or SNAPSHOT_CONFIG["histogram_bins"], range=value_range
+        )
+        return {
+            "column": column,
+            "edges": edges.round(2).tolist(),
+            "counts": counts.tolist(),
+            "missing": int(values.size - finite.size),
+        }
+
+    @staticmethod
+    def quantiles(column: str, probabilities: Optional[Sequence[float]] = None) -> Dict:
+        """Cuantiles de una columna ignorando nulos"""
+        probabilities = list(probabilities or SNAPSHOT_CONFIG["quantiles"])
+        values = SnapshotAnalyticsService.get_snapshot().column(column)
+        finite = values[np.isfinite(values)]
+        if not finite.size:
+            result = [None] * len(probabilities)
+        else:
+            result = np.quantile(finite, probabilities).round(2).tolist()
+        return {
+            "column": column,
+            "quantiles": dict(zip([str(p) for p in probabilities], result)),
+            "count": int(finite.size),
+        }
+
+    @staticmethod
+    def correlation(columns: Sequence[str]) -> Dict:
+        """Matriz de Pearson con pares completos (cada par usa sus filas no nulas)"""
+        snapshot = SnapshotAnalyticsService.get_snapshot()
+        values = [snapshot.column(name) for name in columns]
+        finite = [np.isfinite(column) for column in values]
+
+        matrix = []
+        for i, x in enumerate(values):
+            row = []
+            for j, y in enumerate(values):
+                mask = finite[i] & finite[j]
+                row.append(SnapshotAnalyticsService._pearson(x[mask], y[mask]))
+            matrix.append(row)
+        return {"columns": list(columns), "matrix": matrix}
+
+    @staticmethod
+    def group_by(
+        key: str,
+        value: str,
+        aggregation: str = "mean",
+        bins: Optional[Sequence[float]] = None,
+    ) -> Dict:
+        """Agrega value por cada valor de key (o por intervalos de key si hay bins)"""
+        if aggregation not in SnapshotAnalyticsService.AGGREGATIONS:
+            raise ValueError(f"Agregación '{aggregation}' no soportada")
+
+        snapshot = SnapshotAnalyticsService.get_snapshot()
+        keys = snapshot.column(key)
+        values = snapshot.column(value)
+        mask = np.isfinite(keys) & np.isfinite(values)
+        keys, values = keys[mask], values[mask]
+
+        if bins is not None:
+            edges = np.asarray(bins, dtype=keys.dtype)
+            codes = np.digitize(keys, edges)
+            labels = [
+                SnapshotAnalyticsService._bin_label(edges, code)
+                for code in range(len(edges) + 1)
+            ]
+            groups, inverse = np.unique(codes, return_inverse=True)
+            group_labels = [labels[code] for code in groups]
+        else:
+            groups, inverse = np.unique(keys, return_inverse=True)
+            group_labels = groups.tolist()
+
+        counts = np.bincount(inverse, minlength=groups.size)
+        if not groups.size:
+            aggregated = counts
+        elif aggregation == "count":
+            aggregated = counts
+        elif aggregation == "sum":
+            aggregated = np.bincount(inverse, weights=values, minlength=groups.size)
+        elif aggregation == "mean":
+            sums = np.bincount(inverse, weights=values, minlength=groups.size)
+            aggregated = sums / counts
+        else:
+            # Ordenar por grupo y valor deja cada grupo como un segmento contiguo
+            order = np.lexsort((values, inverse))
+            sorted_values = values[order]
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            lower = sorted_values[starts + (counts - 1) // 2]
+            upper = sorted_values[starts + counts // 2]
+            aggregated = (lower + upper) / 2
+
+        return {
+            "key": key,
+            "value": value,
+            "aggregation": aggregation,
+            "groups": [
+                {"key": label, "count": int(count), "value": round(float(total), 2)}
+                for label, count, total in zip(group_labels, counts, aggregated)
+            ],
+        }
+
+    @staticmethod
+    def get_summary() -> Dict:
+        """Resumen para la vista: histograma de precios, cuantiles y correlaciones"""
+        snapshot = SnapshotAnalyticsService.get_snapshot()
+        return {
+            "rows": snapshot.rows,
+            "memory_mb": round(snapshot.nbytes / (1024 * 1024), 2),
+            "data_version": snapshot.version,
+            "price_histogram": SnapshotAnalyticsService.histogram("price"),
+            "playtime_quantiles": SnapshotAnalyticsService.quantiles(
+                "avg_playtime_forever"
+            ),
+            "correlation": SnapshotAnalyticsService.correlation(
+                ["price", "user_score", "metacritic_score", "avg_playtime_forever"]
+            ),
+            "score_by_year": SnapshotAnalyticsService.group_by(
+                "release_year", "user_score", "mean"
+            ),
+        }
+
+    @staticmethod
+    def _pearson(x, y) -> Optional[float]:
+        if x.size < 2:
+            return None
+        x = x - x.mean()
+        y = y - y.mean()
+        denominator = np.sqrt((x * x).sum() * (y * y).sum())
+        if not denominator:
+            return None
+        return round(float((x * y).sum() / denominator), 4)
+
+    @staticmethod
+    def _bin_label(edges, code: int) -> str:
+        if code == 0:
+            return f"< {edges[0]:g}"
+        if code == len(edges):
+            return f">= {edges[-1]:g}"
+        return f"{edges[code - 1]:g} - {edges[code]:g}"
@@ -0,0 +1,102 @@
+from django.db import transaction
+from django.core.exceptions import ValidationError
+from .game_service import GameService
+from .game_cache_service import GameCacheService
+from typing import Dict, List
+
+
+class ChildCollectionService:
+    # Sincroniza colecciones hijas de valores (géneros, categorías, etc.) aplicando
+    # solo la diferencia: un SELECT, un DELETE filtrado y un bulk_create
+
+    @staticmethod
+    def sync_collection(app_id: str, collection: str, values: List[str]) -> Dict:
+        # Deja la colección del juego igual a los valores dados
+        with transaction.atomic():
+            if not GameService.get_game(app_id):
+                raise ValidationError(f"El juego con ID {app_id} no existe")
+
+            result = ChildCollectionService.sync_collection_bulk(
+                collection, {app_id: values}
+            )
+            return result[app_id]
+
+    @staticmethod
+    def sync_collections(app_id: str, collections: Dict[str, List[str]]) -> Dict:
+        # Sincroniza varias colecciones; las que no se envían no se modifican
+        with transaction.atomic():
+            return {
+                collection: ChildCollectionService.sync_collection(
+                    app_id, collection, values
+                )
+                for collection, values in collections.items()
+                if values is not None
+            }
+
+    @staticmethod
+    def sync_collection_bulk(
+        collection: str, values_by_app: Dict[str, List[str]]
+    ) -> Dict[str, Dict]:
+        # Igual que sync_collection para muchos juegos a la vez; no verifica que
+        # los juegos existan, eso queda a cargo de quien llama
+        if collection not in GameService.CHILD_COLLECTIONS:
+            raise ValidationError(f"Colección '{collection}' no soportada")
+        model, column = GameService.CHILD_COLLECTIONS[collection]
+
+        wanted = {
+            str(app_id): ChildCollectionService.clean_values(values)
+            for app_id, values in values_by_app.items()
+        }
+
+        # Se conserva una fila por valor deseado; el resto (quitados,
+        # duplicados o nulos) se elimina
+        wanted_sets = {app_id: set(values) for app_id, values in wanted.items()}
+        kept = {app_id: set() for app_id in wanted}
+        to_delete = []
+        removed = dict.fromkeys(wanted, 0)
+        for row_id, app_id, value in model.objects.filter(
+            app_id__in=list(wanted)
+        ).values_list("id", "app_id", column):
+            if value in wanted_sets[app_id] and value not in kept[app_id]:
+                kept[app_id].add(value)
+            else:
+                to_delete.append(row_id)
+                removed[app_id] += 1
+
+        added = {
+            app_id: [value for value in values if value not in kept[app_id]]
+            for app_id, values in wanted.items()
+        }
+
+        with transaction.atomic():
+            if to_delete:
+                model.objects.filter(id__in=to_delete).delete()
+            new_rows = [
+                model(app_id=app_id, **{column: value})
+                for app_id, values in added.items()
+                for value in values
+            ]
+            if new_rows:
+                model.objects.bulk_create(new_rows)
+
+            changed = [app_id for app_id in wanted if added[app_id] or removed[app_id]]
+            if changed:
+                GameCacheService.invalidate_many_on_commit(changed)
+
+        return {
+            app_id: {
+                "values": values,
+                "added": added[app_id],
+                "removed": removed[app_id],
+            }
+            for app_id, values in wanted.items()
+        }
+
+    @staticmethod
+    def clean_values(values: List[str]) -> List[str]:
+        # Sin espacios extremos, sin vacíos y sin repetidos, conservando el orden
+        return list(
+            dict.fromkeys(
+                value.strip() for value in values or [] if value and value.strip()
+            )
+        )
@@ -0,0 +1,130 @@
+import csv
+import io
+import json
+import zlib
+from django.db.models import QuerySet, prefetch_related_objects
+from typing import Dict, Iterable, Iterator, List
+
+from ..config import EXPORT_CONFIG
+
+
+class ExportService:
+    """Exportación en streaming de juegos a CSV o JSON Lines"""
+
+    COLUMNS = [
+        "app_id",
+        "name",
+        "rel_date",
+        "req_age",
+        "price",
+        "dlc_count",
+        "achievements",
+        "estimated_owners",
+        "genres",
+        "developers",
+        "publishers",
+    ]
+
+    # Relaciones hijas exportadas como listas: (prefetch, columna, campo)
+    CHILD_COLUMNS = [
+        ("genres_set", "genres", "genre"),
+        ("developers_set", "developers", "developer"),
+        ("publishers_set", "publishers", "publisher"),
+    ]
+
+    LIST_SEPARATOR = "; "
+
+    @staticmethod
+    def iter_rows(games) -> Iterator[Dict]:
+        """Recorre los juegos por lotes con cursor del servidor y sus relaciones"""
+        chunk_size = EXPORT_CONFIG["chunk_size"]
+        prefetch = [
+            relation for relation, _column, _field in ExportService.CHILD_COLUMNS
+        ]
+
+        if isinstance(games, QuerySet):
+            # iterator() con prefetch_related resuelve cada relación una vez por lote
+            iterable = games.prefetch_related(*prefetch).iterator(chunk_size=chunk_size)
+        else:
+            games = list(games)
+            prefetch_related_objects(games, *prefetch)
+            iterable = games
+
+        for game in iterable:
+            yield ExportService._serialize(game)
+
+    @staticmethod
+    def stream_csv(games) -> Iterator[str]:
+        """Genera el CSV en bloques, con cabecera"""
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=ExportService.COLUMNS)
+        writer.writeheader()
+
+        for rows in ExportService._batched(ExportService.iter_rows(games)):
+            for row in rows:
+                row = {
+                    key: (
+                        ExportService.LIST_SEPARATOR.join(value)
+                        if isinstance(value, list)
+                        else value
+                    )
+                    for key, value in row.items()
+                }
+                writer.writerow(row)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+        remaining = buffer.getvalue()
+        if remaining:
+            yield remaining
+
+    @staticmethod
+    def stream_jsonl(games) -> Iterator[str]:
+        """Genera un objeto JSON por línea"""
+        for rows in ExportService._batched(ExportService.iter_rows(games)):
+            yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+    @staticmethod
+    def gzip_stream(chunks: Iterable[str]) -> Iterator[bytes]:
+        """Comprime al vuelo un flujo de texto en formato gzip"""
+        compressor = zlib.compressobj(
+            EXPORT_CONFIG["gzip_level"], zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+        for chunk in chunks:
+            data = compressor.compress(chunk.encode("utf-8"))
+            if data:
+                yield data
+        yield compressor.flush()
+
+    @staticmethod
+    def _serialize(game) -> Dict:
+        row = {
+            "app_id": game.app_id,
+            "name": game.name,
+            "rel_date": game.rel_date.isoformat() if game.rel_date else None,
+            "req_age": game.req_age,
+            "price": str(game.price) if game.price is not None else None,
+            "dlc_count": game.dlc_count,
+            "achievements": game.achievements,
+            "estimated_owners": game.estimated_owners,
+        }
+        for relation, column, field in ExportService.CHILD_COLUMNS:
+            row[column] = [
+                getattr(child, field)
+                for child in getattr(game, relation).all()
+                if getattr(child, field)
+            ]
+        return row
+
+    @staticmethod
+    def _batched(rows: Iterator[Dict]) -> Iterator[List[Dict]]:
+        """Agrupa filas para emitir bloques de texto en lugar de una fila por vez"""
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= EXPORT_CONFIG["chunk_size"]:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
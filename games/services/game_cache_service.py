@@ -0,0 +1,164 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.utils.module_loading import import_string
+from typing import Any, Callable, List, Optional
+
+from ..config import GAME_CACHE_CONFIG
+
+
+class LRUCacheBackend:
+    """Backend en memoria del proceso con política LRU y vencimiento"""
+
+    def __init__(self, max_entries: int = 5000, ttl: int = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DjangoCacheBackend:
+    """Backend sobre el framework de caché de Django (compartido entre procesos)"""
+
+    def __init__(self, alias: str = "default", ttl: int = 300):
+        self.cache = caches[alias]
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.cache.get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self.cache.set(key, value, self.ttl)
+
+    def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+
+class GameCacheService:
+    """Caché de lectura por juego con invalidación al confirmar escrituras"""
+
+    _backend = None
+    _backend_lock = threading.Lock()
+
+    @staticmethod
+    def get_backend():
+        """Instancia perezosamente el backend configurado"""
+        if GameCacheService._backend is None:
+            with GameCacheService._backend_lock:
+                if GameCacheService._backend is None:
+                    backend_class = import_string(GAME_CACHE_CONFIG["backend"])
+                    GameCacheService._backend = backend_class(
+                        **GAME_CACHE_CONFIG["options"]
+                    )
+        return GameCacheService._backend
+
+    @staticmethod
+    def get_or_load(app_id: str, section: str, loader: Callable[[], Any]) -> Any:
+        """Devuelve la sección cacheada o la carga con loader; None no se cachea"""
+        # Dentro de una transacción se lee de la base: la caché podría estar
+        # desactualizada respecto de escrituras aún no confirmadas, y lo leído
+        # no debe cachearse antes del commit
+        if not GAME_CACHE_CONFIG["enabled"] or connection.in_atomic_block:
+            return loader()
+
+        backend = GameCacheService.get_backend()
+        key = GameCacheService._key(app_id, section)
+
+        cached = backend.get(key)
+        if cached is not None:
+            return pickle.loads(cached)
+
+        value = loader()
+        if value is not None:
+            # Se guarda serializado: cada lector recibe su propia copia
+            backend.set(key, pickle.dumps(value))
+        return value
+
+    @staticmethod
+    def invalidate(app_id: str) -> None:
+        """Descarta todas las secciones cacheadas de un juego"""
+        GameCacheService.invalidate_many([app_id])
+
+    @staticmethod
+    def invalidate_many(app_ids: List[str]) -> None:
+        """Incrementa la generación de cada juego en la caché compartida"""
+        # Una nueva generación deja inaccesibles las entradas anteriores en
+        # todos los procesos, incluidas las que un lector concurrente esté
+        # guardando con la generación vieja
+        generations = GameCacheService._generations()
+        for app_id in {str(app_id) for app_id in app_ids}:
+            key = GameCacheService._generation_key(app_id)
+            try:
+                generations.incr(key)
+            except ValueError:
+                # Clave vencida o desalojada: un valor inicial nuevo nunca
+                # coincide con una generación anterior
+                generations.add(key, time.time_ns(), None)
+
+    @staticmethod
+    def invalidate_on_commit(app_id: str) -> None:
+        """Invalida el juego cuando se confirme la transacción en curso"""
+        transaction.on_commit(lambda: GameCacheService.invalidate(app_id))
+
+    @staticmethod
+    def invalidate_many_on_commit(app_ids: List[str]) -> None:
+        """Invalida varios juegos con un único callback al confirmar"""
+        app_ids = list(app_ids)
+        transaction.on_commit(lambda: GameCacheService.invalidate_many(app_ids))
+
+    @staticmethod
+    def _generations():
+        return caches[GAME_CACHE_CONFIG["generation_cache"]]
+
+    @staticmethod
+    def _key(app_id: str, section: str) -> str:
+        # La generación se lee de la caché compartida: un acierto no consulta
+        # la base de datos
+        generations = GameCacheService._generations()
+        generation_key = GameCacheService._generation_key(app_id)
+
+        generation = generations.get(generation_key)
+        if generation is None:
+            generations.add(generation_key, time.time_ns(), None)
+            generation = generations.get(generation_key)
+
+        return f"games:game:{app_id}:{generation}:{section}"
+
+    @staticmethod
+    def _generation_key(app_id: str) -> str:
+        return f"games:game:{app_id}:generation"
@@ -0,0 +1,105 @@
+from django.db import connection
+from typing import Dict, Iterable, List, Optional
+
+
+class GameDetailService:
+    """Arma el documento completo de un juego en una sola consulta SQL"""
+
+    # sección -> (tabla, tipo, columna); tipo: "values" lista de valores,
+    # "object" primera fila como objeto, "objects" lista de filas
+    SECTIONS = {
+        "genres": ("genres", "values", "genre"),
+        "categories": ("categories", "values", "category"),
+        "developers": ("developers", "values", "developer"),
+        "publishers": ("publishers", "values", "publisher"),
+        "languages": ("languages", "values", "language"),
+        "audio_languages": ("audio_languages", "values", "audio_language"),
+        "reviews": ("reviews", "values", "reviews"),
+        "platforms": ("platforms", "object", None),
+        "playtime": ("playtime", "object", None),
+        "metacritic": ("metacritic", "object", None),
+        "scores_and_ranks": ("scores_and_ranks", "object", None),
+        "urls": ("urls", "object", None),
+        "about_game": ("about_game", "object", None),
+        "packages": ("packages", "objects", None),
+    }
+
+    # Columnas internas que no forman parte del documento
+    HIDDEN_COLUMNS = ("id", "app_id", "search_vector")
+
+    @staticmethod
+    def resolve_sections(
+        fields: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """Normaliza la selección de secciones pedida por el cliente"""
+        sections = list(GameDetailService.SECTIONS)
+        if fields:
+            fields = set(fields)
+            sections = [section for section in sections if section in fields]
+        if exclude:
+            exclude = set(exclude)
+            sections = [section for section in sections if section not in exclude]
+        return sections
+
+    @staticmethod
+    def get_game_document(
+        app_id: str, sections: Optional[List[str]] = None
+    ) -> Optional[Dict]:
+        """Obtiene el juego y las secciones pedidas; None si el juego no existe"""
+        if sections is None:
+            sections = list(GameDetailService.SECTIONS)
+
+        sql = GameDetailService._build_sql(sections)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [app_id])
+            row = cursor.fetchone()
+
+        if not row:
+            return None
+
+        document = row[0]
+        for section, value in zip(sections, row[1:]):
+            document[section] = value
+        return document
+
+    @staticmethod
+    def _build_sql(sections: List[str]) -> str:
+        """Un LEFT JOIN LATERAL con jsonb_agg por cada sección pedida"""
+        hidden = " ".join(
+            f"- '{column}'" for column in GameDetailService.HIDDEN_COLUMNS
+        )
+
+        columns = ["to_jsonb(g) AS game"]
+        joins = []
+        for section in sections:
+            table, kind, column = GameDetailService.SECTIONS[section]
+            alias = f"s_{section}"
+
+            if kind == "values":
+                data = (
+                    f"COALESCE(jsonb_agg(c.{column} ORDER BY c.{column}) "
+                    f"FILTER (WHERE c.{column} IS NOT NULL), '[]'::jsonb)"
+                )
+                source = (
+                    f"SELECT {data} AS data FROM {table} c WHERE c.app_id = g.app_id"
+                )
+            elif kind == "objects":
+                data = f"COALESCE(jsonb_agg(to_jsonb(c) {hidden} ORDER BY c.id), '[]'::jsonb)"
+                source = (
+                    f"SELECT {data} AS data FROM {table} c WHERE c.app_id = g.app_id"
+                )
+            else:
+                source = (
+                    f"SELECT to_jsonb(c) {hidden} AS data FROM {table} c "
+                    f"WHERE c.app_id = g.app_id ORDER BY c.id LIMIT 1"
+                )
+
+            columns.append(f"{alias}.data AS {section}")
+            joins.append(f"LEFT JOIN LATERAL ({source}) {alias} ON true")
+
+        return f"""
+            SELECT {", ".join(columns)}
+            FROM games g
+            {" ".join(joins)}
+            WHERE g.app_id = %s
+        """
@@ -1,11 +1,32 @@
 
-from django.db import transaction
+from django.db import connection, transaction
 from django.core.exceptions import ValidationError
-from ..models import Games
+from ..models import (
+    Games,
+    Genres,
+    Categories,
+    Developers,
+    Publishers,
+    Languages,
+    AudioLanguages,
+)
+from ..config import BATCH_LOOKUP_CONFIG
+from .search import AutocompleteService, FuzzySearchService, SearchQueryCompiler
+from .game_cache_service import GameCacheService
 from typing import Dict, List, Optional
 
 
 class GameService:
+    # Colecciones hijas disponibles en la consulta por lotes: (modelo, columna)
+    CHILD_COLLECTIONS = {
+        "genres": (Genres, "genre"),
+        "categories": (Categories, "category"),
+        "developers": (Developers, "developer"),
+        "publishers": (Publishers, "publisher"),
+        "languages": (Languages, "language"),
+        "audio_languages": (AudioLanguages, "audio_language"),
+    }
+
     @staticmethod
     def create_game(game_data: Dict) -> Games:
         #Crea un nuevo juego con validaciones
@@ -17,31 +38,145 @@ class GameService:
                 )
 
             game = Games.objects.create(**game_data)
+
+            # Las sugerencias por prefijo deben incluir el nuevo nombre
+            transaction.on_commit(
+                lambda: AutocompleteService.invalidate_name(game.name)
+            )
+            GameCacheService.invalidate_on_commit(game.app_id)
             return game
 
     @staticmethod
-    def update_game(app_id: str, game_data: Dict) -> Games:
-        #Actualiza un juego existente
-        with transaction.atomic():
-            try:
-                game = Games.objects.get(app_id=app_id)
-                for field, value in game_data.items():
-                    setattr(game, field, value)
-                game.save()
-                return game
-            except Games.DoesNotExist:
+    def update_game(
+        app_id: str, game_data: Dict, expected_version: Optional[int] = None
+    ) -> Games:
+        #Actualiza solo los campos recibidos con un único UPDATE ... RETURNING
+        #Si se indica expected_version y el juego cambió desde entonces, falla
+        #en lugar de pisar la edición concurrente
+        fields = {
+            name: value
+            for name, value in game_data.items()
+            if not (name == "app_id" and str(value) == str(app_id))
+        }
+        editable = GameService._editable_fields()
+        unknown = [name for name in fields if name not in editable]
+        if unknown:
+            raise ValidationError(f"Campos no editables: {', '.join(unknown)}")
+
+        assignments = [
+            f'"{Games._meta.get_field(name).column}" = %s' for name in fields
+        ]
+        params = [
+            Games._meta.get_field(name).get_db_prep_save(value, connection)
+            for name, value in fields.items()
+        ]
+        assignments.append('"version" = g."version" + 1')
+
+        where = 'g."app_id" = %s'
+        params.append(app_id)
+        if expected_version is not None:
+            where += ' AND g."version" = %s'
+            params.append(int(expected_version))
+
+        columns = [field.column for field in Games._meta.concrete_fields]
+        returning = ", ".join(f'g."{column}"' for column in columns)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            # "old" es la fila anterior a la actualización: da el nombre previo
+            cursor.execute(
+                f"""
+                UPDATE {Games._meta.db_table} AS g SET {", ".join(assignments)}
+                FROM {Games._meta.db_table} AS old
+                WHERE {where} AND old."app_id" = g."app_id"
+                RETURNING {returning}, old."name"
+                """,
+                params,
+            )
+            row = cursor.fetchone()
+
+            if row is None:
+                if Games.objects.filter(app_id=app_id).exists():
+                    raise ValidationError(
+                        f"El juego con ID {app_id} fue modificado por otro usuario; "
+                        "recarga los datos e intenta de nuevo"
+                    )
                 raise ValidationError(f"El juego con ID {app_id} no existe")
 
+            game = Games.from_db(
+                connection.alias,
+                [field.attname for field in Games._meta.concrete_fields],
+                row[:-1],
+            )
+            old_name = row[-1]
+            GameCacheService.invalidate_on_commit(app_id)
+
+            if game.name != old_name:
+                transaction.on_commit(
+                    lambda: AutocompleteService.invalidate_name(old_name)
+                )
+                transaction.on_commit(
+                    lambda: AutocompleteService.invalidate_name(game.name)
+                )
+            return game
+
     @staticmethod
     def get_game(app_id: str) -> Optional[Games]:
-        #Obtiene un juego por su ID
-        try:
-            return Games.objects.get(app_id=app_id)
-        except Games.DoesNotExist:
-            return None
+        #Obtiene un juego por su ID (lectura a través de la caché por juego)
+        def load():
+            try:
+                return Games.objects.get(app_id=app_id)
+            except Games.DoesNotExist:
+                return None
+
+        return GameCacheService.get_or_load(app_id, "game", load)
 
     @staticmethod
     def search_games(field: str, query: str) -> List[Games]:
         #Busca juegos por campo y término
-        filter_kwargs = {f"{field}__icontains": query}
-        return Games.objects.filter(**filter_kwargs)
+        if field == "name_fuzzy":
+            return FuzzySearchService.search_by_name(query)
+
+        return SearchQueryCompiler.search({field: query})
+
+    @staticmethod
+    def _editable_fields() -> List[str]:
+        return [
+            field.name
+            for field in Games._meta.concrete_fields
+            if field.editable and not field.primary_key
+        ]
+
+    @staticmethod
+    def get_games_bulk(app_ids: List[str], include: List[str] = None) -> Dict:
+        #Obtiene muchos juegos en una consulta, más una consulta por colección hija
+        app_ids = list(dict.fromkeys(str(app_id) for app_id in app_ids if app_id))
+        if len(app_ids) > BATCH_LOOKUP_CONFIG["max_ids"]:
+            raise ValidationError(
+                f"Se admiten hasta {BATCH_LOOKUP_CONFIG['max_ids']} IDs por consulta"
+            )
+
+        include = [
+            name for name in include or [] if name in GameService.CHILD_COLLECTIONS
+        ]
+
+        games = {
+            row["app_id"]: row
+            for row in Games.objects.filter(app_id__in=app_ids).values()
+        }
+
+        for name in include:
+            model, column = GameService.CHILD_COLLECTIONS[name]
+            for game in games.values():
+                game[name] = []
+
+            children = (
+                model.objects.filter(
+                    app_id__in=list(games), **{f"{column}__isnull": False}
+                )
+                .order_by("app_id", column)
+                .values_list("app_id", column)
+            )
+            for app_id, value in children:
+                games[app_id][name].append(value)
+
+        return games
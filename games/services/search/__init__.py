@@ -0,0 +1,18 @@
+from games.services.search.fuzzy_search_service import FuzzySearchService
+from games.services.search.fulltext_search_service import FullTextSearchService
+from games.services.search.keyset_pagination_service import KeysetPaginationService
+from games.services.search.count_service import CountService, CountStrategyPaginator
+from games.services.search.query_compiler import SearchQueryCompiler
+from games.services.search.autocomplete_service import AutocompleteService
+from games.services.search.facet_service import FacetService
+
+__all__ = [
+    "FuzzySearchService",
+    "FullTextSearchService",
+    "KeysetPaginationService",
+    "CountService",
+    "CountStrategyPaginator",
+    "SearchQueryCompiler",
+    "AutocompleteService",
+    "FacetService",
+]
@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import OrderedDict
+from django.db import connection
+from typing import Dict, List, Optional
+
+from games.config import AUTOCOMPLETE_CONFIG
+
+
+class AutocompleteService:
+    """Sugerencias de nombres de juegos por prefijo con caché de prefijos frecuentes"""
+
+    # prefijo -> (momento de carga, sugerencias); ordenado por uso reciente
+    _cache: "OrderedDict[str, tuple]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def suggest(prefix: str, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """Devuelve los primeros juegos cuyo nombre comienza con el prefijo"""
+        prefix = (prefix or "").strip().lower()
+        if not prefix:
+            return []
+
+        if limit is None:
+            limit = AUTOCOMPLETE_CONFIG["limit"]
+        limit = max(1, min(limit, AUTOCOMPLETE_CONFIG["max_limit"]))
+
+        suggestions = AutocompleteService._get_cached(prefix)
+        if suggestions is None:
+            # Se guarda siempre el máximo para servir cualquier límite desde caché
+            suggestions = AutocompleteService._query_prefix(
+                prefix, AUTOCOMPLETE_CONFIG["max_limit"]
+            )
+            AutocompleteService._set_cached(prefix, suggestions)
+
+        return suggestions[:limit]
+
+    @staticmethod
+    def invalidate_name(name: Optional[str]) -> None:
+        """Descarta los prefijos cacheados que podrían incluir este nombre"""
+        if not name:
+            return
+
+        name = name.lower()
+        with AutocompleteService._lock:
+            for prefix in [p for p in AutocompleteService._cache if name.startswith(p)]:
+                del AutocompleteService._cache[prefix]
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Vacía la caché de prefijos"""
+        with AutocompleteService._lock:
+            AutocompleteService._cache.clear()
+
+    @staticmethod
+    def _query_prefix(prefix: str, limit: int) -> List[Dict[str, str]]:
+        """Consulta por prefijo resuelta y ordenada por el índice text_pattern_ops"""
+        pattern = f"{AutocompleteService._escape_like(prefix)}%"
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT app_id, name
+                FROM games
+                WHERE lower(name) LIKE %s
+                ORDER BY lower(name) USING ~<~
+                LIMIT %s
+                """,
+                [pattern, limit],
+            )
+            return [{"app_id": row[0], "name": row[1]} for row in cursor.fetchall()]
+
+    @staticmethod
+    def _get_cached(prefix: str) -> Optional[List[Dict[str, str]]]:
+        with AutocompleteService._lock:
+            entry = AutocompleteService._cache.get(prefix)
+            if entry is None:
+                return None
+
+            loaded_at, suggestions = entry
+            if time.monotonic() - loaded_at > AUTOCOMPLETE_CONFIG["cache_ttl"]:
+                del AutocompleteService._cache[prefix]
+                return None
+
+            AutocompleteService._cache.move_to_end(prefix)
+            return suggestions
+
+    @staticmethod
+    def _set_cached(prefix: str, suggestions: List[Dict[str, str]]) -> None:
+        with AutocompleteService._lock:
+            AutocompleteService._cache[prefix] = (time.monotonic(), suggestions)
+            AutocompleteService._cache.move_to_end(prefix)
+            while len(AutocompleteService._cache) > AUTOCOMPLETE_CONFIG["cache_size"]:
+                AutocompleteService._cache.popitem(last=False)
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        """Escapa comodines de LIKE para buscar el texto literal"""
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
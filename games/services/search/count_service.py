@@ -0,0 +1,164 @@
+import hashlib
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connection
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from typing import Dict, Optional
+
+from games.config import COUNT_STRATEGY_CONFIG
+
+
+class CountService:
+    """Estrategias de conteo para resultados paginados"""
+
+    TABLE_ESTIMATE = "table_estimate"
+    PLANNER_ESTIMATE = "planner_estimate"
+    EXACT = "exact"
+    CACHED = "cached"
+
+    @staticmethod
+    def count(queryset: QuerySet, cache_key_parts: Optional[tuple] = None) -> Dict:
+        """Cuenta filas eligiendo entre estimación, conteo exacto o caché"""
+        queryset = queryset.order_by()
+
+        filtered = bool(queryset.query.where)
+
+        # Sin filtros: la estadística de la tabla es suficiente
+        if not filtered:
+            estimate = CountService.get_table_estimate(queryset.model._meta.db_table)
+            if estimate is not None:
+                return {"count": estimate, "strategy": CountService.TABLE_ESTIMATE}
+
+        # Un conteo exacto reciente evita volver a consultar al planificador
+        key = CountService._cache_key(queryset, cache_key_parts)
+        cached = cache.get(key)
+        if cached is not None:
+            return {"count": cached, "strategy": CountService.CACHED}
+
+        # Filtros amplios: se confía en la estimación del planificador. Sin
+        # filtros (tabla nunca analizada) EXPLAIN no aporta: se cuenta directamente
+        if filtered:
+            estimate = CountService.get_planner_estimate(queryset)
+            if (
+                estimate is not None
+                and estimate > COUNT_STRATEGY_CONFIG["exact_threshold"]
+            ):
+                return {"count": estimate, "strategy": CountService.PLANNER_ESTIMATE}
+
+        # Filtros selectivos: conteo exacto con caché de vida corta
+
+        exact = queryset.count()
+        cache.set(key, exact, COUNT_STRATEGY_CONFIG["cache_ttl"])
+        return {"count": exact, "strategy": CountService.EXACT}
+
+    @staticmethod
+    def get_table_estimate(table_name: str) -> Optional[int]:
+        """Obtiene pg_class.reltuples; None si la tabla nunca fue analizada"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT c.reltuples::bigint
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relname = %s
+                """,
+                ["steam", table_name],
+            )
+            row = cursor.fetchone()
+
+        if not row or row[0] < 0:
+            return None
+        return row[0]
+
+    @staticmethod
+    def get_planner_estimate(queryset: QuerySet) -> Optional[int]:
+        """Obtiene las filas estimadas por EXPLAIN para la consulta"""
+        sql, params = queryset.query.sql_with_params()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            row = cursor.fetchone()
+
+        try:
+            return int(row[0][0]["Plan"]["Plan Rows"])
+        except (TypeError, KeyError, IndexError, ValueError):
+            return None
+
+    @staticmethod
+    def _cache_key(queryset: QuerySet, cache_key_parts: Optional[tuple]) -> str:
+        """Clave de caché a partir de la tupla de filtros o del SQL compilado"""
+        if cache_key_parts is None:
+            sql, params = queryset.query.sql_with_params()
+            cache_key_parts = (sql, params)
+
+        digest = hashlib.md5(repr(cache_key_parts).encode("utf-8")).hexdigest()
+        return f"games:count:{digest}"
+
+
+class EstimatedCountPage(Page):
+    """Página de un total estimado: la siguiente se detecta leyendo una fila extra"""
+
+    def __init__(self, object_list, number, paginator, has_more: bool):
+        super().__init__(object_list, number, paginator)
+        self.has_more = has_more
+
+    def has_next(self):
+        return self.has_more
+
+    def end_index(self):
+        return (self.number - 1) * self.paginator.per_page + len(self.object_list)
+
+
+class CountStrategyPaginator(Paginator):
+    """Paginator que delega el total en CountService y expone la estrategia
+
+    Con un total estimado, la estimación es solo una etiqueta: no limita el
+    número de página y cada página lee per_page + 1 filas para saber si hay
+    una siguiente.
+    """
+
+    def __init__(self, object_list, per_page, cache_key_parts=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.cache_key_parts = cache_key_parts
+        self.count_strategy = CountService.EXACT
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return len(self.object_list)
+
+        result = CountService.count(self.object_list, self.cache_key_parts)
+        self.count_strategy = result["strategy"]
+        return result["count"]
+
+    @property
+    def is_estimated(self) -> bool:
+        self.count  # Resuelve la estrategia si aún no se contó
+        return self.count_strategy in (
+            CountService.TABLE_ESTIMATE,
+            CountService.PLANNER_ESTIMATE,
+        )
+
+    def validate_number(self, number):
+        if not self.is_estimated:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        if not self.is_estimated:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        return EstimatedCountPage(
+            rows[: self.per_page], number, self, len(rows) > self.per_page
+        )
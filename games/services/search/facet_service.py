@@ -0,0 +1,231 @@
+import datetime
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from typing import Dict, List, Optional
+
+from games.config import FACET_CONFIG
+from games.models import Categories, Games, Genres, Languages, Platforms
+
+
+class FacetService:
+    """Filtros facetados del catálogo y conteos por faceta en una sola consulta"""
+
+    # faceta -> (parámetro de filtro, etiqueta)
+    FACETS = {
+        "genre": ("genre_filter", "Género"),
+        "category": ("category_filter", "Categoría"),
+        "platform": ("platform_filter", "Plataforma"),
+        "language": ("language_filter", "Idioma"),
+        "price": ("price_filter", "Precio"),
+        "year": ("year_filter", "Año de lanzamiento"),
+    }
+
+    PLATFORMS = {"windows": "Windows", "mac": "Mac", "linux": "Linux"}
+
+    CATALOG_CACHE_KEY = "games:facets:catalog"
+
+    @staticmethod
+    def filter_queryset(queryset: QuerySet, filters: Dict[str, str]) -> QuerySet:
+        """Aplica los filtros facetados con EXISTS para no duplicar juegos"""
+        if filters.get("genre_filter"):
+            queryset = queryset.filter(
+                Exists(
+                    Genres.objects.filter(
+                        app=OuterRef("pk"), genre=filters["genre_filter"]
+                    )
+                )
+            )
+
+        if filters.get("category_filter"):
+            queryset = queryset.filter(
+                Exists(
+                    Categories.objects.filter(
+                        app=OuterRef("pk"), category=filters["category_filter"]
+                    )
+                )
+            )
+
+        if filters.get("language_filter"):
+            queryset = queryset.filter(
+                Exists(
+                    Languages.objects.filter(
+                        app=OuterRef("pk"), language=filters["language_filter"]
+                    )
+                )
+            )
+
+        platform = filters.get("platform_filter")
+        if platform in FacetService.PLATFORMS:
+            queryset = queryset.filter(
+                Exists(Platforms.objects.filter(app=OuterRef("pk"), **{platform: True}))
+            )
+
+        price_predicate = FacetService._price_predicate(filters.get("price_filter"))
+        if price_predicate is not None:
+            queryset = queryset.filter(price_predicate)
+
+        year = FacetService._parse_year(filters.get("year_filter"))
+        if year is not None:
+            queryset = queryset.filter(
+                rel_date__gte=datetime.date(year, 1, 1),
+                rel_date__lt=datetime.date(year + 1, 1, 1),
+            )
+
+        if filters.get("letter_filter"):
+            queryset = queryset.filter(name__istartswith=filters["letter_filter"])
+
+        return queryset
+
+    @staticmethod
+    def get_facets(filters: Dict[str, str]) -> List[Dict]:
+        """Obtiene las facetas con sus valores, conteos y selección actual"""
+        counts = FacetService.get_facet_counts(filters)
+
+        facets = []
+        for facet, (param, label) in FacetService.FACETS.items():
+            facets.append(
+                {
+                    "name": facet,
+                    "param": param,
+                    "label": label,
+                    "selected": filters.get(param, ""),
+                    "values": counts.get(facet, []),
+                }
+            )
+        return facets
+
+    @staticmethod
+    def get_facet_counts(filters: Dict[str, str]) -> Dict[str, List[Dict]]:
+        """Conteos por faceta; los del catálogo sin filtrar se cachean"""
+        if not any(filters.values()):
+            counts = cache.get(FacetService.CATALOG_CACHE_KEY)
+            if counts is None:
+                counts = FacetService.refresh_catalog_counts()
+            return counts
+
+        return FacetService._compute_counts(filters)
+
+    @staticmethod
+    def refresh_catalog_counts() -> Dict[str, List[Dict]]:
+        """Recalcula y cachea los conteos del catálogo completo"""
+        counts = FacetService._compute_counts({})
+        cache.set(FacetService.CATALOG_CACHE_KEY, counts, FACET_CONFIG["cache_ttl"])
+        return counts
+
+    @staticmethod
+    def _compute_counts(filters: Dict[str, str]) -> Dict[str, List[Dict]]:
+        """Una única consulta agrupada por (faceta, valor) sobre los juegos filtrados"""
+        matched = FacetService.filter_queryset(Games.objects.all(), filters)
+        matched_sql, matched_params = matched.values("app_id").query.sql_with_params()
+        price_case, price_params = FacetService._price_case_sql()
+
+        sql = f"""
+            WITH matched AS ({matched_sql}),
+            facet_rows AS (
+                SELECT 'genre' AS facet, ge.genre AS value, ge.app_id
+                FROM genres ge JOIN matched m ON m.app_id = ge.app_id
+                UNION ALL
+                SELECT 'category', ca.category, ca.app_id
+                FROM categories ca JOIN matched m ON m.app_id = ca.app_id
+                UNION ALL
+                SELECT 'language', la.language, la.app_id
+                FROM languages la JOIN matched m ON m.app_id = la.app_id
+                UNION ALL
+                SELECT 'platform', pf.platform, p.app_id
+                FROM platforms p JOIN matched m ON m.app_id = p.app_id
+                CROSS JOIN LATERAL (
+                    VALUES ('windows', p.windows), ('mac', p.mac), ('linux', p.linux)
+                ) AS pf(platform, enabled)
+                WHERE pf.enabled
+                UNION ALL
+                SELECT 'price', {price_case}, g.app_id
+                FROM games g JOIN matched m ON m.app_id = g.app_id
+                UNION ALL
+                SELECT 'year', EXTRACT(YEAR FROM g.rel_date)::int::text, g.app_id
+                FROM games g JOIN matched m ON m.app_id = g.app_id
+            )
+            SELECT facet, value, COUNT(DISTINCT app_id) AS count
+            FROM facet_rows
+            WHERE value IS NOT NULL
+            GROUP BY facet, value
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [*matched_params, *price_params])
+            rows = cursor.fetchall()
+
+        return FacetService._group_counts(rows)
+
+    @staticmethod
+    def _group_counts(rows) -> Dict[str, List[Dict]]:
+        """Ordena y etiqueta los valores de cada faceta"""
+        grouped: Dict[str, List[Dict]] = {facet: [] for facet in FacetService.FACETS}
+        for facet, value, count in rows:
+            grouped[facet].append({"value": value, "label": value, "count": count})
+
+        price_labels = {key: label for key, label, *_ in FACET_CONFIG["price_buckets"]}
+        price_order = list(price_labels)
+        platform_order = list(FacetService.PLATFORMS)
+
+        for item in grouped["price"]:
+            item["label"] = price_labels.get(item["value"], item["value"])
+        for item in grouped["platform"]:
+            item["label"] = FacetService.PLATFORMS[item["value"]]
+
+        grouped["price"].sort(key=lambda item: price_order.index(item["value"]))
+        grouped["platform"].sort(key=lambda item: platform_order.index(item["value"]))
+        grouped["year"].sort(key=lambda item: item["value"], reverse=True)
+
+        limit = FACET_CONFIG["value_limit"]
+        for facet in ("genre", "category", "language"):
+            grouped[facet].sort(key=lambda item: (-item["count"], item["value"]))
+            grouped[facet] = grouped[facet][:limit]
+
+        return grouped
+
+    @staticmethod
+    def _price_case_sql() -> tuple:
+        """CASE que asigna cada precio a su rango configurado"""
+        buckets = FACET_CONFIG["price_buckets"]
+        free_key = buckets[0][0]
+
+        parts = ["CASE WHEN g.price IS NULL OR g.price <= 0 THEN %s"]
+        params = [free_key]
+        for key, _label, _low, high in buckets[1:]:
+            if high is None:
+                parts.append("ELSE %s")
+                params.append(key)
+            else:
+                parts.append("WHEN g.price <= %s THEN %s")
+                params.extend([high, key])
+        parts.append("END")
+
+        return " ".join(parts), params
+
+    @staticmethod
+    def _price_predicate(bucket_key: Optional[str]) -> Optional[Q]:
+        """Predicado de rango de precio equivalente al CASE de conteo"""
+        buckets = FACET_CONFIG["price_buckets"]
+        if not bucket_key:
+            return None
+
+        if bucket_key == buckets[0][0]:
+            return Q(price__isnull=True) | Q(price__lte=0)
+
+        for key, _label, low, high in buckets[1:]:
+            if key == bucket_key:
+                predicate = Q(price__gt=low)
+                if high is not None:
+                    predicate &= Q(price__lte=high)
+                return predicate
+        return None
+
+    @staticmethod
+    def _parse_year(value: Optional[str]) -> Optional[int]:
+        try:
+            year = int(value)
+        except (TypeError, ValueError):
+            return None
+        # date(year + 1, 1, 1) debe existir para el rango semiabierto
+        return year if 1 <= year <= 9998 else None
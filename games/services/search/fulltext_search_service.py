@@ -0,0 +1,76 @@
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import mark_safe
+from typing import Dict, List, Optional
+
+from games.config import FULLTEXT_SEARCH_CONFIG
+from games.models import Games
+from games.services.admin.index_service import IndexService
+
+
+class FullTextSearchService:
+    """Búsqueda de texto completo sobre las descripciones de AboutGame"""
+
+    # Delimitadores del fragmento resaltado, reemplazados luego por <mark>
+    HIGHLIGHT_START = "⟦"
+    HIGHLIGHT_STOP = "⟧"
+
+    @staticmethod
+    def search_descriptions(query: str, limit: Optional[int] = None) -> List[Games]:
+        """Busca juegos por sus descripciones ordenados por ts_rank, con fragmento"""
+        query = (query or "").strip()
+        if not query:
+            return []
+
+        if limit is None:
+            limit = FULLTEXT_SEARCH_CONFIG["limit"]
+
+        language = FULLTEXT_SEARCH_CONFIG["language"]
+        headline_options = (
+            f"{FULLTEXT_SEARCH_CONFIG['snippet_options']}, "
+            f"StartSel={FullTextSearchService.HIGHLIGHT_START}, "
+            f"StopSel={FullTextSearchService.HIGHLIGHT_STOP}"
+        )
+
+        # El fragmento se genera solo para las filas ya limitadas, evitando
+        # leer los textos largos de todas las coincidencias
+        sql = """
+            SELECT g.*, ranked.rank,
+                ts_headline(
+                    %s::regconfig,
+                    concat_ws(' ', a.short_description, a.about_the_game),
+                    ranked.q,
+                    %s
+                ) AS snippet
+            FROM (
+                SELECT a.id, a.app_id, ts_rank(a.search_vector, q) AS rank, q
+                FROM about_game a, websearch_to_tsquery(%s::regconfig, %s) q
+                WHERE a.search_vector @@ q
+                ORDER BY rank DESC
+                LIMIT %s
+            ) ranked
+            JOIN about_game a ON a.id = ranked.id
+            JOIN games g ON g.app_id = ranked.app_id
+            ORDER BY ranked.rank DESC, g.name
+        """
+        params = [language, headline_options, language, query, limit]
+
+        games = list(Games.objects.raw(sql, params))
+        for game in games:
+            game.snippet = FullTextSearchService._format_snippet(game.snippet)
+        return games
+
+    @staticmethod
+    def get_index_status() -> Dict[str, any]:
+        """Informa si el índice GIN sobre about_game.search_vector existe y su uso"""
+        return IndexService.get_index_status(FULLTEXT_SEARCH_CONFIG["index_name"])
+
+    @staticmethod
+    def _format_snippet(snippet: Optional[str]) -> str:
+        """Quita el HTML de la descripción y resalta los términos encontrados"""
+        if not snippet:
+            return ""
+
+        text = escape(strip_tags(snippet))
+        text = text.replace(FullTextSearchService.HIGHLIGHT_START, "<mark>")
+        text = text.replace(FullTextSearchService.HIGHLIGHT_STOP, "</mark>")
+        return mark_safe(text)
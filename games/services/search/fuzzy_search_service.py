@@ -0,0 +1,66 @@
+from django.db import connection, transaction
+from typing import Dict, List, Optional
+
+from games.config import FUZZY_SEARCH_CONFIG
+from games.models import Games
+from games.services.admin.index_service import IndexService
+
+
+class FuzzySearchService:
+    """Búsqueda aproximada de juegos por nombre usando pg_trgm"""
+
+    INDEX_TABLE = "games"
+    INDEX_COLUMN = "name"
+    INDEX_TYPE = "GIN_TRGM"
+
+    @staticmethod
+    def search_by_name(
+        query: str, min_similarity: Optional[float] = None, limit: Optional[int] = None
+    ) -> List[Games]:
+        """Busca juegos por similitud o subcadena del nombre, ordenados por relevancia"""
+        query = (query or "").strip()
+        if not query:
+            return []
+
+        if min_similarity is None:
+            min_similarity = FUZZY_SEARCH_CONFIG["min_similarity"]
+        if limit is None:
+            limit = FUZZY_SEARCH_CONFIG["limit"]
+
+        # Ambos operadores (% e ILIKE) son resueltos por el índice GIN de trigramas
+        sql = """
+            SELECT g.*, similarity(g.name, %s) AS similarity
+            FROM games g
+            WHERE g.name %% %s OR g.name ILIKE %s
+            ORDER BY similarity DESC, g.name
+            LIMIT %s
+        """
+        pattern = f"%{FuzzySearchService._escape_like(query)}%"
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                # El umbral solo aplica a esta transacción
+                cursor.execute(
+                    "SELECT set_config('pg_trgm.similarity_threshold', %s, true)",
+                    [str(min_similarity)],
+                )
+            return list(Games.objects.raw(sql, [query, query, pattern, limit]))
+
+    @staticmethod
+    def create_index() -> Dict[str, any]:
+        """Crea el índice GIN de trigramas sobre games.name"""
+        return IndexService.create_index(
+            FuzzySearchService.INDEX_TABLE,
+            FuzzySearchService.INDEX_COLUMN,
+            FuzzySearchService.INDEX_TYPE,
+        )
+
+    @staticmethod
+    def get_index_status() -> Dict[str, any]:
+        """Informa si el índice de trigramas existe, su tamaño y su uso"""
+        return IndexService.get_index_status(FUZZY_SEARCH_CONFIG["index_name"])
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        """Escapa comodines de LIKE para buscar el texto literal"""
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,95 @@
+import base64
+import binascii
+import json
+from django.db.models import Q, QuerySet
+from typing import Dict, Optional
+
+
+class KeysetPaginationService:
+    """Paginación por cursor (seek) sobre el orden (name, app_id)"""
+
+    NEXT = "next"
+    PREV = "prev"
+
+    @staticmethod
+    def paginate(queryset: QuerySet, cursor: Optional[str], page_size: int) -> Dict:
+        """Obtiene una página a partir de un cursor opaco sin OFFSET ni COUNT"""
+        position = KeysetPaginationService.decode_cursor(cursor)
+
+        if position is None:
+            games = queryset.order_by("name", "app_id")
+            direction = KeysetPaginationService.NEXT
+        elif position["d"] == KeysetPaginationService.PREV:
+            games = queryset.filter(
+                KeysetPaginationService._before(position["n"], position["id"])
+            ).order_by("-name", "-app_id")
+            direction = KeysetPaginationService.PREV
+        else:
+            games = queryset.filter(
+                KeysetPaginationService._after(position["n"], position["id"])
+            ).order_by("name", "app_id")
+            direction = KeysetPaginationService.NEXT
+
+        # Se pide una fila extra para saber si hay más páginas en esa dirección
+        rows = list(games[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        if direction == KeysetPaginationService.PREV:
+            rows.reverse()
+            has_previous, has_next = has_more, True
+        else:
+            has_previous, has_next = position is not None, has_more
+
+        return {
+            "object_list": rows,
+            "has_previous": has_previous and bool(rows),
+            "has_next": has_next and bool(rows),
+            "previous_cursor": (
+                KeysetPaginationService.encode_cursor(rows[0], "prev") if rows else ""
+            ),
+            "next_cursor": (
+                KeysetPaginationService.encode_cursor(rows[-1], "next") if rows else ""
+            ),
+        }
+
+    @staticmethod
+    def encode_cursor(game, direction: str) -> str:
+        """Codifica la posición de un juego como token opaco para la URL"""
+        payload = json.dumps(
+            {"n": game.name, "id": game.app_id, "d": direction},
+            separators=(",", ":"),
+        )
+        token = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+        return token.rstrip("=")
+
+    @staticmethod
+    def decode_cursor(token: Optional[str]) -> Optional[Dict]:
+        """Decodifica un token de cursor; devuelve None si falta o es inválido"""
+        if not token:
+            return None
+
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (ValueError, binascii.Error, UnicodeError):
+            return None
+
+        if not isinstance(position, dict) or not {"n", "id", "d"} <= position.keys():
+            return None
+        if position["d"] not in (
+            KeysetPaginationService.NEXT,
+            KeysetPaginationService.PREV,
+        ):
+            return None
+        return position
+
+    @staticmethod
+    def _after(name: str, app_id: str) -> Q:
+        # (name, app_id) > (n, id); name >= n acota el rango del índice compuesto
+        return Q(name__gte=name) & (Q(name__gt=name) | Q(app_id__gt=app_id))
+
+    @staticmethod
+    def _before(name: str, app_id: str) -> Q:
+        # (name, app_id) < (n, id)
+        return Q(name__lte=name) & (Q(name__lt=name) | Q(app_id__lt=app_id))
@@ -0,0 +1,231 @@
+import datetime
+import re
+from decimal import Decimal, InvalidOperation
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Q, QuerySet
+from django.db.models.functions import Lower
+from typing import Callable, Dict
+
+from games.models import Games
+
+
+class SearchQueryCompiler:
+    """Traduce criterios de búsqueda a predicados tipados y sargables"""
+
+    # Tipo de predicado por columna de games
+    FIELD_TYPES = {
+        "app_id": "exact",
+        "name": "text",
+        "estimated_owners": "exact",
+        "rel_date": "date",
+        "req_age": "integer",
+        "price": "decimal",
+        "dlc_count": "integer",
+        "achievements": "integer",
+    }
+
+    # Nombres usados anteriormente en formularios y URLs
+    FIELD_ALIASES = {
+        "release_date": "rel_date",
+        "required_age": "req_age",
+    }
+
+    RANGE_SEPARATOR = ".."
+    COMPARISON_PATTERN = re.compile(r"^(>=|<=|>|<)\s*(.+)$")
+    COMPARISON_LOOKUPS = {">=": "gte", "<=": "lte", ">": "gt", "<": "lt"}
+
+    # Criterio de la búsqueda combinada; las comillas se conservan en el valor
+    TOKEN_PATTERN = re.compile(r'(?:[^\s"]+|"[^"]*")+')
+
+    # date(year + 1, 1, 1) debe existir para el rango semiabierto
+    MIN_YEAR = 1
+    MAX_YEAR = 9998
+
+    @staticmethod
+    def search(criteria: Dict[str, str]) -> QuerySet:
+        """Busca juegos que cumplan todos los criterios {campo: valor}"""
+        games = SearchQueryCompiler.filter_queryset(Games.objects.all(), criteria)
+        return games.order_by("name", "app_id")
+
+    @staticmethod
+    def filter_queryset(queryset: QuerySet, criteria: Dict[str, str]) -> QuerySet:
+        """Aplica los criterios compilados a una consulta de juegos"""
+        # Alias (no se selecciona) para las búsquedas por prefijo sobre lower(name)
+        queryset = queryset.alias(name_lower=Lower("name"))
+        return queryset.filter(SearchQueryCompiler.compile(criteria))
+
+    @staticmethod
+    def compile(criteria: Dict[str, str]) -> Q:
+        """Combina con AND el predicado de cada campo"""
+        if not criteria:
+            raise ValidationError("Debe indicar al menos un criterio de búsqueda")
+
+        predicate = Q()
+        for field, value in criteria.items():
+            predicate &= SearchQueryCompiler.compile_field(field, value)
+        return predicate
+
+    @staticmethod
+    def compile_field(field: str, value: str) -> Q:
+        """Genera el predicado tipado para un campo"""
+        field = SearchQueryCompiler.FIELD_ALIASES.get(field, field)
+        field_type = SearchQueryCompiler.FIELD_TYPES.get(field)
+        if field_type is None:
+            raise ValidationError(f"El campo '{field}' no admite búsquedas")
+
+        value = (value or "").strip()
+        if not value:
+            raise ValidationError(f"Debe indicar un valor para '{field}'")
+
+        if field_type == "exact":
+            return Q(**{field: value})
+        if field_type == "text":
+            return SearchQueryCompiler._compile_text(field, value)
+        if field_type == "date":
+            return SearchQueryCompiler._compile_date(field, value)
+
+        return SearchQueryCompiler._compile_range(
+            field, value, SearchQueryCompiler._number_converter(field, field_type)
+        )
+
+    @staticmethod
+    def parse_combined(query: str) -> Dict[str, str]:
+        """Interpreta una búsqueda combinada: 'req_age:18..30 price:10..300'"""
+        query = query or ""
+        if query.count('"') % 2:
+            raise ValidationError(
+                "Búsqueda combinada mal formada (comillas sin cerrar)"
+            )
+        tokens = SearchQueryCompiler.TOKEN_PATTERN.findall(query)
+
+        criteria = {}
+        for token in tokens:
+            field, separator, value = token.partition(":")
+            if not separator:
+                raise ValidationError(
+                    f"Criterio '{token}' inválido, use el formato campo:valor"
+                )
+            criteria[field.strip()] = value
+        return criteria
+
+    @staticmethod
+    def _compile_text(field: str, value: str) -> Q:
+        # "=texto" o "texto entre comillas": igualdad exacta (B-tree/Hash)
+        if value.startswith("="):
+            return Q(**{field: value[1:].strip()})
+        if len(value) > 1 and value[0] == value[-1] == '"':
+            return Q(**{field: value[1:-1]})
+
+        # "texto*": prefijo sobre lower(name) (índice text_pattern_ops)
+        if value.endswith("*"):
+            return Q(**{f"{field}_lower__startswith": value[:-1].lower()})
+
+        # Subcadena: ~* es resuelto por el índice GIN de trigramas
+        return Q(**{f"{field}__iregex": re.escape(value)})
+
+    @staticmethod
+    def _compile_date(field: str, value: str) -> Q:
+        # Año o año-mes completos se convierten en un rango semiabierto
+        if re.fullmatch(r"\d{4}", value):
+            year = SearchQueryCompiler._check_year(field, value, int(value))
+            return Q(
+                **{
+                    f"{field}__gte": datetime.date(year, 1, 1),
+                    f"{field}__lt": datetime.date(year + 1, 1, 1),
+                }
+            )
+        if re.fullmatch(r"\d{4}-\d{2}", value):
+            year, month = (int(part) for part in value.split("-"))
+            SearchQueryCompiler._check_year(field, value, year)
+            if not 1 <= month <= 12:
+                raise ValidationError(f"Fecha inválida para '{field}': {value}")
+            next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            return Q(
+                **{
+                    f"{field}__gte": datetime.date(year, month, 1),
+                    f"{field}__lt": datetime.date(*next_month, 1),
+                }
+            )
+
+        return SearchQueryCompiler._compile_range(
+            field, value, SearchQueryCompiler._to_date
+        )
+
+    @staticmethod
+    def _compile_range(field: str, value: str, converter: Callable) -> Q:
+        # "a..b", "a..", "..b", ">=a", "<b" o un valor exacto
+        lookups: Dict[str, str] = {}
+        if SearchQueryCompiler.RANGE_SEPARATOR in value:
+            low, high = value.split(SearchQueryCompiler.RANGE_SEPARATOR, 1)
+            if low.strip():
+                lookups["gte"] = low
+            if high.strip():
+                lookups["lte"] = high
+        else:
+            match = SearchQueryCompiler.COMPARISON_PATTERN.match(value)
+            if match:
+                operator, operand = match.groups()
+                lookups[SearchQueryCompiler.COMPARISON_LOOKUPS[operator]] = operand
+            else:
+                lookups["exact"] = value
+
+        if not lookups:
+            raise ValidationError(f"Rango vacío para '{field}'")
+
+        return Q(
+            **{
+                f"{field}__{lookup}": SearchQueryCompiler._convert(
+                    field, operand, converter
+                )
+                for lookup, operand in lookups.items()
+            }
+        )
+
+    @staticmethod
+    def _check_year(field: str, value: str, year: int) -> int:
+        if not SearchQueryCompiler.MIN_YEAR <= year <= SearchQueryCompiler.MAX_YEAR:
+            raise ValidationError(f"Fecha inválida para '{field}': {value}")
+        return year
+
+    @staticmethod
+    def _number_converter(field: str, field_type: str) -> Callable:
+        # Fuera del rango de la columna PostgreSQL fallaría con DataError
+        model_field = Games._meta.get_field(field)
+        if field_type == "integer":
+            low, high = connection.ops.integer_field_range(
+                model_field.get_internal_type()
+            )
+
+            def convert(value: str) -> int:
+                number = int(value)
+                if not low <= number <= high:
+                    raise ValueError(value)
+                return number
+
+            return convert
+
+        limit = Decimal(10) ** (model_field.max_digits - model_field.decimal_places)
+
+        def convert_decimal(value: str) -> Decimal:
+            number = SearchQueryCompiler._to_decimal(value)
+            if not number.is_finite() or abs(number) >= limit:
+                raise ValueError(value)
+            return number
+
+        return convert_decimal
+
+    @staticmethod
+    def _convert(field: str, value: str, converter: Callable):
+        try:
+            return converter(value.strip())
+        except (ValueError, InvalidOperation):
+            raise ValidationError(f"Valor inválido para '{field}': {value.strip()}")
+
+    @staticmethod
+    def _to_decimal(value: str) -> Decimal:
+        return Decimal(value.replace(",", "."))
+
+    @staticmethod
+    def _to_date(value: str) -> datetime.date:
+        return datetime.date.fromisoformat(value)
@@ -0,0 +1,328 @@
+import hashlib
+import json
+import os
+from collections import Counter, defaultdict
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional
+
+from django.apps import apps
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from ..config import BATCH_WRITE_CONFIG, IMPORT_CONFIG, SYNC_CONFIG
+from ..models import Games, GameSyncState
+from .admin.import_service import BulkImportService
+from .analytics import GenreAnalyticsService
+from .transaction_service import TransactionService
+
+
+class SyncService:
+    # Sincronización incremental del dataset: solo se escriben los juegos cuyo
+    # registro normalizado (juego + tablas hijas) cambió desde la última vez.
+    # Los juegos se escriben con TransactionService (validación, versión, caché
+    # y autocompletado); las tablas hijas se comparan fila a fila, con todas sus
+    # columnas y repetidos, y registran sus efectos con el mismo servicio
+
+    @staticmethod
+    def child_models() -> Dict[str, type]:
+        # Tablas hijas de games: nombre de tabla -> modelo
+        return {
+            model._meta.db_table: model
+            for model in apps.get_app_config("games").get_models()
+            if any(field.name == "app" for field in model._meta.concrete_fields)
+        }
+
+    @staticmethod
+    def sync(
+        source_dir: str,
+        batch_size: Optional[int] = None,
+        progress: Optional[Callable[[Dict], None]] = None,
+    ) -> Dict:
+        # Recorre el archivo de juegos por lotes y aplica solo los cambios
+        files = BulkImportService.find_source_files(source_dir)
+        if "games" not in files:
+            raise ValueError(f"No se encontró el archivo de juegos en {source_dir}")
+
+        # Cada lote se escribe con las operaciones por lotes de TransactionService
+        batch_size = min(
+            batch_size or SYNC_CONFIG["batch_size"], BATCH_WRITE_CONFIG["max_items"]
+        )
+        child_models = {
+            table: model
+            for table, model in SyncService.child_models().items()
+            if table in files
+        }
+        stats = {
+            "scanned": 0,
+            "unchanged": 0,
+            "inserted": 0,
+            "updated": 0,
+            "children_added": 0,
+            "children_removed": 0,
+            "errors": [],
+        }
+        staged = SyncService._stage_children(files, child_models)
+        try:
+            batch = []
+            for record in BulkImportService.iter_records(files["games"]):
+                batch.append(SyncService._normalize_game(record))
+                if len(batch) >= batch_size:
+                    SyncService._sync_batch(batch, staged, child_models, stats)
+                    batch = []
+                    if progress:
+                        progress(stats)
+
+            if batch:
+                SyncService._sync_batch(batch, staged, child_models, stats)
+                if progress:
+                    progress(stats)
+        finally:
+            for staging, _columns in staged.values():
+                BulkImportService.drop_staging(staging)
+
+        if stats["inserted"] or stats["children_added"] or stats["children_removed"]:
+            GenreAnalyticsService.refresh_genre_statistics()
+        return stats
+
+    @staticmethod
+    def _sync_batch(
+        batch: List[Dict], staged: Dict, child_models: Dict, stats: Dict
+    ) -> None:
+        # Compara hashes del lote y escribe solo los juegos distintos
+        children = SyncService._load_children(
+            staged, child_models, [game["app_id"] for game in batch]
+        )
+        hashes = {
+            game["app_id"]: SyncService._content_hash(
+                game, children.get(game["app_id"], {})
+            )
+            for game in batch
+        }
+        stored = dict(
+            GameSyncState.objects.filter(app_id__in=list(hashes)).values_list(
+                "app_id", "content_hash"
+            )
+        )
+        changed = [
+            game
+            for game in batch
+            if stored.get(game["app_id"]) != hashes[game["app_id"]]
+        ]
+        stats["scanned"] += len(batch)
+        stats["unchanged"] += len(batch) - len(changed)
+        if not changed:
+            return
+
+        changed_ids = [game["app_id"] for game in changed]
+        columns = [field.attname for field in SyncService._game_fields()]
+
+        with transaction.atomic():
+            # Sin hash guardado (primera sincronización) se compara con la fila
+            # actual; las filas quedan bloqueadas hasta el commit
+            existing = {
+                row["app_id"]: SyncService._normalize_game(row)
+                for row in Games.objects.select_for_update()
+                .filter(app_id__in=changed_ids)
+                .values(*columns)
+            }
+            creates = [
+                {"game_data": game}
+                for game in changed
+                if game["app_id"] not in existing
+            ]
+            # Solo las columnas distintas: la versión sube si alguna cambió
+            updates = []
+            for game in changed:
+                old = existing.get(game["app_id"])
+                if old is None:
+                    continue
+                fields = {
+                    name: value for name, value in game.items() if value != old[name]
+                }
+                if fields:
+                    updates.append({"app_id": game["app_id"], "game_data": fields})
+
+            errors = []
+            if creates:
+                result = TransactionService.create_complete_games(creates)
+                stats["inserted"] += len(result["created"])
+                errors += result["errors"]
+            if updates:
+                result = TransactionService.update_complete_games(updates)
+                stats["updated"] += len(result["updated"])
+                errors += result["errors"]
+
+            # Un juego rechazado no escribe sus filas hijas ni su hash: se
+            # vuelve a intentar en la próxima sincronización
+            stats["errors"] += errors
+            failed = {error["app_id"] for error in errors}
+            synced_ids = [app_id for app_id in changed_ids if app_id not in failed]
+
+            touched = set()
+            for table, model in child_models.items():
+                touched |= SyncService._sync_children(
+                    model,
+                    {
+                        app_id: children.get(app_id, {}).get(table, [])
+                        for app_id in synced_ids
+                    },
+                    stats,
+                )
+            TransactionService.register_write_effects(sorted(touched))
+
+            now = timezone.now()
+            GameSyncState.objects.bulk_create(
+                [
+                    GameSyncState(
+                        app_id=app_id, content_hash=hashes[app_id], synced_at=now
+                    )
+                    for app_id in synced_ids
+                ],
+                update_conflicts=True,
+                unique_fields=["app_id"],
+                update_fields=["content_hash", "synced_at"],
+            )
+
+    @staticmethod
+    def _sync_children(model, wanted_rows: Dict[str, List[tuple]], stats: Dict) -> set:
+        # Diferencia de multiconjuntos entre filas actuales y entrantes
+        columns = [field.attname for field in SyncService._child_fields(model)]
+
+        current = defaultdict(list)
+        for row in model.objects.filter(app_id__in=list(wanted_rows)).values_list(
+            "id", "app_id", *columns
+        ):
+            current[(row[1], SyncService._normalize_row(model, row[2:]))].append(row[0])
+
+        wanted = Counter(
+            (app_id, row) for app_id, rows in wanted_rows.items() for row in rows
+        )
+
+        to_delete = []
+        touched = set()
+        for (app_id, row), ids in current.items():
+            extra = len(ids) - wanted.get((app_id, row), 0)
+            if extra > 0:
+                to_delete.extend(ids[:extra])
+                touched.add(app_id)
+
+        to_create = []
+        for key, count in wanted.items():
+            to_create.extend([key] * (count - len(current.get(key, []))))
+
+        if to_delete:
+            model.objects.filter(id__in=to_delete).delete()
+        if to_create:
+            model.objects.bulk_create(
+                [
+                    model(app_id=app_id, **dict(zip(columns, row)))
+                    for app_id, row in to_create
+                ]
+            )
+
+        stats["children_added"] += len(to_create)
+        stats["children_removed"] += len(to_delete)
+
+        return touched | {app_id for app_id, _row in to_create}
+
+    @staticmethod
+    def _stage_children(files: Dict[str, str], child_models: Dict) -> Dict:
+        # Cada archivo hijo se copia una vez a una tabla de staging indexada
+        # por app_id; así cada lote lee solo sus filas y no todo el archivo
+        staged = {}
+        try:
+            for table in child_models:
+                staging = (
+                    f"{IMPORT_CONFIG['staging_prefix']}sync_{table}_{os.getpid()}"
+                )
+                columns = BulkImportService.stage_file(table, files[table], staging)
+                staged[table] = (staging, columns)
+        except Exception:
+            for staging, _columns in staged.values():
+                BulkImportService.drop_staging(staging)
+            raise
+        return staged
+
+    @staticmethod
+    def _load_children(staged: Dict, child_models: Dict, app_ids: List[str]) -> Dict:
+        # Filas hijas entrantes del lote: app_id -> tabla -> [fila normalizada]
+        children = defaultdict(lambda: defaultdict(list))
+        with connection.cursor() as cursor:
+            for table, (staging, columns) in staged.items():
+                if "app_id" not in columns:
+                    continue
+                model = child_models[table]
+                # Columnas ausentes en el archivo se comparan como NULL
+                select = ", ".join(
+                    f'"{field.attname}"' if field.attname in columns else "NULL"
+                    for field in SyncService._child_fields(model)
+                )
+                cursor.execute(
+                    f'SELECT "app_id", {select} FROM "steam"."{staging}" '
+                    'WHERE "app_id" = ANY(%s)',
+                    [app_ids],
+                )
+                for row in cursor.fetchall():
+                    children[str(row[0])][table].append(
+                        SyncService._normalize_row(model, row[1:])
+                    )
+        return children
+
+    @staticmethod
+    def _game_fields() -> List[models.Field]:
+        # La versión es interna: no forma parte del contenido comparado
+        return [
+            field for field in Games._meta.concrete_fields if field.name != "version"
+        ]
+
+    @staticmethod
+    def _child_fields(model) -> List[models.Field]:
+        return [
+            field
+            for field in model._meta.concrete_fields
+            if field.name not in ("id", "app")
+        ]
+
+    @staticmethod
+    def _normalize_game(record: Dict) -> Dict:
+        fields = {field.attname: field for field in SyncService._game_fields()}
+        unknown = [column for column in record if column not in fields]
+        if unknown:
+            raise ValueError(f"Columnas desconocidas en games: {', '.join(unknown)}")
+
+        game = {
+            name: SyncService._normalize_value(field, record.get(name))
+            for name, field in fields.items()
+        }
+        game["app_id"] = str(game["app_id"])
+        return game
+
+    @staticmethod
+    def _normalize_row(model, values) -> tuple:
+        return tuple(
+            SyncService._normalize_value(field, value)
+            for field, value in zip(SyncService._child_fields(model), values)
+        )
+
+    @staticmethod
+    def _normalize_value(field: models.Field, value):
+        # Vacío equivale a NULL, igual que en COPY con formato CSV
+        if value is None or value == "":
+            return None
+        value = field.to_python(value)
+        if isinstance(field, models.DecimalField):
+            value = Decimal(value).quantize(Decimal(1).scaleb(-field.decimal_places))
+        return value
+
+    @staticmethod
+    def _content_hash(game: Dict, children: Dict[str, List[tuple]]) -> str:
+        document = {
+            "game": game,
+            "children": {
+                table: sorted(json.dumps(row, default=str) for row in rows)
+                for table, rows in children.items()
+            },
+        }
+        return hashlib.sha256(
+            json.dumps(document, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
@@ -1,18 +1,30 @@
-from django.db import transaction
+from django.db import connection, transaction
+from django.core.exceptions import ValidationError
+from ..models import Games, AboutGame
+from ..config import BATCH_WRITE_CONFIG
 from .game_service import GameService
 from .about_game_service import AboutGameService
 from .genre_service import GenreService
+from .child_collection_service import ChildCollectionService
+from .game_cache_service import GameCacheService
+from .search import AutocompleteService
 from typing import Dict, List
 
 
 class TransactionService:
     #Servicio principal para gestionar transacciones complejas 
+    #Cada servicio interno registra la invalidación de la caché por juego con
+    #transaction.on_commit, que se ejecuta al confirmar la transacción externa
 
     @staticmethod
     def create_complete_game(
-        game_data: Dict, description_data: Dict = None, genres_list: List[str] = None
+        game_data: Dict,
+        description_data: Dict = None,
+        genres_list: List[str] = None,
+        collections: Dict[str, List[str]] = None,
     ) -> Dict:
         #Crea un juego completo con descripción y géneros en una sola transacción
+        #collections: {"categories": [...], "developers": [...], ...}
         with transaction.atomic():
             # Crear el juego base
             game = GameService.create_game(game_data)
@@ -31,6 +43,12 @@ class TransactionService:
                 genres = GenreService.update_game_genres(game.app_id, genres_list)
                 result["genres"] = genres
 
+            # Agregar el resto de colecciones hijas
+            if collections:
+                result["collections"] = ChildCollectionService.sync_collections(
+                    game.app_id, collections
+                )
+
             return result
 
     @staticmethod
@@ -39,14 +57,21 @@ class TransactionService:
         game_data: Dict = None,
         description_data: Dict = None,
         genres_list: List[str] = None,
+        collections: Dict[str, List[str]] = None,
+        expected_version: int = None,
     ) -> Dict:
         #Actualiza un juego completo en una sola transacción
+        #En collections, una lista vacía vacía la colección y None no la modifica
+        #Con expected_version la versión del juego se verifica e incrementa
+        #aunque solo cambien la descripción o las colecciones
         with transaction.atomic():
             result = {}
 
             # Actualizar datos básicos del juego
-            if game_data:
-                game = GameService.update_game(app_id, game_data)
+            if game_data or expected_version is not None:
+                game = GameService.update_game(
+                    app_id, game_data or {}, expected_version
+                )
                 result["game"] = game
 
             # Actualizar descripción
@@ -61,4 +86,327 @@ class TransactionService:
                 genres = GenreService.update_game_genres(app_id, genres_list)
                 result["genres"] = genres
 
+            # Actualizar el resto de colecciones hijas (solo la diferencia)
+            if collections:
+                result["collections"] = ChildCollectionService.sync_collections(
+                    app_id, collections
+                )
+
             return result
+
+    @staticmethod
+    def create_complete_games(items: List[Dict]) -> Dict:
+        #Crea muchos juegos en una sola transacción. Valida todo primero y luego
+        #escribe con un bulk_create por tabla; los ítems inválidos se informan
+        #en "errors" con su posición y no se escriben
+        TransactionService._check_batch_size(items)
+
+        app_ids = [
+            str((item.get("game_data") or {}).get("app_id") or "") for item in items
+        ]
+        existing = set(
+            Games.objects.filter(app_id__in=[a for a in app_ids if a]).values_list(
+                "app_id", flat=True
+            )
+        )
+
+        valid = []
+        errors = []
+        seen = set()
+        for index, item in enumerate(items):
+            try:
+                game = TransactionService._build_game(item.get("game_data"))
+                if game.app_id in existing:
+                    raise ValidationError(f"El juego con ID {game.app_id} ya existe")
+                if game.app_id in seen:
+                    raise ValidationError(
+                        f"El juego con ID {game.app_id} está repetido en el lote"
+                    )
+                description = TransactionService._build_description(
+                    item.get("description_data")
+                )
+                collections = TransactionService._item_collections(item)
+            except ValidationError as e:
+                errors.append(TransactionService._item_error(index, app_ids[index], e))
+                continue
+
+            seen.add(game.app_id)
+            if description:
+                description.app_id = game.app_id
+            valid.append((game, description, collections))
+
+        created = [game.app_id for game, _description, _collections in valid]
+        if valid:
+            batch_size = BATCH_WRITE_CONFIG["batch_size"]
+            with transaction.atomic():
+                Games.objects.bulk_create(
+                    [game for game, _description, _collections in valid],
+                    batch_size=batch_size,
+                )
+                AboutGame.objects.bulk_create(
+                    [description for _game, description, _c in valid if description],
+                    batch_size=batch_size,
+                )
+                TransactionService._sync_collections_bulk(
+                    {game.app_id: collections for game, _d, collections in valid}
+                )
+
+                TransactionService.register_write_effects(created, names_changed=True)
+
+        return {"created": created, "errors": errors}
+
+    @staticmethod
+    def update_complete_games(items: List[Dict]) -> Dict:
+        #Actualiza muchos juegos en una sola transacción: una consulta para
+        #cargarlos (bloqueando las filas), validación completa y un UPDATE por
+        #cada combinación de campos modificados, con la versión verificada en la base
+        #Cada ítem: {"app_id", "game_data", "description_data", "genres_list",
+        #"collections"}
+        TransactionService._check_batch_size(items)
+
+        app_ids = [str(item.get("app_id") or "") for item in items]
+        batch_size = BATCH_WRITE_CONFIG["batch_size"]
+
+        with transaction.atomic():
+            # Las filas quedan bloqueadas hasta el commit: la versión leída
+            # y los valores no modificados no pueden cambiar mientras tanto
+            games = Games.objects.select_for_update().in_bulk([a for a in app_ids if a])
+            descriptions = {}
+            for description in (
+                AboutGame.objects.select_for_update()
+                .filter(app_id__in=list(games))
+                .order_by("id")
+            ):
+                descriptions.setdefault(description.app_id, description)
+
+            games_by_fields = {}
+            new_descriptions = []
+            descriptions_by_fields = {}
+            collections_by_app = {}
+            positions = {}
+            names_changed = False
+            errors = []
+
+            for index, item in enumerate(items):
+                app_id = app_ids[index]
+                try:
+                    game = games.get(app_id)
+                    if game is None:
+                        raise ValidationError(f"El juego con ID {app_id} no existe")
+                    if app_id in collections_by_app:
+                        raise ValidationError(
+                            f"El juego con ID {app_id} está repetido en el lote"
+                        )
+
+                    game_data = dict(item.get("game_data") or {})
+                    if str(game_data.pop("app_id", app_id)) != app_id:
+                        raise ValidationError("No se puede cambiar el ID de un juego")
+                    expected_version = TransactionService._parse_version(
+                        game_data.pop("version", None)
+                    )
+                    if expected_version is not None and expected_version != (
+                        game.version
+                    ):
+                        raise ValidationError(
+                            f"El juego con ID {app_id} fue modificado por otro usuario"
+                        )
+                    old_name = game.name
+                    TransactionService._apply_fields(game, game_data)
+                    game.full_clean(validate_unique=False)
+
+                    description_data = item.get("description_data") or {}
+                    TransactionService._build_description(description_data)
+                    collections = TransactionService._item_collections(item)
+                except ValidationError as e:
+                    # El juego modificado en memoria no se agrega a la escritura
+                    errors.append(TransactionService._item_error(index, app_id, e))
+                    continue
+
+                collections_by_app[app_id] = collections
+                positions[app_id] = index
+                if game_data or expected_version is not None:
+                    # Como en update_complete_game, la versión se incrementa
+                    # aunque solo cambien la descripción o las colecciones
+                    games_by_fields.setdefault(tuple(sorted(game_data)), []).append(
+                        game
+                    )
+                    names_changed = names_changed or game.name != old_name
+
+                if description_data:
+                    description = descriptions.get(app_id)
+                    if description is None:
+                        new_descriptions.append(
+                            AboutGame(app_id=app_id, **description_data)
+                        )
+                    else:
+                        TransactionService._apply_fields(description, description_data)
+                        descriptions_by_fields.setdefault(
+                            tuple(sorted(description_data)), []
+                        ).append(description)
+
+            # Cada juego escribe solo sus columnas modificadas; la versión se
+            # verifica en el propio UPDATE y los ausentes del RETURNING son conflictos
+            conflicts = set()
+            for fields, group in games_by_fields.items():
+                written = TransactionService._update_games_checked(
+                    fields, group, batch_size
+                )
+                conflicts.update(game.app_id for game in group)
+                conflicts.difference_update(written)
+            for app_id in sorted(conflicts, key=positions.get):
+                errors.append(
+                    TransactionService._item_error(
+                        positions[app_id],
+                        app_id,
+                        ValidationError(
+                            f"El juego con ID {app_id} fue modificado por otro usuario"
+                        ),
+                    )
+                )
+                del collections_by_app[app_id]
+
+            for fields, group in descriptions_by_fields.items():
+                group = [d for d in group if d.app_id not in conflicts]
+                AboutGame.objects.bulk_update(group, fields, batch_size=batch_size)
+            new_descriptions = [
+                d for d in new_descriptions if d.app_id not in conflicts
+            ]
+            if new_descriptions:
+                AboutGame.objects.bulk_create(new_descriptions, batch_size=batch_size)
+            TransactionService._sync_collections_bulk(collections_by_app)
+
+            updated = list(collections_by_app)
+            TransactionService.register_write_effects(updated, names_changed)
+
+        return {"updated": updated, "errors": errors}
+
+    @staticmethod
+    def register_write_effects(app_ids: List[str], names_changed: bool = False) -> None:
+        #Efectos de una escritura por lotes al confirmar la transacción: invalida
+        #la caché de cada juego y, si cambiaron nombres, las sugerencias
+        GameCacheService.invalidate_many_on_commit(app_ids)
+        if names_changed:
+            transaction.on_commit(AutocompleteService.clear_cache)
+
+    @staticmethod
+    def _update_games_checked(fields, games: List[Games], batch_size: int) -> set:
+        #UPDATE ... FROM (VALUES ...) con la versión esperada de cada juego en el
+        #WHERE, igual que GameService.update_game; devuelve los app_id escritos
+        columns = [Games._meta.get_field(name) for name in fields]
+        row_sql = "(%s::text, %s::integer{})".format(
+            "".join(f", %s::{field.db_type(connection)}" for field in columns)
+        )
+        value_columns = ", ".join(
+            ['"app_id"', '"expected_version"']
+            + [f'"{field.column}"' for field in columns]
+        )
+        assignments = [
+            f'"{field.column}" = v."{field.column}"' for field in columns
+        ] + ['"version" = g."version" + 1']
+
+        written = set()
+        with connection.cursor() as cursor:
+            for start in range(0, len(games), batch_size):
+                chunk = games[start : start + batch_size]
+                params = []
+                for game in chunk:
+                    params += [game.app_id, game.version] + [
+                        field.get_db_prep_save(getattr(game, field.attname), connection)
+                        for field in columns
+                    ]
+                cursor.execute(
+                    f"""
+                    UPDATE {Games._meta.db_table} AS g SET {", ".join(assignments)}
+                    FROM (VALUES {", ".join([row_sql] * len(chunk))}) AS v({value_columns})
+                    WHERE g."app_id" = v."app_id" AND g."version" = v."expected_version"
+                    RETURNING g."app_id"
+                    """,
+                    params,
+                )
+                written.update(row[0] for row in cursor.fetchall())
+        return written
+
+    @staticmethod
+    def _parse_version(value):
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ValidationError(f"Versión inválida: {value}")
+
+    @staticmethod
+    def _check_batch_size(items: List[Dict]) -> None:
+        if len(items) > BATCH_WRITE_CONFIG["max_items"]:
+            raise ValidationError(
+                f"Se admiten hasta {BATCH_WRITE_CONFIG['max_items']} juegos por lote"
+            )
+
+    @staticmethod
+    def _build_game(game_data: Dict) -> Games:
+        #Construye y valida el juego sin consultar la base
+        if not game_data:
+            raise ValidationError("Faltan los datos del juego")
+        try:
+            game = Games(**game_data)
+        except TypeError as e:
+            raise ValidationError(f"Campos inválidos: {e}")
+        game.full_clean(validate_unique=False)
+        game.app_id = str(game.app_id)
+        return game
+
+    @staticmethod
+    def _build_description(description_data: Dict):
+        if not description_data:
+            return None
+        try:
+            return AboutGame(**description_data)
+        except TypeError as e:
+            raise ValidationError(f"Campos de descripción inválidos: {e}")
+
+    @staticmethod
+    def _apply_fields(instance, data: Dict) -> None:
+        fields = {field.name for field in instance._meta.concrete_fields}
+        unknown = [name for name in data if name not in fields]
+        if unknown:
+            raise ValidationError(f"Campos inválidos: {', '.join(unknown)}")
+        for field, value in data.items():
+            setattr(instance, field, value)
+
+    @staticmethod
+    def _item_collections(item: Dict) -> Dict[str, List[str]]:
+        #Colecciones hijas del ítem; genres_list se trata como la colección genres
+        collections = dict(item.get("collections") or {})
+        if item.get("genres_list"):
+            collections["genres"] = item["genres_list"]
+
+        unknown = [
+            name for name in collections if name not in GameService.CHILD_COLLECTIONS
+        ]
+        if unknown:
+            raise ValidationError(f"Colecciones no soportadas: {', '.join(unknown)}")
+        return {
+            name: values for name, values in collections.items() if values is not None
+        }
+
+    @staticmethod
+    def _sync_collections_bulk(collections_by_app: Dict[str, Dict]) -> None:
+        #Agrupa por colección: un SELECT, un DELETE y un bulk_create por tabla
+        by_collection = {}
+        for app_id, collections in collections_by_app.items():
+            for name, values in collections.items():
+                by_collection.setdefault(name, {})[app_id] = values
+
+        for name, values_by_app in by_collection.items():
+            ChildCollectionService.sync_collection_bulk(name, values_by_app)
+
+    @staticmethod
+    def _item_error(index: int, app_id: str, error: ValidationError) -> Dict:
+        if hasattr(error, "error_dict"):
+            message = "; ".join(
+                f"{field}: {' '.join(messages)}"
+                for field, messages in error.message_dict.items()
+            )
+        else:
+            message = "; ".join(error.messages)
+        return {"index": index, "app_id": app_id or None, "message": message}
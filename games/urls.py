@@ -8,6 +8,9 @@ from .views import (
     graphs_home,
     graphs_by_gender,
     genre_performance_report,
+    dimension_stats_ajax,
+    graphs_by_dimension,
+    catalog_stats_ajax,
     backup_db,
     restore_db,
     backup_management,
@@ -20,13 +23,21 @@ from .views import (
     edit_game,
     complete_description,
     index_management,
+    query_plan_history,
     game_details_ajax,
+    game_full_details_ajax,
+    games_batch_ajax,
+    game_autocomplete,
+    game_search_export,
+    all_games_export,
 )
 
 urlpatterns = [
     path("", home, name="home"),
     path("search/", game_search, name="game_search"),
+    path("search/export/", game_search_export, name="game_search_export"),
     path("all/", all, name="all_games"),
+    path("all/export/", all_games_export, name="all_games_export"),
     path("graphs/", graphs_home, name="graphs_home"),
     path("graphs-by-gender/", graphs_by_gender, name="graphs_by_gender"),
     path(
@@ -34,6 +45,7 @@ urlpatterns = [
         genre_performance_report,
         name="genre_performance_report",
     ),
+    path("graphs-by-dimension/", graphs_by_dimension, name="graphs_by_dimension"),
     path("register/", registrar_usuario, name="register"),
     path("login/", auth_views.LoginView.as_view(), name="login"),
     path("logout/", auth_views.LogoutView.as_view(), name="logout"),
@@ -52,5 +64,19 @@ urlpatterns = [
         name="complete_description",
     ),
     path("index-manager/", index_management, name="index_manager"),
+    path("query-plans/", query_plan_history, name="query_plan_history"),
     path("api/game/<str:app_id>/", game_details_ajax, name="game_details_ajax"),
+    path(
+        "api/game/<str:app_id>/full/",
+        game_full_details_ajax,
+        name="game_full_details_ajax",
+    ),
+    path("api/games/batch/", games_batch_ajax, name="games_batch_ajax"),
+    path("api/games/autocomplete/", game_autocomplete, name="game_autocomplete"),
+    path(
+        "api/analytics/dimensions/<str:dimension>/",
+        dimension_stats_ajax,
+        name="dimension_stats_ajax",
+    ),
+    path("api/analytics/catalog/", catalog_stats_ajax, name="catalog_stats_ajax"),
 ]
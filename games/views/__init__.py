@@ -13,9 +13,20 @@ from .search_views import (
     game_search,
     all_games as all,  
     game_details_ajax,
+    game_full_details_ajax,
+    games_batch_ajax,
+    game_autocomplete,
+    game_search_export,
+    all_games_export,
 )
 
-from .analytics_views import graphs_by_gender, genre_performance_report
+from .analytics_views import (
+    graphs_by_gender,
+    genre_performance_report,
+    dimension_stats_ajax,
+    graphs_by_dimension,
+    catalog_stats_ajax,
+)
 
 from .admin_views import (
     backup_db,
@@ -24,6 +35,7 @@ from .admin_views import (
     backup_help,
     view_db_schema,
     index_management,
+    query_plan_history,
 )
 
 __all__ = [
@@ -38,12 +50,21 @@ __all__ = [
     "game_search",
     "all",
     "game_details_ajax",
+    "game_full_details_ajax",
+    "games_batch_ajax",
+    "game_autocomplete",
+    "game_search_export",
+    "all_games_export",
     "graphs_by_gender",
     "genre_performance_report",
+    "dimension_stats_ajax",
+    "graphs_by_dimension",
+    "catalog_stats_ajax",
     "backup_db",
     "restore_db",
     "backup_management",
     "backup_help",
     "view_db_schema",
     "index_management",
+    "query_plan_history",
 ]
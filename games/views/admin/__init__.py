@@ -11,6 +11,7 @@ from games.views.admin.backup_views import (
 )
 from games.views.admin.schema_views import view_db_schema
 from games.views.admin.index_views import index_management
+from games.views.admin.plan_views import query_plan_history
 
 __all__ = [
     "backup_db",
@@ -19,11 +20,13 @@ __all__ = [
     "backup_help",
     "view_db_schema",
     "index_management",
+    "query_plan_history",
 ]
 
 from .backup_views import backup_db, restore_db, backup_management, backup_help
 from .schema_views import view_db_schema
 from .index_views import index_management
+from .plan_views import query_plan_history
 
 __all__ = [
     "backup_db",
@@ -32,4 +35,5 @@ __all__ = [
     "backup_help",
     "view_db_schema",
     "index_management",
+    "query_plan_history",
 ]
@@ -8,7 +8,12 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.decorators.http import require_http_methods
 
-from ...services.admin import IndexService, SchemaService, SecurityService
+from ...services.admin import (
+    IndexAdvisorService,
+    IndexService,
+    SchemaService,
+    SecurityService,
+)
 
 
 @require_http_methods(["GET", "POST"])
@@ -49,6 +54,20 @@ def index_management(request):
         if resultado:
             mensaje = resultado
 
+    # Recomendaciones del asesor a partir de las consultas registradas
+    recomendaciones = None
+    try:
+        recomendaciones = IndexAdvisorService.recommend()
+    except Exception as e:
+        messages.warning(request, f"No se pudieron calcular recomendaciones: {str(e)}")
+
+    # Plan de eliminación de índices sin uso o redundantes (todo el esquema)
+    plan_eliminacion = None
+    try:
+        plan_eliminacion = IndexService.get_drop_plan()
+    except Exception as e:
+        messages.warning(request, f"No se pudo analizar el uso de índices: {str(e)}")
+
     # Preparar contexto
     tablas_traducidas = [
         (
@@ -64,6 +83,8 @@ def index_management(request):
         "columnas": columnas,
         "indices": indices,
         "mensaje": mensaje,
+        "recomendaciones": recomendaciones,
+        "plan_eliminacion": plan_eliminacion,
     }
 
     return render(request, "index_management.html", context)
@@ -83,6 +104,12 @@ def _process_index_action(request, tabla_sel: str) -> str:
             return _handle_drop_all_indexes(tabla_sel)
         elif accion == "eliminar_directo":
             return _handle_drop_specific_index(request)
+        elif accion == "aplicar_recomendacion":
+            return _handle_apply_recommendation(request, tabla_sel)
+        elif accion == "capturar_uso":
+            return _handle_snapshot_index_usage()
+        elif accion == "eliminar_plan":
+            return _handle_drop_plan(request)
         else:
             return "Acción no válida"
 
@@ -109,6 +136,43 @@ def _handle_create_index(request, tabla_sel: str) -> str:
         return f"❌ {resultado['message']}"
 
 
+def _handle_apply_recommendation(request, tabla_sel: str) -> str:
+    """Crea el índice propuesto por el asesor"""
+    columna = request.POST.get("columna")
+    tipo = request.POST.get("tipo", "BTREE")
+
+    if not columna:
+        return "Debe seleccionar una columna"
+
+    resultado = IndexAdvisorService.apply(tabla_sel, columna, tipo)
+
+    if resultado["success"]:
+        return f"✅ {resultado['message']}"
+    else:
+        return f"❌ {resultado['message']}"
+
+
+def _handle_snapshot_index_usage() -> str:
+    """Guarda una captura del uso de los índices"""
+    capturados = IndexService.snapshot_index_usage()
+    return f"✅ Uso registrado para {capturados} índices"
+
+
+def _handle_drop_plan(request) -> str:
+    """Maneja eliminación de los índices seleccionados del plan"""
+    index_names = request.POST.getlist("drop_index")
+
+    if not index_names:
+        return "Debe seleccionar al menos un índice"
+
+    resultado = IndexService.drop_indexes(index_names)
+
+    if resultado["success"]:
+        return f"✅ {resultado['message']}"
+    else:
+        return f"❌ {resultado['message']}"
+
+
 def _handle_drop_all_indexes(tabla_sel: str) -> str:
     """Maneja eliminación de todos los índices"""
     resultado = IndexService.drop_all_table_indexes(tabla_sel)
@@ -0,0 +1,50 @@
+"""
+Vistas del historial de planes de consultas
+Principio: Single Responsibility - Solo muestra capturas y líneas base
+"""
+
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import redirect, render
+from django.views.decorators.http import require_http_methods
+
+from ...services.admin import PlanRegistryService
+
+
+@require_http_methods(["GET", "POST"])
+@login_required
+def query_plan_history(request):
+    """Historial de planes por consulta registrada, con captura manual"""
+    queries = PlanRegistryService.hot_queries()
+    selected = request.GET.get("query") or None
+    if selected not in queries:
+        selected = None
+
+    if request.method == "POST":
+        name = request.POST.get("query")
+        try:
+            results = PlanRegistryService.capture(
+                [name] if name else None,
+                set_baseline=request.POST.get("action") == "baseline",
+            )
+        except Exception as e:
+            messages.error(request, f"Error al capturar planes: {str(e)}")
+        else:
+            regressed = [result["name"] for result in results if result["regressions"]]
+            if regressed:
+                messages.warning(
+                    request, f"Regresiones detectadas en: {', '.join(regressed)}"
+                )
+            else:
+                messages.success(request, "Planes capturados sin regresiones")
+        return redirect("query_plan_history")
+
+    context = {
+        "queries": [
+            (name, description, PlanRegistryService.get_baseline(name))
+            for name, (description, _sql) in queries.items()
+        ],
+        "history": PlanRegistryService.get_history(selected),
+        "selected": selected,
+    }
+    return render(request, "query_plans.html", context)
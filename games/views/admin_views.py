@@ -6,6 +6,7 @@ from .admin import (
     backup_help,
     view_db_schema,
     index_management,
+    query_plan_history,
 )
 
 
@@ -4,5 +4,14 @@ Principio SOLID: Interface Segregation
 """
 
 from games.views.analytics.genre_views import graphs_by_gender, genre_performance_report
+from games.views.analytics.dimension_views import dimension_stats_ajax
+from games.views.analytics.breakdown_views import graphs_by_dimension
+from games.views.analytics.snapshot_views import catalog_stats_ajax
 
-__all__ = ["graphs_by_gender", "genre_performance_report"]
+__all__ = [
+    "graphs_by_gender",
+    "genre_performance_report",
+    "dimension_stats_ajax",
+    "graphs_by_dimension",
+    "catalog_stats_ajax",
+]
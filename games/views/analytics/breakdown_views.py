@@ -0,0 +1,59 @@
+"""
+Vistas de desgloses por dimensión (cantidad, precio, puntaje y tiempo de juego)
+Una sola consulta cacheada alimenta todos los gráficos de la página
+"""
+
+import json
+
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import render
+
+from ...config import BREAKDOWN_CONFIG
+from ...services.analytics import BreakdownService
+
+
+@login_required
+def graphs_by_dimension(request):
+    """Gráficos de una dimensión con filtros de top N y soporte mínimo"""
+    dimension = request.GET.get("dimension", "genre")
+    order_by = request.GET.get("order_by", "games")
+    top_n = _get_positive_int(request.GET.get("top_n"))
+    min_support = _get_positive_int(request.GET.get("min_support"))
+
+    error = None
+    try:
+        breakdown = BreakdownService.get_breakdown(
+            dimension, order_by, top_n, min_support
+        )
+    except ValueError as e:
+        error = str(e)
+        breakdown = BreakdownService.get_breakdown("genre")
+
+    rows = breakdown["rows"]
+    context = {
+        **breakdown,
+        "error": error,
+        "dimensions": [
+            (key, label) for key, (label, _sql) in BreakdownService.DIMENSIONS.items()
+        ],
+        "metrics": list(BreakdownService.METRICS.items()),
+        "max_top_n": BREAKDOWN_CONFIG["max_top_n"],
+        "charts": [
+            {
+                "id": f"chart_{metric}",
+                "label": label,
+                "data": json.dumps([row[metric] for row in rows]),
+            }
+            for metric, label in BreakdownService.METRICS.items()
+        ],
+        "labels": json.dumps([row["value"] for row in rows]),
+    }
+    return render(request, "graphs_by_dimension.html", context)
+
+
+def _get_positive_int(value):
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
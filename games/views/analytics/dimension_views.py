@@ -0,0 +1,29 @@
+"""
+Vistas de estadísticas por dimensión (género, categoría, desarrollador, etc.)
+Leen los contadores agregados en lugar de recorrer las tablas de dimensión
+"""
+
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+
+from ...services.analytics import CounterService
+
+
+@login_required
+def dimension_stats_ajax(request, dimension):
+    """Cantidad de juegos por valor de una dimensión (?limit=N)"""
+    try:
+        limit = int(request.GET.get("limit") or 0) or None
+    except ValueError:
+        return JsonResponse({"error": "El límite debe ser un número"}, status=400)
+
+    try:
+        counts = CounterService.get_dimension_counts(dimension, limit)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=404)
+
+    response = {"success": True, "dimension": dimension, "values": counts}
+    if dimension == "genre":
+        genre_stats = CounterService.get_genre_price_score_stats()
+        response["genre_stats"] = genre_stats[:limit] if limit else genre_stats
+    return JsonResponse(response)
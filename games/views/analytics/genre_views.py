@@ -67,6 +67,8 @@ def _handle_index_action(action: str) -> dict:
         return PerformanceService.create_genre_index()
     elif action == "drop":
         return PerformanceService.drop_genre_index()
+    elif action == "refresh":
+        return GenreAnalyticsService.refresh_genre_statistics()
     else:
         return {"success": False, "message": "Acción no válida"}
 
@@ -76,14 +78,9 @@ def _get_genre_analysis_context() -> dict:
     # Verificar índice
     index_exists = GenreAnalyticsService.check_genre_index_exists()
 
-    # Medir tiempo de consulta
+    # Medir tiempo de consulta (lectura de la vista materializada)
     start_time = time.time()
-
-    if index_exists:
-        genre_data = GenreAnalyticsService.get_genre_statistics_optimized()
-    else:
-        genre_data = GenreAnalyticsService.get_genre_statistics()
-
+    genre_data = GenreAnalyticsService.get_genre_statistics_materialized()
     query_time = time.time() - start_time
     genre_summary = GenreAnalyticsService.get_genre_summary(genre_data)
 
@@ -91,6 +88,7 @@ def _get_genre_analysis_context() -> dict:
         "labels": genre_data["labels"],
         "data": genre_data["data"],
         "index_exists": index_exists,
+        "refreshed_at": genre_data["refreshed_at"],
         "query_time": round(query_time * 1000, 2),  # En milisegundos
         **genre_summary,
     }
@@ -0,0 +1,58 @@
+"""
+Vistas de estadísticas del catálogo calculadas sobre el snapshot en memoria
+Histogramas, cuantiles, correlaciones y agrupaciones sin recorrer modelos
+"""
+
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+
+from ...services.analytics import SnapshotAnalyticsService
+
+
+@login_required
+def catalog_stats_ajax(request):
+    """Resumen o una estadística puntual (?stat=histogram|quantiles|correlation|group_by)"""
+    if not SnapshotAnalyticsService.is_available():
+        return JsonResponse({"error": "NumPy no está instalado"}, status=503)
+
+    stat = request.GET.get("stat")
+    try:
+        if not stat:
+            result = SnapshotAnalyticsService.get_summary()
+        elif stat == "histogram":
+            result = SnapshotAnalyticsService.histogram(
+                request.GET.get("column", "price"),
+                _get_int(request.GET.get("bins")),
+            )
+        elif stat == "quantiles":
+            result = SnapshotAnalyticsService.quantiles(
+                request.GET.get("column", "avg_playtime_forever")
+            )
+        elif stat == "correlation":
+            columns = request.GET.get("columns", "price,user_score").split(",")
+            result = SnapshotAnalyticsService.correlation(
+                [column.strip() for column in columns if column.strip()]
+            )
+        elif stat == "group_by":
+            bins = request.GET.get("bins")
+            result = SnapshotAnalyticsService.group_by(
+                request.GET.get("key", "release_year"),
+                request.GET.get("value", "user_score"),
+                request.GET.get("aggregation", "mean"),
+                [float(edge) for edge in bins.split(",")] if bins else None,
+            )
+        else:
+            return JsonResponse(
+                {"error": f"Estadística '{stat}' no soportada"}, status=400
+            )
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    return JsonResponse({"success": True, **result})
+
+
+def _get_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
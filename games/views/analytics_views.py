@@ -1,6 +1,9 @@
 
 try:
     from .analytics.genre_views import graphs_by_gender, genre_performance_report
+    from .analytics.dimension_views import dimension_stats_ajax
+    from .analytics.breakdown_views import graphs_by_dimension
+    from .analytics.snapshot_views import catalog_stats_ajax
 except ImportError:
     # Fallback temporal si hay problemas con la nueva estructura
     def graphs_by_gender(request):
@@ -13,4 +16,17 @@ except ImportError:
 
         return JsonResponse({"error": "Vista en mantenimiento"}, status=503)
 
+    def dimension_stats_ajax(request, dimension):
+        from django.http import JsonResponse
+
+        return JsonResponse({"error": "Vista en mantenimiento"}, status=503)
+
+    def graphs_by_dimension(request):
+        from django.http import HttpResponse
 
+        return HttpResponse("Vista en mantenimiento - Refactorización en progreso")
+
+    def catalog_stats_ajax(request):
+        from django.http import JsonResponse
+
+        return JsonResponse({"error": "Vista en mantenimiento"}, status=503)
@@ -6,6 +6,8 @@ from django.core.exceptions import ValidationError
 from ..handlers import FormHandler, GameFormProcessor, SearchHandler, GenreProcessor
 from ..forms import GameForm, AboutGameForm, GameSearchForm, GenreManagementForm
 from ..services import TransactionService, GameService, AboutGameService, GenreService
+from ..services.search import CountStrategyPaginator
+from ..config import PAGINATION_SIZE
 
 
 @login_required
@@ -67,12 +69,27 @@ def search_and_edit_game(request):
     def search_callback(form_data):
         field = form_data["search_field"]
         query = form_data["search_query"]
-        return GameService.search_games(field, query)
+        try:
+            return GameService.search_games(field, query)
+        except ValidationError as e:
+            messages.error(request, " ".join(e.messages))
+            return []
 
     search_form, games = SearchHandler.handle_search(
         request, GameSearchForm, search_callback
     )
 
+    paginator = CountStrategyPaginator(
+        games,
+        PAGINATION_SIZE,
+        cache_key_parts=(
+            "search_and_edit_game",
+            request.GET.get("search_field", ""),
+            request.GET.get("search_query", ""),
+        ),
+    )
+    games = paginator.get_page(request.GET.get("page"))
+
     return render(
         request,
         "game_management/search_game.html",
@@ -112,12 +129,20 @@ def edit_game(request, app_id):
                     }
                 )
 
+                # Solo se escriben los campos modificados; la versión enviada
+                # detecta si otro usuario editó el juego mientras tanto
+                game_data = {
+                    field: game_form.cleaned_data[field]
+                    for field in game_form.changed_data
+                }
+
                 # Actualizar juego completo
                 TransactionService.update_complete_game(
                     app_id,
-                    data["game_data"],
+                    game_data,
                     data["description_data"],
                     data["genres_list"],
+                    expected_version=request.POST.get("version") or None,
                 )
 
                 messages.success(
@@ -142,6 +167,7 @@ def edit_game(request, app_id):
         "game_management/edit_game.html",
         {
             "game": game,
+            "version": request.POST.get("version", game.version),
             "game_form": game_form,
             "description_form": description_form,
             "genre_form": genre_form,
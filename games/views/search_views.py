@@ -1,11 +1,33 @@
 
+import json
 from django.shortcuts import render
+from django.core.exceptions import ValidationError
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
-from django.http import JsonResponse
-
-from ..models import Games, Genres
-from ..config import SEARCH_FIELDS, PAGINATION_SIZE
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_http_methods
+
+from ..models import Games
+from ..config import (
+    SEARCH_FIELDS,
+    PAGINATION_SIZE,
+    AUTOCOMPLETE_CONFIG,
+    EXPORT_CONFIG,
+)
+from ..services import (
+    ExportService,
+    GameDetailService,
+    GameService,
+    GameCacheService,
+)
+from ..services.search import (
+    FuzzySearchService,
+    FullTextSearchService,
+    KeysetPaginationService,
+    CountStrategyPaginator,
+    SearchQueryCompiler,
+    AutocompleteService,
+    FacetService,
+)
 
 
 @login_required
@@ -25,13 +47,21 @@ def game_search(request):
         query = request.GET["query"]
 
         # Actualizar contexto con datos de búsqueda
-        context.update(
-            {
-                "selected_field": selected_field,
-                "query": query,
-                "results": _perform_game_search(selected_field, query),
-            }
-        )
+        context.update({"selected_field": selected_field, "query": query})
+        try:
+            context["results"] = _paginate_games(
+                _perform_game_search(selected_field, query),
+                request.GET.get("page"),
+                cache_key_parts=("game_search", selected_field, query),
+            )
+        except ValidationError as e:
+            context["error"] = " ".join(e.messages)
+
+        # Informar si los modos de búsqueda indexados cuentan con su índice
+        if selected_field == "name_fuzzy":
+            context["search_index"] = FuzzySearchService.get_index_status()
+        elif selected_field == "description":
+            context["search_index"] = FullTextSearchService.get_index_status()
 
     return render(request, "query.html", context)
 
@@ -45,27 +75,69 @@ def all_games(request):
     # Aplicar filtros pero solo cargar ID y nombre 
     games = _apply_filters_to_games_optimized(filters)
 
-    # Paginación con más elementos por página para listas simples
-    page_obj = _paginate_games(games, request.GET.get("page"), page_size=50)
+    # Paginación por cursor (costo constante por página) salvo que se pida
+    # un número de página explícito
+    keyset_page = None
+    if request.GET.get("page"):
+        page_obj = _paginate_games(
+            games,
+            request.GET.get("page"),
+            page_size=50,
+            cache_key_parts=("all_games", *sorted(filters.items())),
+        )
+    else:
+        keyset_page = KeysetPaginationService.paginate(
+            games, request.GET.get("cursor"), page_size=50
+        )
+        page_obj = keyset_page["object_list"]
 
-    # Solo obtener géneros únicos si se necesita filtrar
-    all_genres = (
-        Genres.objects.values("genre").distinct() if not filters["genre_filter"] else []
-    )
+    # Conteos por faceta en una sola consulta (cacheados para el catálogo completo)
+    facets = FacetService.get_facets(filters)
 
     context = {
         "games": page_obj,
-        "all_genres": all_genres,
+        "keyset_page": keyset_page,
+        "facets": facets,
         **filters,  
     }
 
     return render(request, "all.html", context)
 
 
+@login_required
+def game_search_export(request):
+    """Exporta en streaming todos los resultados de una búsqueda"""
+    field = request.GET.get("field")
+    query = request.GET.get("query")
+    if not field or not query:
+        return JsonResponse(
+            {"success": False, "error": "Debe indicar campo y término"}, status=400
+        )
+
+    try:
+        games = _perform_game_search(field, query)
+    except ValidationError as e:
+        return JsonResponse(
+            {"success": False, "error": " ".join(e.messages)}, status=400
+        )
+
+    return _export_response(request, games, "busqueda_juegos")
+
+
+@login_required
+def all_games_export(request):
+    """Exporta en streaming el catálogo con los filtros del listado"""
+    filters = _extract_filters(request)
+    games = FacetService.filter_queryset(Games.objects.all(), filters)
+    return _export_response(
+        request, games.order_by("name", "app_id"), "catalogo_juegos"
+    )
+
+
 def game_details_ajax(request, app_id):
     """Vista AJAX para obtener detalles de un juego específico"""
-    try:
-        game = Games.objects.get(app_id=app_id)
+    game = GameService.get_game(app_id)
+    if game:
         data = {
             "success": True,
             "game": {
@@ -81,26 +153,96 @@ def game_details_ajax(request, app_id):
                 "dlc_count": game.dlc_count or 0,
             },
         }
-    except Games.DoesNotExist:
+    else:
         data = {"success": False, "error": "Juego no encontrado"}
 
     return JsonResponse(data)
 
 
+def game_full_details_ajax(request, app_id):
+    """Vista AJAX con el documento completo del juego en una sola consulta"""
+    sections = GameDetailService.resolve_sections(
+        fields=_split_param(request.GET.get("fields")),
+        exclude=_split_param(request.GET.get("exclude")),
+    )
+
+    game = GameCacheService.get_or_load(
+        app_id,
+        f"document:{','.join(sections)}",
+        lambda: GameDetailService.get_game_document(app_id, sections),
+    )
+    if game is None:
+        return JsonResponse({"success": False, "error": "Juego no encontrado"})
+
+    return JsonResponse({"success": True, "game": game})
+
+
+@require_http_methods(["GET", "POST"])
+def games_batch_ajax(request):
+    """Vista AJAX para obtener muchos juegos por ID en una sola petición"""
+    if request.method == "POST" and request.content_type == "application/json":
+        try:
+            payload = json.loads(request.body)
+        except ValueError:
+            payload = None
+        if not isinstance(payload, dict):
+            return JsonResponse(
+                {"success": False, "error": "JSON inválido"}, status=400
+            )
+        app_ids = [str(app_id) for app_id in payload.get("app_ids") or []]
+        include = [str(name) for name in payload.get("include") or []]
+    else:
+        params = request.POST if request.method == "POST" else request.GET
+        app_ids = _split_param(params.get("ids"))
+        include = _split_param(params.get("include"))
+
+    try:
+        games = GameService.get_games_bulk(app_ids, include)
+    except ValidationError as e:
+        return JsonResponse(
+            {"success": False, "error": " ".join(e.messages)}, status=400
+        )
+
+    missing = [app_id for app_id in dict.fromkeys(app_ids) if app_id not in games]
+    return JsonResponse({"success": True, "games": games, "missing": missing})
+
+
+def game_autocomplete(request):
+    """Vista AJAX de autocompletado: juegos cuyo nombre comienza con el prefijo"""
+    try:
+        limit = int(request.GET.get("limit", AUTOCOMPLETE_CONFIG["limit"]))
+    except ValueError:
+        limit = AUTOCOMPLETE_CONFIG["limit"]
+
+    suggestions = AutocompleteService.suggest(request.GET.get("q", ""), limit)
+    return JsonResponse({"success": True, "results": suggestions})
+
+
 
 
 def _perform_game_search(field: str, query: str):
     #Realiza búsqueda de juegos por campo específico
-    filter_kwargs = {f"{field}__icontains": query}
-    return Games.objects.filter(**filter_kwargs)
+    if field == "name_fuzzy":
+        return FuzzySearchService.search_by_name(query)
+    if field == "description":
+        return FullTextSearchService.search_descriptions(query)
+
+    # Predicados tipados por campo para aprovechar los índices
+    if field == "advanced":
+        criteria = SearchQueryCompiler.parse_combined(query)
+    else:
+        criteria = {field: query}
+    return SearchQueryCompiler.search(criteria)
 
 
 def _extract_filters(request):
     #Extrae y normaliza filtros de la request
-    return {
-        "genre_filter": request.GET.get("genre_filter", ""),
-        "letter_filter": request.GET.get("letter_filter", "").upper(),
+    filters = {
+        param: request.GET.get(param, "").strip()
+        for param, _label in FacetService.FACETS.values()
     }
+    filters["letter_filter"] = request.GET.get("letter_filter", "").upper()
+    return filters
 
 
 def _apply_filters_to_games(filters):
@@ -118,20 +260,47 @@ def _apply_filters_to_games(filters):
 
 def _apply_filters_to_games_optimized(filters):
     games = Games.objects.only("app_id", "name")
+    games = FacetService.filter_queryset(games, filters)
+    return games.order_by("name", "app_id")
 
-    if filters["genre_filter"]:
-        games = games.filter(genres__genre=filters["genre_filter"])
 
-    if filters["letter_filter"]:
-        games = games.filter(name__istartswith=filters["letter_filter"])
+def _split_param(value):
+    #Convierte "a,b,c" en lista, ignorando vacíos
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
 
-    return games.order_by("name")
 
+def _export_response(request, games, basename: str):
+    #Arma la respuesta en streaming en el formato pedido, opcionalmente con gzip
+    export_format = request.GET.get("format", "csv")
+    if export_format not in EXPORT_CONFIG["formats"]:
+        return JsonResponse(
+            {"success": False, "error": "Formato de exportación no soportado"},
+            status=400,
+        )
 
-def _paginate_games(games, page_number, page_size=None):
-    #Aplica paginación a los juegos
+    content_type, extension = EXPORT_CONFIG["formats"][export_format]
+    if export_format == "csv":
+        stream = ExportService.stream_csv(games)
+    else:
+        stream = ExportService.stream_jsonl(games)
+
+    filename = f"{basename}.{extension}"
+    if request.GET.get("gzip") == "1":
+        stream = ExportService.gzip_stream(stream)
+        content_type = "application/gzip"
+        filename = f"{filename}.gz"
+
+    response = StreamingHttpResponse(stream, content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def _paginate_games(games, page_number, page_size=None, cache_key_parts=None):
+    #Aplica paginación a los juegos; el total lo resuelve la estrategia de conteo
     if page_size is None:
         page_size = PAGINATION_SIZE
 
-    paginator = Paginator(games, page_size)
+    paginator = CountStrategyPaginator(
+        games, page_size, cache_key_parts=cache_key_parts
+    )
     return paginator.get_page(page_number)